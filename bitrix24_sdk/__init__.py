@@ -2,7 +2,18 @@
 Bitrix24 Disk SDK - Python SDK for Bitrix24 Disk API
 """
 
-from .bitrix_http import BitrixClient
+from typing import TYPE_CHECKING
+
+from .utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .bitrix_http import BitrixClient, AsyncBitrixClient, BitrixClientPool
 
 __version__ = "0.1.0"
-__all__ = ["BitrixClient"]
+__all__ = ["BitrixClient", "AsyncBitrixClient", "BitrixClientPool"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "BitrixClient": ".bitrix_http.http_client",
+    "AsyncBitrixClient": ".bitrix_http.async_http_client",
+    "BitrixClientPool": ".bitrix_http.pool",
+})
@@ -1,4 +1,16 @@
-from .service import BaseService
-from .models import Methods, MethodsParams, Scope, ScopeParams
+from typing import TYPE_CHECKING
 
-__all__ = ["BaseService", "Methods", "MethodsParams", "Scope", "ScopeParams"]
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .service import BaseService
+    from .async_service import AsyncBaseService
+    from .models import Methods, MethodsParams, Scope, ScopeParams
+
+_EXPORTS = {
+    "BaseService": ".service", "AsyncBaseService": ".async_service",
+    "Methods": ".models", "MethodsParams": ".models", "Scope": ".models", "ScopeParams": ".models",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,48 @@
+from typing import Optional, TYPE_CHECKING
+
+from .models import Methods, MethodsParams, Scope, ScopeParams
+
+if TYPE_CHECKING:
+    from ..bitrix_http import AsyncBitrixHttpClient
+
+
+class AsyncBaseService:
+    """Служебные методы Bitrix (асинхронный вариант BaseService)."""
+
+    def __init__(self, http: "AsyncBitrixHttpClient") -> None:
+        self._http = http
+
+    async def methods(self, full: bool = None, scope: Optional[str] = None) -> Methods:
+        """
+        Получить список доступных методов API.
+
+        Args:
+            full: Возвращать полную информацию о методах
+            scope: Фильтр по scope
+
+        Returns:
+            Methods: Список доступных методов
+        """
+        params = MethodsParams(full=full, scope=scope)
+        return await self._http.call_pydantic(
+            method="methods",
+            params=params.to_bx_params(),
+            model=Methods,
+        )
+
+    async def scope(self, full: bool = None) -> Scope:
+        """
+        Получить информацию о scope авторизации.
+
+        Args:
+            full: Возвращать полную информацию
+
+        Returns:
+            Scope: Информация о scope
+        """
+        params = ScopeParams(full=full)
+        return await self._http.call_pydantic(
+            method="scope",
+            params=params.to_bx_params(),
+            model=Scope,
+        )
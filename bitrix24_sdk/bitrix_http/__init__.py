@@ -1,4 +1,50 @@
-from .client import BitrixHttpClient
-from .http_client import BitrixClient
+from typing import TYPE_CHECKING
 
-__all__ = ["BitrixHttpClient", "BitrixClient"]
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import BitrixHttpClient
+    from .http_client import BitrixClient
+    from .async_client import AsyncBitrixHttpClient
+    from .async_http_client import AsyncBitrixClient
+    from .pool import BitrixClientPool
+    from .scheduling import (
+        StrideScheduler, FlowStats, PriorityScheduler, AsyncPriorityScheduler, CallPriority, priority,
+        DeadlineExceeded, CallCancelled, DEFAULT_PRIORITY_WEIGHTS
+    )
+    from .batch import BitrixBatch, BatchCommand, BATCH_MAX_COMMANDS
+    from .rate_limit import RateLimiter, MemoryStateBackend, FileStateBackend
+    from .retry import RetryPolicy, DEFAULT_RETRY_METHODS
+    from .transport import HttpTransport, TransportStats
+    from .cache import ResponseCache, CacheStats, MemoryCacheBackend, SqliteCacheBackend
+    from .singleflight import SingleFlight, AsyncSingleFlight
+    from .decoder import JsonDecoder
+    from .body import BodyEncoder, RequestBody
+    from .instrumentation import CallEvent, CallHook, PrometheusHook, OpenTelemetryHook
+    from .errors import (
+        BitrixError, QueryLimitExceeded, OperationTimeLimit, ExpiredToken,
+        AccessDenied, NotFound, ServerError
+    )
+
+_EXPORTS = {
+    "BitrixHttpClient": ".client", "BitrixClient": ".http_client",
+    "AsyncBitrixHttpClient": ".async_client", "AsyncBitrixClient": ".async_http_client",
+    "BitrixClientPool": ".pool", "StrideScheduler": ".scheduling", "FlowStats": ".scheduling",
+    "PriorityScheduler": ".scheduling", "AsyncPriorityScheduler": ".scheduling", "CallPriority": ".scheduling",
+    "priority": ".scheduling", "DeadlineExceeded": ".scheduling", "CallCancelled": ".scheduling",
+    "DEFAULT_PRIORITY_WEIGHTS": ".scheduling",
+    "BitrixBatch": ".batch", "BatchCommand": ".batch", "BATCH_MAX_COMMANDS": ".batch",
+    "RateLimiter": ".rate_limit", "MemoryStateBackend": ".rate_limit", "FileStateBackend": ".rate_limit",
+    "RetryPolicy": ".retry", "DEFAULT_RETRY_METHODS": ".retry",
+    "HttpTransport": ".transport", "TransportStats": ".transport",
+    "ResponseCache": ".cache", "CacheStats": ".cache", "MemoryCacheBackend": ".cache", "SqliteCacheBackend": ".cache",
+    "SingleFlight": ".singleflight", "AsyncSingleFlight": ".singleflight",
+    "JsonDecoder": ".decoder", "BodyEncoder": ".body", "RequestBody": ".body",
+    "CallEvent": ".instrumentation", "CallHook": ".instrumentation",
+    "PrometheusHook": ".instrumentation", "OpenTelemetryHook": ".instrumentation",
+    "BitrixError": ".errors", "QueryLimitExceeded": ".errors", "OperationTimeLimit": ".errors",
+    "ExpiredToken": ".errors", "AccessDenied": ".errors", "NotFound": ".errors", "ServerError": ".errors",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
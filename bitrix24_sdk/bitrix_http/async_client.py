@@ -0,0 +1,299 @@
+import asyncio
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Type, TypeVar, TYPE_CHECKING
+
+from pydantic import BaseModel
+
+from ..config.config import BitrixSettings, load_bitrix_settings
+from ..utils.encoder import encode_params
+from ..utils.response import ResponseMode, build_response
+from .client import (_account_response, _account_transfer, _direct, _raise_for_error, _read_json,
+                     _rewind, _validate_model)
+from .instrumentation import CallEvent, HookLike, as_hooks, instrumented
+from .rate_limit import RateLimiter
+from .cache import ResponseCache
+from .body import BodyEncoder
+from .decoder import JsonDecoder
+from .retry import RetryPolicy
+from .scheduling import AsyncPriorityScheduler
+from .singleflight import AsyncSingleFlight
+
+if TYPE_CHECKING:
+    import httpx
+
+T = TypeVar("T")
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError(
+            "Для асинхронного клиента нужен пакет httpx: pip install bitrix24-sdk[async]"
+        ) from e
+    return httpx
+
+
+class AsyncBitrixHttpClient:
+    """
+    Асинхронный низкоуровневый HTTP-клиент для Bitrix24.
+
+    Использует пул соединений httpx и ограничивает количество одновременных
+    запросов, чтобы один event loop мог держать в работе сотни вызовов.
+    """
+
+    def __init__(self, token: str, user_id: int | str, settings: BitrixSettings | None = None,
+                 client: Optional["httpx.AsyncClient"] = None, max_concurrency: Optional[int] = None,
+                 rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+                 cache: Optional[ResponseCache] = None,
+                 single_flight: Optional[AsyncSingleFlight] = None,
+                 decoder: Optional[JsonDecoder] = None,
+                 hooks: Optional[Sequence[HookLike]] = None,
+                 body_encoder: Optional[BodyEncoder] = None,
+                 priority_scheduler: Optional[AsyncPriorityScheduler] = None) -> None:
+        """
+        Инициализация асинхронного HTTP-клиента.
+
+        Args:
+            token: Токен авторизации Bitrix24
+            user_id: ID пользователя
+            settings: Настройки подключения
+            client: Готовый httpx.AsyncClient (опционально)
+            max_concurrency: Максимум одновременных запросов (по умолчанию из настроек)
+            rate_limiter: Ограничитель частоты запросов (по умолчанию из настроек)
+            retry_policy: Политика повторов (по умолчанию из настроек)
+            cache: Кэш ответов методов чтения (по умолчанию из настроек, выключен)
+            single_flight: Объединение одинаковых одновременных вызовов (по умолчанию из настроек)
+            decoder: Декодер JSON ответов (по умолчанию из настроек)
+            hooks: Обработчики событий вызовов (CallHook или функции от CallEvent)
+            body_encoder: Кодировщик тела запросов (по умолчанию из настроек)
+            priority_scheduler: Планировщик классов приоритета (по умолчанию из настроек, выключен)
+        """
+        httpx = _import_httpx()
+
+        self.settings = settings or load_bitrix_settings()
+        self._token = token
+        self._user_id = str(user_id)
+        self._timeout = httpx.Timeout(
+            self.settings.READ_TIMEOUT or self.settings.TIMEOUT,
+            connect=self.settings.CONNECT_TIMEOUT or self.settings.TIMEOUT,
+        )
+        self._max_concurrency = max_concurrency or self.settings.MAX_CONCURRENCY
+
+        base = self.settings.BASE_URL.rstrip("/")
+        self._base_url = f"{base}/{self._user_id}/{self._token}/"
+
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            timeout=self._timeout,
+            limits=httpx.Limits(
+                max_connections=self._max_concurrency,
+                max_keepalive_connections=self.settings.POOL_MAXSIZE if self.settings.KEEP_ALIVE else 0,
+            ),
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.rate_limiter = rate_limiter or RateLimiter.from_settings(self.settings)
+        self.retry_policy = retry_policy or RetryPolicy.from_settings(self.settings)
+        self.cache = cache or ResponseCache.from_settings(self.settings)
+        self.single_flight = single_flight or AsyncSingleFlight.from_settings(self.settings)
+        self.decoder = decoder or JsonDecoder.from_settings(self.settings)
+        self.hooks = as_hooks(hooks)
+        self.body_encoder = body_encoder or BodyEncoder.from_settings(self.settings)
+        self.priority_scheduler = priority_scheduler or AsyncPriorityScheduler.from_settings(self.settings)
+
+    def add_hook(self, hook: HookLike) -> None:
+        """
+        Добавить обработчик событий вызовов call и call_pydantic.
+
+        Args:
+            hook: CallHook (PrometheusHook, OpenTelemetryHook и др.) или функция от CallEvent
+        """
+        self.hooks.extend(as_hooks([hook]))
+
+    @property
+    def max_concurrency(self) -> int:
+        """Максимум одновременных запросов."""
+        return self._max_concurrency
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Семафор создаётся лениво, чтобы привязаться к работающему event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """
+        Выполнить произвольный HTTP-запрос через общий пул соединений.
+
+        Args:
+            method: HTTP-метод
+            url: Абсолютный URL (например, uploadUrl)
+            **kwargs: Аргументы httpx.AsyncClient.request
+
+        Returns:
+            httpx.Response: Ответ сервера
+        """
+        kwargs.setdefault("timeout", self._timeout)
+        async with self._get_semaphore():
+            return await self._client.request(method, url, **kwargs)
+
+    async def call(self, method: str, params: Optional[Dict[str, Any]] = None,
+                   files: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Выполнить вызов метода Bitrix24 API.
+
+        Args:
+            method: Название метода API
+            params: Параметры запроса
+            files: Файлы для загрузки
+
+        Returns:
+            Ответ от API в виде словаря
+
+        Raises:
+            BitrixError: При ошибке в ответе Bitrix24 (QueryLimitExceeded, ExpiredToken, NotFound, ServerError и др.)
+        """
+        with instrumented(self.hooks, method) as event:
+            return await self._call(method, params, files, self._call_once, event)
+
+    async def _call(self, method: str, params: Optional[Dict[str, Any]], files: Optional[Dict[str, Any]],
+                    once: Callable[[str, Optional[Dict[str, Any]], Optional[Dict[str, Any]], CallEvent],
+                                   Awaitable[T]],
+                    event: CallEvent) -> T:
+        """Выполнить попытку вызова once с повторами по политике и сбросом кэша после успеха."""
+        attempt = 0
+        while True:
+            attempt += 1
+            event.attempts = attempt
+            try:
+                data = await once(method, params, files, event)
+            except Exception as e:
+                if self.retry_policy is None or not self.retry_policy.should_retry(method, e, attempt):
+                    raise
+                delay = self.retry_policy.delay(attempt, e)
+                await asyncio.sleep(delay)
+                event.retry_wait += delay
+                _rewind(files)
+                continue
+            if self.cache is not None:
+                self.cache.invalidate_for(method, params)
+            return data
+
+    async def _call_once(self, method: str, params: Optional[Dict[str, Any]],
+                         files: Optional[Dict[str, Any]], event: CallEvent) -> Any:
+        return self._handle(method, await self._send(method, params, files, event), event)
+
+    async def _call_once_model(self, model: Type[BaseModel], method: str, params: Optional[Dict[str, Any]],
+                               files: Optional[Dict[str, Any]], event: CallEvent) -> BaseModel:
+        """Попытка вызова с валидацией модели прямо из тела ответа."""
+        resp = await self._send(method, params, files, event)
+        return _validate_model(model, method, resp, event, self._handle, self.rate_limiter)
+
+    async def _send(self, method: str, params: Optional[Dict[str, Any]],
+                    files: Optional[Dict[str, Any]], event: CallEvent) -> "httpx.Response":
+        if self.priority_scheduler is None:
+            return await self._send_now(method, params, files, event)
+        # Слот класса занимается до ограничителя: иначе массовые вызовы резервируют бюджет портала вперёд
+        async with self.priority_scheduler.slot(method) as waited:
+            event.queue += waited
+            return await self._send_now(method, params, files, event)
+
+    async def _send_now(self, method: str, params: Optional[Dict[str, Any]],
+                        files: Optional[Dict[str, Any]], event: CallEvent) -> "httpx.Response":
+        url = f"{self._base_url}{method}.json"
+
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve(method)
+            if delay > 0:
+                await asyncio.sleep(delay)
+                event.rate_limit += delay
+
+        # Время обмена считается после получения слота, без ожидания в очереди семафора
+        body = None if files else self.body_encoder.encode(params or {})
+        async with self._get_semaphore():
+            started = time.perf_counter()
+            if body is None:
+                resp = await self._client.request("POST", url, data=encode_params(params or {}), files=files,
+                                                  headers=self.body_encoder.accept_headers, timeout=self._timeout)
+            else:
+                resp = await self._client.request("POST", url, content=body.content, headers=body.headers,
+                                                  timeout=self._timeout)
+        _account_transfer(event, resp, started, body)
+        return resp
+
+    def _handle(self, method: str, resp: "httpx.Response", event: CallEvent) -> Any:
+        """Разобрать ответ, учесть его в ограничителе и поднять ошибку Bitrix, если она есть."""
+        started = time.perf_counter()
+        data = _read_json(resp, self.decoder)
+        event.decode += time.perf_counter() - started
+        if isinstance(data, dict) and isinstance(data.get("time"), dict):
+            event.server_time = data["time"]
+        if self.rate_limiter is not None and isinstance(data, dict):
+            _account_response(self.rate_limiter, method, resp, data)
+
+        _raise_for_error(resp, data, method)
+        return data
+
+    async def call_pydantic(self, method: str, params: Optional[Dict[str, Any]], model: Type[BaseModel],
+                            files: Optional[Dict[str, Any]] = None, mode: Optional[ResponseMode] = "model",
+                            fields: Optional[Sequence[str]] = None) -> BaseModel:
+        """
+        Вызвать метод и сразу получить Pydantic-модель на основе result.
+
+        Если у клиента включён кэш, ответы кэшируемых методов берутся из него.
+        Одинаковые одновременные вызовы методов из single_flight выполняются
+        одним запросом, и все вызывающие получают одну и ту же модель.
+        Режимы raw и lazy и проекция fields пропускают полную валидацию строк
+        списочных ответов (см. build_response).
+
+        Args:
+            method: Название метода API
+            params: Параметры запроса
+            model: Pydantic модель для валидации
+            files: Файлы для загрузки
+            mode: Режим разбора строк списка: model, raw или lazy (None — RESPONSE_MODE клиента)
+            fields: Поля строк, которые нужно оставить
+
+        Returns:
+            Валидированная Pydantic модель
+        """
+        if mode is None:
+            mode = self.settings.RESPONSE_MODE
+        with instrumented(self.hooks, method, model.__name__) as event:
+            if self.single_flight is not None and not files and self.single_flight.applies(method):
+                key = self.single_flight.key(method, params, model, mode, fields)
+                event.coalesced = True
+                return await self.single_flight.do(key, partial(self._call_pydantic, method, params, model, None,
+                                                                mode, fields, event))
+            return await self._call_pydantic(method, params, model, files, mode, fields, event)
+
+    async def _call_pydantic(self, method: str, params: Optional[Dict[str, Any]], model: Type[BaseModel],
+                             files: Optional[Dict[str, Any]], mode: ResponseMode, fields: Optional[Sequence[str]],
+                             event: CallEvent) -> BaseModel:
+        event.coalesced = False
+        if _direct(self.settings, mode, fields) and (self.cache is None or not self.cache.ttl(method)):
+            return await self._call(method, params, files, partial(self._call_once_model, model), event)
+        raw_result = None
+        if self.cache is not None and not files:
+            raw_result = self.cache.get(method, params)
+            event.cached = raw_result is not None
+        if raw_result is None:
+            raw_result = await self._call(method, params, files, self._call_once, event)
+            if self.cache is not None and not files:
+                self.cache.set(method, params, raw_result)
+        started = time.perf_counter()
+        response = build_response(model, raw_result, mode, fields)
+        event.validate += time.perf_counter() - started
+        return response
+
+    async def aclose(self) -> None:
+        """Закрыть пул соединений, если он был создан клиентом."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncBitrixHttpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
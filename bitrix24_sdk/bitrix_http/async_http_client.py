@@ -0,0 +1,108 @@
+from functools import cached_property
+from typing import Optional, Sequence, TYPE_CHECKING
+
+from ..config.config import BitrixSettings, load_bitrix_settings
+from .async_client import AsyncBitrixHttpClient
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .cache import ResponseCache
+from .body import BodyEncoder
+from .decoder import JsonDecoder
+from .instrumentation import HookLike
+from .scheduling import AsyncPriorityScheduler
+from .singleflight import AsyncSingleFlight
+
+if TYPE_CHECKING:
+    import httpx
+    from ..base.async_service import AsyncBaseService
+    from ..disk.async_service import AsyncDiskService
+    from ..crm.async_service import AsyncCrmService
+
+
+class AsyncBitrixClient:
+    """
+    Асинхронный клиент для работы с Bitrix24 API.
+
+    Повторяет интерфейс BitrixClient, но все методы сервисов являются корутинами.
+
+    Attributes:
+        base: Асинхронный сервис базовых методов API
+        disk: Асинхронный сервис Disk API
+        crm: Асинхронный сервис CRM API
+        http: Асинхронный HTTP клиент для выполнения запросов
+
+    Example:
+        >>> async with AsyncBitrixClient(token="your_token", user_id=123) as client:
+        ...     files = await asyncio.gather(*(client.disk.get_file(i) for i in ids))
+    """
+
+    def __init__(self, token: str, user_id: int | str, settings: BitrixSettings | None = None,
+                 client: Optional["httpx.AsyncClient"] = None, max_concurrency: Optional[int] = None,
+                 rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+                 cache: Optional[ResponseCache] = None, single_flight: Optional[AsyncSingleFlight] = None,
+                 decoder: Optional[JsonDecoder] = None,
+                 hooks: Optional[Sequence[HookLike]] = None,
+                 body_encoder: Optional[BodyEncoder] = None,
+                 priority_scheduler: Optional[AsyncPriorityScheduler] = None) -> None:
+        """
+        Инициализация асинхронного клиента Bitrix24.
+
+        Args:
+            token: Токен авторизации Bitrix24
+            user_id: ID пользователя
+            settings: Настройки подключения (опционально)
+            client: Готовый httpx.AsyncClient (опционально)
+            max_concurrency: Максимум одновременных запросов (опционально)
+            rate_limiter: Ограничитель частоты запросов, общий для нескольких клиентов (опционально)
+            retry_policy: Политика повторов (опционально)
+            cache: Кэш ответов методов чтения (опционально)
+            single_flight: Объединение одинаковых одновременных вызовов (опционально)
+            decoder: Декодер JSON ответов (опционально)
+            hooks: Обработчики событий вызовов, например PrometheusHook или OpenTelemetryHook (опционально)
+            body_encoder: Кодировщик тела запросов: JSON и gzip (опционально)
+            priority_scheduler: Планировщик классов приоритета: interactive, normal, bulk (опционально)
+        """
+        self.settings = settings or load_bitrix_settings()
+        self.http = AsyncBitrixHttpClient(
+            token=token,
+            user_id=user_id,
+            settings=self.settings,
+            client=client,
+            max_concurrency=max_concurrency,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            cache=cache,
+            single_flight=single_flight,
+            decoder=decoder,
+            hooks=hooks,
+            body_encoder=body_encoder,
+            priority_scheduler=priority_scheduler,
+        )
+
+    @cached_property
+    def base(self) -> "AsyncBaseService":
+        """Асинхронный сервис базовых методов API (создаётся при первом обращении)."""
+        from ..base.async_service import AsyncBaseService
+        return AsyncBaseService(self.http)
+
+    @cached_property
+    def disk(self) -> "AsyncDiskService":
+        """Асинхронный сервис Disk API (создаётся при первом обращении)."""
+        from ..disk.async_service import AsyncDiskService
+        return AsyncDiskService(self.http)
+
+    @cached_property
+    def crm(self) -> "AsyncCrmService":
+        """Асинхронный сервис CRM API (создаётся при первом обращении)."""
+        from ..crm.async_service import AsyncCrmService
+        return AsyncCrmService(self.http)
+
+    async def aclose(self) -> None:
+        """Закрыть HTTP-соединения клиента."""
+        await self.http.aclose()
+
+    async def __aenter__(self) -> "AsyncBitrixClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
@@ -0,0 +1,368 @@
+import re
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Sequence, Set, Type, TYPE_CHECKING
+
+from pydantic import BaseModel
+
+from ..utils.query import build_query
+from ..utils.response import ResponseMode, build_response
+from .errors import BitrixError, error_from_response
+
+if TYPE_CHECKING:
+    from ..base.service import BaseService
+    from ..crm.service import CrmService
+    from ..disk.service import DiskService
+    from .client import BitrixHttpClient
+
+
+BATCH_MAX_COMMANDS = 50
+"""Максимальное количество команд в одном вызове метода batch."""
+
+_REF_RE = re.compile(r"\$result\[([^\]]+)\]((?:\[[^\]]*\])*)")
+_PATH_RE = re.compile(r"\[([^\]]*)\]")
+
+
+class BatchCommand:
+    """
+    Отложенный вызов метода в составе пакетного запроса.
+
+    Attributes:
+        name: Имя команды внутри пакета
+        method: Название метода API
+        params: Параметры запроса
+        model: Pydantic модель для валидации ответа (None — вернуть словарь)
+        mode: Режим разбора строк списочного ответа
+        fields: Поля строк, которые нужно оставить
+        raw: Сырой ответ команды после выполнения пакета
+        error: Ошибка выполнения команды, если она была
+    """
+
+    def __init__(self, name: str, method: str, params: Optional[Dict[str, Any]],
+                 model: Optional[Type[BaseModel]], mode: ResponseMode = "model",
+                 fields: Optional[Sequence[str]] = None) -> None:
+        self.name = name
+        self.method = method
+        self.params = params or {}
+        self.model = model
+        self.mode = mode
+        self.fields = fields
+        self.raw: Optional[Dict[str, Any]] = None
+        self.error: Optional[Exception] = None
+        self._value: Any = None
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        """Команда выполнена (успешно или с ошибкой)."""
+        return self._done
+
+    def ref(self, *path: Any) -> str:
+        """
+        Получить ссылку на результат команды для подстановки в другие команды пакета.
+
+        Args:
+            path: Путь внутри result команды (ключи и индексы)
+
+        Returns:
+            Строка вида "$result[cmd0][ID]"
+
+        Example:
+            >>> folder = batch.disk.add_subfolder(123, {"NAME": "Reports"})
+            >>> batch.disk.get_children(folder.ref("ID"))
+        """
+        return f"$result[{self.name}]" + "".join(f"[{p}]" for p in path)
+
+    def result(self) -> Any:
+        """
+        Получить результат команды.
+
+        Returns:
+            Валидированная Pydantic модель или словарь ответа
+
+        Raises:
+            RuntimeError: Если пакет ещё не выполнен или команда завершилась ошибкой
+        """
+        if not self._done:
+            raise RuntimeError(f"Команда {self.name} ({self.method}) ещё не выполнена")
+        if self.error is not None:
+            raise self.error
+        return self._value
+
+    def _resolve(self, payload: Dict[str, Any]) -> None:
+        self.raw = payload
+        try:
+            if self.model is not None:
+                self._value = build_response(self.model, payload, self.mode, self.fields)
+            else:
+                self._value = payload
+        except Exception as e:
+            self.error = e
+        self._done = True
+
+    def _fail(self, error: Exception) -> None:
+        self.error = error
+        self._done = True
+
+    def __repr__(self) -> str:
+        state = "error" if self.error is not None else ("done" if self._done else "pending")
+        return f"BatchCommand(name={self.name!r}, method={self.method!r}, state={state})"
+
+
+class _BatchRecorder:
+    """Заменяет HTTP-клиент в сервисах и складывает вызовы в пакет вместо отправки."""
+
+    def __init__(self, batch: "BitrixBatch") -> None:
+        self._batch = batch
+
+    def call(self, method: str, params: Optional[Dict[str, Any]] = None,
+             files: Optional[Dict[str, Any]] = None) -> BatchCommand:
+        if files:
+            raise ValueError(f"Метод {method} с файлами нельзя выполнить в пакете")
+        return self._batch.add(method, params)
+
+    def call_pydantic(self, method: str, params: Optional[Dict[str, Any]], model: Type[BaseModel],
+                      files: Optional[Dict[str, Any]] = None, mode: Optional[ResponseMode] = "model",
+                      fields: Optional[Sequence[str]] = None) -> BatchCommand:
+        if files:
+            raise ValueError(f"Метод {method} с файлами нельзя выполнить в пакете")
+        if mode is None:
+            mode = self._batch._http.settings.RESPONSE_MODE
+        return self._batch.add(method, params, model, mode=mode, fields=fields)
+
+
+class BitrixBatch:
+    """
+    Пакетное выполнение вызовов через метод batch.
+
+    Вызовы сервисов, сделанные через атрибуты пакета, не отправляются сразу,
+    а возвращают BatchCommand. При выполнении команды упаковываются в запросы
+    batch по 50 штук, а ответы раскладываются обратно в те же Pydantic модели,
+    что возвращают обычные вызовы.
+
+    Attributes:
+        base: Сервис базовых методов, записывающий вызовы в пакет
+        disk: Сервис Disk API, записывающий вызовы в пакет
+        crm: Сервис CRM API, записывающий вызовы в пакет
+
+    Example:
+        >>> with client.batch() as batch:
+        ...     files = [batch.disk.get_file(file_id) for file_id in ids]
+        ...     types = batch.crm.type_list()
+        >>> for cmd in files:
+        ...     if cmd.error is None:
+        ...         print(cmd.result().result.name)
+    """
+
+    def __init__(self, http: "BitrixHttpClient", halt: bool = False,
+                 chunk_size: int = BATCH_MAX_COMMANDS) -> None:
+        """
+        Инициализация пакета.
+
+        Args:
+            http: HTTP клиент для выполнения запросов
+            halt: Прекратить выполнение пакета при первой ошибке
+            chunk_size: Количество команд в одном запросе batch (не более 50)
+        """
+        if not 1 <= chunk_size <= BATCH_MAX_COMMANDS:
+            raise ValueError(f"chunk_size должен быть от 1 до {BATCH_MAX_COMMANDS}")
+        self._http = http
+        self._halt = halt
+        self._chunk_size = chunk_size
+        self._commands: List[BatchCommand] = []
+        self._by_name: Dict[str, BatchCommand] = {}
+        self._executed = False
+        self._recorder = _BatchRecorder(self)
+
+    @cached_property
+    def base(self) -> "BaseService":
+        """Базовые методы API, вызовы которых добавляются в пакет."""
+        from ..base.service import BaseService
+        return BaseService(self._recorder)  # type: ignore[arg-type]
+
+    @cached_property
+    def disk(self) -> "DiskService":
+        """Методы Disk API, вызовы которых добавляются в пакет."""
+        from ..disk.service import DiskService
+        return DiskService(self._recorder)  # type: ignore[arg-type]
+
+    @cached_property
+    def crm(self) -> "CrmService":
+        """Методы CRM API, вызовы которых добавляются в пакет."""
+        from ..crm.service import CrmService
+        return CrmService(self._recorder)  # type: ignore[arg-type]
+
+    @property
+    def commands(self) -> List[BatchCommand]:
+        """Команды пакета в порядке добавления."""
+        return list(self._commands)
+
+    def add(self, method: str, params: Optional[Dict[str, Any]] = None,
+            model: Optional[Type[BaseModel]] = None, name: Optional[str] = None,
+            mode: ResponseMode = "model", fields: Optional[Sequence[str]] = None) -> BatchCommand:
+        """
+        Добавить произвольный вызов в пакет.
+
+        Args:
+            method: Название метода API
+            params: Параметры запроса, значения могут содержать ссылки $result[...]
+            model: Pydantic модель для валидации ответа
+            name: Имя команды (по умолчанию cmdN)
+            mode: Режим разбора строк списочного ответа
+            fields: Поля строк, которые нужно оставить
+
+        Returns:
+            BatchCommand: Отложенный результат вызова
+        """
+        if self._executed:
+            raise RuntimeError("Пакет уже выполнен")
+        name = name or f"cmd{len(self._commands)}"
+        if name in self._by_name:
+            raise ValueError(f"Команда с именем {name} уже есть в пакете")
+        command = BatchCommand(name=name, method=method, params=params, model=model, mode=mode, fields=fields)
+        self._commands.append(command)
+        self._by_name[name] = command
+        return command
+
+    def execute(self) -> List[BatchCommand]:
+        """
+        Выполнить все команды пакета.
+
+        Returns:
+            Список команд с заполненными результатами или ошибками
+        """
+        if self._executed:
+            return self.commands
+        self._executed = True
+
+        halted = False
+        for offset in range(0, len(self._commands), self._chunk_size):
+            chunk = self._commands[offset:offset + self._chunk_size]
+            if halted:
+                for command in chunk:
+                    command._fail(RuntimeError(f"Команда {command.name} не выполнена: пакет остановлен"))
+                continue
+            self._execute_chunk(chunk)
+            halted = self._halt and any(command.error is not None for command in chunk)
+        return self.commands
+
+    def _execute_chunk(self, chunk: List[BatchCommand]) -> None:
+        names = {command.name for command in chunk}
+        cmd_params: Dict[str, Any] = {"halt": 1 if self._halt else 0}
+        sent: List[BatchCommand] = []
+        for command in chunk:
+            # Ошибка ссылки завершает только эту команду и зависящие от неё команды этой же части
+            failed = next((name for name in _references(command.params) & names
+                           if self._by_name[name].error is not None), None)
+            if failed is not None:
+                command._fail(ValueError(f"Ссылка на команду {failed}, завершившуюся ошибкой"))
+                continue
+            try:
+                params = self._substitute(command.params, names)
+            except ValueError as e:
+                command._fail(e)
+                continue
+            cmd_params[f"cmd[{command.name}]"] = f"{command.method}?{build_query(params)}"
+            sent.append(command)
+        if not sent:
+            return
+        chunk = sent
+
+        response = self._http.call(method="batch", params=cmd_params)
+        block = response.get("result") or {}
+
+        results = _as_dict(block.get("result"))
+        errors = _as_dict(block.get("result_error"))
+        totals = _as_dict(block.get("result_total"))
+        nexts = _as_dict(block.get("result_next"))
+        times = _as_dict(block.get("result_time"))
+
+        limiter = getattr(self._http, "rate_limiter", None)
+        if limiter is not None:
+            for command in chunk:
+                limiter.record(command.method, times.get(command.name))
+
+        for command in chunk:
+            name = command.name
+            if name in errors:
+                error = errors[name]
+                if isinstance(error, dict):
+                    command._fail(error_from_response(error, method=command.method))
+                else:
+                    command._fail(BitrixError(f"Bitrix error: {error}", method=command.method))
+                continue
+            if name not in results and self._halt and errors:
+                command._fail(RuntimeError(f"Команда {name} не выполнена: пакет остановлен"))
+                continue
+            payload: Dict[str, Any] = {"result": results.get(name)}
+            if name in totals:
+                payload["total"] = totals[name]
+            if name in nexts:
+                payload["next"] = nexts[name]
+            if name in times:
+                payload["time"] = times[name]
+            command._resolve(payload)
+
+    def _substitute(self, value: Any, chunk_names: set) -> Any:
+        """Подставить значения ссылок на команды из уже выполненных частей пакета."""
+        if isinstance(value, dict):
+            return {k: self._substitute(v, chunk_names) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._substitute(v, chunk_names) for v in value]
+        if not isinstance(value, str) or "$result[" not in value:
+            return value
+
+        full = _REF_RE.fullmatch(value)
+        if full is not None and full.group(1) not in chunk_names:
+            return self._lookup(full.group(1), full.group(2))
+
+        def replace(match: "re.Match[str]") -> str:
+            if match.group(1) in chunk_names:
+                return match.group(0)
+            return str(self._lookup(match.group(1), match.group(2)))
+
+        return _REF_RE.sub(replace, value)
+
+    def _lookup(self, name: str, path: str) -> Any:
+        command = self._by_name.get(name)
+        if command is None:
+            raise ValueError(f"Ссылка на неизвестную команду пакета: {name}")
+        if not command.done:
+            raise ValueError(f"Ссылка на команду {name}, которая выполняется позже")
+        if command.error is not None or command.raw is None:
+            raise ValueError(f"Ссылка на команду {name}, завершившуюся ошибкой")
+
+        value: Any = command.raw.get("result")
+        try:
+            for key in _PATH_RE.findall(path):
+                if isinstance(value, list):
+                    value = value[int(key)]
+                elif isinstance(value, dict):
+                    value = value[key]
+                else:
+                    raise LookupError(key)
+        except (LookupError, ValueError):
+            raise ValueError(f"Не удалось разрешить ссылку $result[{name}]{path}") from None
+        return value
+
+    def __enter__(self) -> "BitrixBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.execute()
+
+
+def _references(value: Any) -> Set[str]:
+    """Имена команд, на которые ссылаются параметры."""
+    if isinstance(value, dict):
+        return {name for item in value.values() for name in _references(item)}
+    if isinstance(value, (list, tuple)):
+        return {name for item in value for name in _references(item)}
+    if isinstance(value, str) and "$result[" in value:
+        return {match.group(1) for match in _REF_RE.finditer(value)}
+    return set()
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    """Bitrix возвращает пустой ассоциативный массив как []."""
+    return value if isinstance(value, dict) else {}
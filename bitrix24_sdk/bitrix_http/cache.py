@@ -0,0 +1,296 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Protocol, Tuple
+
+from pydantic import BaseModel, Field
+
+from ..config.config import BitrixSettings, DEFAULT_RETRY_METHODS
+from .body import _json_dumps
+from .decoder import JsonDecoder
+
+
+class CacheStats(BaseModel):
+    """Счётчики кэша ответов."""
+    hits: int = Field(0, description="Ответов выдано из кэша")
+    misses: int = Field(0, description="Кэшируемых вызовов, ушедших на портал")
+    evictions: int = Field(0, description="Записей вытеснено по размеру кэша")
+    invalidations: int = Field(0, description="Записей сброшено после изменяющих вызовов")
+
+    @property
+    def hit_ratio(self) -> float:
+        """Доля кэшируемых вызовов, обслуженных из кэша."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CacheBackend(Protocol):
+    """Хранилище записей кэша с вытеснением давно не использованных записей (LRU)."""
+
+    def get(self, key: str, now: float) -> Optional[Any]:
+        """Получить неустаревшее значение или None."""
+        ...
+
+    def set(self, key: str, method: str, value: Any, expires_at: float) -> int:
+        """Сохранить значение; вернуть количество вытесненных записей."""
+        ...
+
+    def invalidate(self, match: Callable[[str], bool]) -> int:
+        """Удалить записи методов, для которых match вернул True; вернуть их количество."""
+        ...
+
+    def clear(self) -> None:
+        """Удалить все записи."""
+        ...
+
+
+class MemoryCacheBackend:
+    """
+    Кэш в памяти процесса, общий для всех потоков.
+
+    Значения хранятся сериализованными в JSON, и каждое чтение возвращает
+    новую копию: изменения ответа вызывающим кодом не попадают в кэш.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries должен быть не меньше 1")
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[str, bytes, float]]" = OrderedDict()
+        self._dumps = _json_dumps()
+        self._loads = JsonDecoder().loads
+
+    def get(self, key: str, now: float) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            value = entry[1]
+        return self._loads(value)
+
+    def set(self, key: str, method: str, value: Any, expires_at: float) -> int:
+        value = self._dumps(value)
+        with self._lock:
+            self._entries[key] = (method, value, expires_at)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def invalidate(self, match: Callable[[str], bool]) -> int:
+        with self._lock:
+            keys = [key for key, (method, _, _) in self._entries.items() if match(method)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteCacheBackend:
+    """
+    Кэш в файле SQLite на локальном диске.
+
+    Переживает перезапуск процесса и может использоваться несколькими
+    процессами одновременно. Значения хранятся в JSON.
+    """
+
+    def __init__(self, path: str, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries должен быть не меньше 1")
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        import sqlite3
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, method TEXT NOT NULL, "
+            "value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed_at)")
+
+    def get(self, key: str, now: float) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            return json.loads(row[0])
+
+    def set(self, key: str, method: str, value: Any, expires_at: float) -> int:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, method, value, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, method, json.dumps(value, ensure_ascii=False), expires_at, time.time()),
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            evicted = max(0, count - self.max_entries)
+            if evicted:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed_at LIMIT ?)", (evicted,)
+                )
+            return evicted
+
+    def invalidate(self, match: Callable[[str], bool]) -> int:
+        with self._lock:
+            methods = [row[0] for row in self._conn.execute("SELECT DISTINCT method FROM cache")]
+            removed = 0
+            for method in filter(match, methods):
+                removed += self._conn.execute("DELETE FROM cache WHERE method = ?", (method,)).rowcount
+            return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+
+class ResponseCache:
+    """
+    Кэш ответов редко меняющихся методов чтения.
+
+    Кэшируются только методы, для которых задан TTL. Ключ — метод и
+    нормализованные параметры. Успешный вызов изменяющего метода (любого, кроме
+    методов чтения из read_methods) сбрасывает кэш методов того же модуля:
+    например, disk.folder.addsubfolder сбрасывает все записи disk.*.
+
+    Example:
+        >>> cache = ResponseCache({"disk.folder.get": 60, "crm.type.list": 300}, max_entries=2048)
+        >>> client = BitrixClient(token="...", user_id=123, cache=cache)
+        >>> client.disk.get_folder(123)  # запрос к порталу
+        >>> client.disk.get_folder(123)  # из кэша
+        >>> print(cache.stats().hit_ratio)
+    """
+
+    def __init__(self, ttls: Mapping[str, float], backend: Optional[CacheBackend] = None, max_entries: int = 1024,
+                 read_methods: Iterable[str] = DEFAULT_RETRY_METHODS) -> None:
+        """
+        Инициализация кэша.
+
+        Args:
+            ttls: TTL в секундах по шаблонам методов (fnmatch); точное имя метода важнее шаблона
+            backend: Хранилище записей (по умолчанию в памяти)
+            max_entries: Размер кэша в памяти, если backend не задан
+            read_methods: Шаблоны методов чтения, которые не сбрасывают кэш
+        """
+        self.ttls = dict(ttls)
+        self.read_methods = tuple(read_methods)
+        self.backend: CacheBackend = backend if backend is not None else MemoryCacheBackend(max_entries)
+        self._stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: BitrixSettings) -> Optional["ResponseCache"]:
+        """
+        Создать кэш по настройкам клиента.
+
+        Args:
+            settings: Настройки подключения
+
+        Returns:
+            ResponseCache или None, если кэш выключен (CACHE_ENABLED = false)
+        """
+        if not settings.CACHE_ENABLED:
+            return None
+        backend = SqliteCacheBackend(settings.CACHE_FILE, settings.CACHE_MAX_ENTRIES) if settings.CACHE_FILE else None
+        return cls(settings.CACHE_TTLS, backend=backend, max_entries=settings.CACHE_MAX_ENTRIES,
+                   read_methods=settings.RETRY_METHODS)
+
+    def ttl(self, method: str) -> Optional[float]:
+        """TTL метода в секундах или None, если метод не кэшируется."""
+        if method in self.ttls:
+            return self.ttls[method]
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(method, pattern):
+                return ttl
+        return None
+
+    def get(self, method: str, params: Optional[Dict[str, Any]]) -> Optional[Any]:
+        """
+        Получить сохранённый ответ метода.
+
+        Returns:
+            Ответ в виде словаря или None (метод не кэшируется или записи нет)
+        """
+        if not self.ttl(method):
+            return None
+        value = self.backend.get(_cache_key(method, params), time.time())
+        with self._stats_lock:
+            if value is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+        return value
+
+    def set(self, method: str, params: Optional[Dict[str, Any]], value: Any) -> None:
+        """Сохранить ответ метода, если он кэшируется."""
+        ttl = self.ttl(method)
+        if not ttl:
+            return
+        evicted = self.backend.set(_cache_key(method, params), method, value, time.time() + ttl)
+        if evicted:
+            with self._stats_lock:
+                self._stats.evictions += evicted
+
+    def invalidate_for(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Сбросить записи, которые мог изменить успешный вызов метода.
+
+        Args:
+            method: Выполненный метод (для batch учитываются методы всех команд)
+            params: Параметры вызова
+        """
+        modules = {_module(name) for name in _called_methods(method, params) if not self._is_read(name)}
+        if not modules:
+            return
+        removed = self.backend.invalidate(lambda cached: _module(cached) in modules)
+        if removed:
+            with self._stats_lock:
+                self._stats.invalidations += removed
+
+    def clear(self) -> None:
+        """Удалить все записи кэша."""
+        self.backend.clear()
+
+    def stats(self) -> CacheStats:
+        """Получить копию счётчиков кэша."""
+        with self._stats_lock:
+            return self._stats.model_copy()
+
+    def _is_read(self, method: str) -> bool:
+        return self.ttl(method) is not None or any(fnmatchcase(method, p) for p in self.read_methods)
+
+
+def _cache_key(method: str, params: Optional[Dict[str, Any]]) -> str:
+    return f"{method}:{json.dumps(params or {}, sort_keys=True, ensure_ascii=False, default=str)}"
+
+
+def _module(method: str) -> str:
+    return method.split(".", 1)[0]
+
+
+def _called_methods(method: str, params: Optional[Dict[str, Any]]) -> List[str]:
+    """Методы, выполненные вызовом: для batch — методы команд пакета."""
+    if method != "batch" or not params:
+        return [method]
+    return [str(value).split("?", 1)[0] for key, value in params.items() if str(key).startswith("cmd[")]
@@ -1,15 +1,45 @@
-import requests
-from typing import Any, Dict, Optional, Type
+import time
+from contextlib import nullcontext
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Type, TypeVar, TYPE_CHECKING
 from pydantic import BaseModel
 
 from ..config.config import BitrixSettings, load_bitrix_settings
+from ..utils.encoder import encode_params
+from ..utils.response import ResponseMode, build_response
+from .errors import error_from_response, error_from_status
+from .rate_limit import RateLimiter
+from .cache import ResponseCache
+from .body import BodyEncoder, RequestBody
+from .decoder import JsonDecoder, validate_json
+from .instrumentation import CallEvent, HookLike, as_hooks, instrumented, request_size, response_size
+from .retry import RetryPolicy
+from .scheduling import CallScheduler, PriorityScheduler
+from .singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    import requests
+    from .batch import BitrixBatch
+    from .transport import HttpTransport
+
+T = TypeVar("T")
 
 
 class BitrixHttpClient:
     """Низкоуровневый HTTP-клиент для Bitrix24."""
 
     def __init__(self, token: str, user_id: int | str, settings: BitrixSettings | None = None,
-                 session: Optional[requests.Session] = None,) -> None:
+                 session: Optional["requests.Session"] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 transport: Optional["HttpTransport"] = None,
+                 cache: Optional[ResponseCache] = None,
+                 single_flight: Optional[SingleFlight] = None,
+                 decoder: Optional[JsonDecoder] = None,
+                 hooks: Optional[Sequence[HookLike]] = None,
+                 body_encoder: Optional[BodyEncoder] = None,
+                 scheduler: Optional[CallScheduler] = None,
+                 priority_scheduler: Optional[PriorityScheduler] = None) -> None:
         """
         Инициализация HTTP-клиента.
 
@@ -18,16 +48,47 @@ class BitrixHttpClient:
             user_id: ID пользователя
             settings: Настройки подключения
             session: HTTP-сессия (опционально)
+            rate_limiter: Ограничитель частоты запросов (по умолчанию из настроек)
+            retry_policy: Политика повторов (по умолчанию из настроек)
+            transport: Общий транспорт с пулом соединений (по умолчанию из настроек)
+            cache: Кэш ответов методов чтения (по умолчанию из настроек, выключен)
+            single_flight: Объединение одинаковых одновременных вызовов (по умолчанию из настроек)
+            decoder: Декодер JSON ответов (по умолчанию из настроек)
+            hooks: Обработчики событий вызовов (CallHook или функции от CallEvent)
+            body_encoder: Кодировщик тела запросов (по умолчанию из настроек)
+            scheduler: Планировщик слотов запросов, общий для нескольких клиентов (например, BitrixClientPool)
+            priority_scheduler: Планировщик классов приоритета (по умолчанию из настроек, выключен)
         """
         self.settings = settings or load_bitrix_settings()
         self._token = token
         self._user_id = str(user_id)
-        self._timeout = self.settings.TIMEOUT
 
         base = self.settings.BASE_URL.rstrip("/")
         self._base_url = f"{base}/{self._user_id}/{self._token}/"
 
-        self._session = session or requests.Session()
+        if transport is None:
+            # requests импортируется только синхронным клиентом: асинхронный использует функции этого модуля
+            from .transport import HttpTransport
+            transport = HttpTransport.from_settings(self.settings, session=session)
+        self.transport = transport
+        self.rate_limiter = rate_limiter or RateLimiter.from_settings(self.settings)
+        self.retry_policy = retry_policy or RetryPolicy.from_settings(self.settings)
+        self.cache = cache or ResponseCache.from_settings(self.settings)
+        self.single_flight = single_flight or SingleFlight.from_settings(self.settings)
+        self.decoder = decoder or JsonDecoder.from_settings(self.settings)
+        self.hooks = as_hooks(hooks)
+        self.body_encoder = body_encoder or BodyEncoder.from_settings(self.settings)
+        self.scheduler = scheduler
+        self.priority_scheduler = priority_scheduler or PriorityScheduler.from_settings(self.settings)
+
+    def add_hook(self, hook: HookLike) -> None:
+        """
+        Добавить обработчик событий вызовов call и call_pydantic.
+
+        Args:
+            hook: CallHook (PrometheusHook, OpenTelemetryHook и др.) или функция от CallEvent
+        """
+        self.hooks.extend(as_hooks([hook]))
 
     def call(self, method: str, params: Optional[Dict[str, Any]] = None, files: Optional[Dict[str, Any]] = None) -> Any:
         """
@@ -42,36 +103,251 @@ class BitrixHttpClient:
             Ответ от API в виде словаря
 
         Raises:
-            RuntimeError: При ошибке в ответе Bitrix24
+            BitrixError: При ошибке в ответе Bitrix24 (QueryLimitExceeded, ExpiredToken, NotFound, ServerError и др.)
         """
+        with instrumented(self.hooks, method) as event:
+            return self._call(method, params, files, self._call_once, event)
+
+    def _call(self, method: str, params: Optional[Dict[str, Any]], files: Optional[Dict[str, Any]],
+              once: Callable[[str, Optional[Dict[str, Any]], Optional[Dict[str, Any]], CallEvent], T],
+              event: CallEvent) -> T:
+        """Выполнить попытку вызова once с повторами по политике и сбросом кэша после успеха."""
+        attempt = 0
+        while True:
+            attempt += 1
+            event.attempts = attempt
+            try:
+                data = once(method, params, files, event)
+            except Exception as e:
+                if self.retry_policy is None or not self.retry_policy.should_retry(method, e, attempt):
+                    raise
+                delay = self.retry_policy.delay(attempt, e)
+                time.sleep(delay)
+                event.retry_wait += delay
+                _rewind(files)
+                continue
+            if self.cache is not None:
+                self.cache.invalidate_for(method, params)
+            return data
+
+    def _call_once(self, method: str, params: Optional[Dict[str, Any]], files: Optional[Dict[str, Any]],
+                   event: CallEvent) -> Any:
+        return self._handle(method, self._send(method, params, files, event), event)
+
+    def _call_once_model(self, model: Type[BaseModel], method: str, params: Optional[Dict[str, Any]],
+                         files: Optional[Dict[str, Any]], event: CallEvent) -> BaseModel:
+        """Попытка вызова с валидацией модели прямо из тела ответа."""
+        resp = self._send(method, params, files, event)
+        return _validate_model(model, method, resp, event, self._handle, self.rate_limiter)
+
+    def _send(self, method: str, params: Optional[Dict[str, Any]], files: Optional[Dict[str, Any]],
+              event: CallEvent) -> Any:
+        if self.priority_scheduler is None:
+            return self._send_now(method, params, files, event)
+        # Слот класса занимается до ограничителя: иначе массовые вызовы резервируют бюджет портала вперёд
+        with self.priority_scheduler.slot(method) as waited:
+            event.queue += waited
+            return self._send_now(method, params, files, event)
+
+    def _send_now(self, method: str, params: Optional[Dict[str, Any]], files: Optional[Dict[str, Any]],
+                  event: CallEvent) -> Any:
         url = f"{self._base_url}{method}.json"
 
-        resp = self._session.post(
-            url,
-            data=params or {},
-            files=files,
-            timeout=self._timeout,
-        )
+        if self.rate_limiter is not None:
+            event.rate_limit += self.rate_limiter.acquire(method)
 
-        resp.raise_for_status()
-        data = resp.json()
+        body = None if files else self.body_encoder.encode(params or {})
+        with self.scheduler.slot(method) if self.scheduler is not None else nullcontext(0.0) as waited:
+            event.queue += waited
+            started = time.perf_counter()
+            if body is None:
+                resp = self.transport.post(url, data=encode_params(params or {}), files=files,
+                                           headers=self.body_encoder.accept_headers)
+            else:
+                resp = self.transport.post(url, data=body.content, headers=body.headers)
+        _account_transfer(event, resp, started, body)
+        return resp
+
+    def _handle(self, method: str, resp: Any, event: CallEvent) -> Any:
+        """Разобрать ответ, учесть его в ограничителе и поднять ошибку Bitrix, если она есть."""
+        started = time.perf_counter()
+        data = _read_json(resp, self.decoder)
+        event.decode += time.perf_counter() - started
+        if isinstance(data, dict) and isinstance(data.get("time"), dict):
+            event.server_time = data["time"]
+        if self.rate_limiter is not None and isinstance(data, dict):
+            _account_response(self.rate_limiter, method, resp, data)
 
-        if "error" in data: raise RuntimeError( f"Bitrix error {data['error']}: {data.get('error_description')}")
+        _raise_for_error(resp, data, method)
         return data
 
     def call_pydantic(self, method: str, params: Optional[Dict[str, Any]], model: Type[BaseModel],
-                      files: Optional[Dict[str, Any]] = None) -> BaseModel:
+                      files: Optional[Dict[str, Any]] = None, mode: Optional[ResponseMode] = "model",
+                      fields: Optional[Sequence[str]] = None) -> BaseModel:
         """
         Вызвать метод и сразу получить Pydantic-модель на основе result.
 
+        Если у клиента включён кэш, ответы кэшируемых методов берутся из него.
+        Одинаковые одновременные вызовы методов из single_flight выполняются
+        одним запросом, и все вызывающие получают одну и ту же модель.
+        Режимы raw и lazy и проекция fields пропускают полную валидацию строк
+        списочных ответов (см. build_response).
+
         Args:
             method: Название метода API
             params: Параметры запроса
             model: Pydantic модель для валидации
             files: Файлы для загрузки
+            mode: Режим разбора строк списка: model, raw или lazy (None — RESPONSE_MODE клиента)
+            fields: Поля строк, которые нужно оставить
 
         Returns:
             Валидированная Pydantic модель
         """
-        raw_result = self.call(method=method, params=params, files=files)
-        return model.model_validate(raw_result)
+        if mode is None:
+            mode = self.settings.RESPONSE_MODE
+        with instrumented(self.hooks, method, model.__name__) as event:
+            if self.single_flight is not None and not files and self.single_flight.applies(method):
+                key = self.single_flight.key(method, params, model, mode, fields)
+                event.coalesced = True
+                return self.single_flight.do(key, partial(self._call_pydantic, method, params, model, None, mode,
+                                                          fields, event))
+            return self._call_pydantic(method, params, model, files, mode, fields, event)
+
+    def _call_pydantic(self, method: str, params: Optional[Dict[str, Any]], model: Type[BaseModel],
+                       files: Optional[Dict[str, Any]], mode: ResponseMode, fields: Optional[Sequence[str]],
+                       event: CallEvent) -> BaseModel:
+        event.coalesced = False
+        if _direct(self.settings, mode, fields) and (self.cache is None or not self.cache.ttl(method)):
+            return self._call(method, params, files, partial(self._call_once_model, model), event)
+        raw_result = None
+        if self.cache is not None and not files:
+            raw_result = self.cache.get(method, params)
+            event.cached = raw_result is not None
+        if raw_result is None:
+            raw_result = self._call(method, params, files, self._call_once, event)
+            if self.cache is not None and not files:
+                self.cache.set(method, params, raw_result)
+        started = time.perf_counter()
+        response = build_response(model, raw_result, mode, fields)
+        event.validate += time.perf_counter() - started
+        return response
+
+    def batch(self, halt: bool = False) -> "BitrixBatch":
+        """
+        Создать пакет вызовов, выполняемых через метод batch.
+
+        Args:
+            halt: Прекратить выполнение пакета при первой ошибке
+
+        Returns:
+            BitrixBatch: Пакет, выполняемый при выходе из контекста или вызове execute()
+        """
+        from .batch import BitrixBatch
+
+        return BitrixBatch(self, halt=halt)
+
+
+def _read_json(resp: Any, decoder: JsonDecoder) -> Any:
+    """Прочитать JSON из ответа; None, если тело не является JSON."""
+    try:
+        return decoder.loads(resp.content)
+    except ValueError:
+        return None
+
+
+def _direct(settings: BitrixSettings, mode: str, fields: Optional[Sequence[str]]) -> bool:
+    """Можно ли валидировать модель сразу из тела ответа."""
+    return settings.JSON_VALIDATE_BYTES and mode == "model" and fields is None
+
+
+def _validate_content(model: Type[BaseModel], resp: Any) -> Optional[Tuple[BaseModel, Optional[Dict[str, Any]]]]:
+    """
+    Провалидировать успешный ответ из байтов.
+
+    Returns:
+        (модель, блок time) или None для ошибочных и нестандартных ответов,
+        которые разбираются обычным путём, чтобы поднять типизированную ошибку
+    """
+    if resp.status_code >= 400:
+        return None
+    try:
+        return validate_json(model, resp.content)
+    except ValueError:
+        return None
+
+
+def _validate_model(model: Type[BaseModel], method: str, resp: Any, event: CallEvent,
+                    handle: Callable[[str, Any, CallEvent], Any], limiter: Optional[RateLimiter]) -> BaseModel:
+    """Провалидировать модель из тела ответа, а ошибочный ответ разобрать через handle."""
+    started = time.perf_counter()
+    parsed = _validate_content(model, resp)
+    if parsed is None:
+        data = handle(method, resp, event)
+        started = time.perf_counter()
+        value = model.model_validate(data)
+        event.validate += time.perf_counter() - started
+        return value
+    value, time_info = parsed
+    event.validate += time.perf_counter() - started
+    event.server_time = time_info
+    if limiter is not None:
+        limiter.record(method, time_info)
+    return value
+
+
+def _account_transfer(event: CallEvent, resp: Any, started: float, body: Optional[RequestBody]) -> None:
+    """Записать в событие время обмена, объём данных и статус ответа (body — None для multipart)."""
+    event.network += time.perf_counter() - started
+    event.status_code = resp.status_code
+    sent = request_size(resp)
+    event.bytes_out += sent
+    event.bytes_out_raw += sent if body is None else body.size
+    event.body_format = "multipart" if body is None else body.format
+    event.bytes_in += response_size(resp)
+    event.bytes_in_raw += len(resp.content)
+
+
+def _raise_for_error(resp: Any, data: Any, method: str) -> None:
+    """
+    Поднять типизированное исключение для ошибочного ответа.
+
+    Ошибки лимитов и авторизации Bitrix приходят с HTTP 4xx/5xx и JSON-телом,
+    поэтому тело ошибки проверяется раньше HTTP статуса.
+    """
+    retry_after = _retry_after(resp)
+    if isinstance(data, dict) and "error" in data:
+        raise error_from_response(data, status_code=resp.status_code, method=method, retry_after=retry_after)
+    if resp.status_code >= 400:
+        error = error_from_status(resp.status_code, resp.text, method=method, retry_after=retry_after)
+        if error is not None:
+            raise error
+        resp.raise_for_status()
+    if data is None:
+        raise ValueError(f"Некорректный JSON в ответе метода {method}")
+
+
+def _rewind(files: Optional[Dict[str, Any]]) -> None:
+    """Вернуть файловые объекты в начало перед повтором запроса."""
+    for value in (files or {}).values():
+        file_obj = value[1] if isinstance(value, tuple) and len(value) > 1 else value
+        if hasattr(file_obj, "seek"):
+            file_obj.seek(0)
+
+
+def _retry_after(resp: Any) -> Optional[float]:
+    value = resp.headers.get("Retry-After") if resp.headers is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _account_response(limiter: RateLimiter, method: str, resp: Any, data: Dict[str, Any]) -> None:
+    """Передать ограничителю блок time и сигналы о превышении лимитов."""
+    limiter.record(method, data.get("time"))
+    error = data.get("error")
+    if error == "QUERY_LIMIT_EXCEEDED":
+        limiter.penalize(retry_after=_retry_after(resp))
+    elif error == "OPERATION_TIME_LIMIT":
+        limiter.penalize(method, retry_after=_retry_after(resp))
@@ -0,0 +1,124 @@
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel, create_model
+
+from ..config.config import BitrixSettings
+
+JSON_DECODERS = ("auto", "orjson", "msgspec", "json")
+"""Допустимые значения настройки JSON_DECODER."""
+
+
+class JsonDecoder:
+    """
+    Разбор JSON ответов Bitrix24.
+
+    По умолчанию (auto) используется самый быстрый из установленных пакетов:
+    orjson, затем msgspec, иначе стандартный json. Ошибка разбора любого
+    из них поднимается как ValueError, как у стандартного json.
+
+    Example:
+        >>> decoder = JsonDecoder("orjson")
+        >>> client = BitrixClient(token="...", user_id=123, decoder=decoder)
+    """
+
+    def __init__(self, backend: str = "auto") -> None:
+        """
+        Инициализация.
+
+        Args:
+            backend: auto, orjson, msgspec или json
+
+        Raises:
+            ImportError: Если явно выбранный пакет не установлен
+        """
+        if backend not in JSON_DECODERS:
+            raise ValueError(f"Неизвестный JSON декодер: {backend}")
+        self.name, self._loads = _load_backend(backend)
+
+    @classmethod
+    def from_settings(cls, settings: BitrixSettings) -> "JsonDecoder":
+        """Создать декодер по настройкам клиента (JSON_DECODER)."""
+        return cls(settings.JSON_DECODER)
+
+    def loads(self, content: Any) -> Any:
+        """
+        Разобрать JSON.
+
+        Args:
+            content: Тело ответа (bytes или str)
+
+        Returns:
+            Разобранное значение
+
+        Raises:
+            ValueError: Если тело не является JSON
+        """
+        try:
+            return self._loads(content)
+        except ValueError:
+            raise
+        except Exception as e:
+            # msgspec.DecodeError не наследует ValueError
+            raise ValueError(str(e)) from e
+
+    def __repr__(self) -> str:
+        return f"JsonDecoder({self.name!r})"
+
+
+def _load_backend(backend: str) -> Tuple[str, Callable[[Any], Any]]:
+    if backend in ("auto", "orjson"):
+        try:
+            import orjson
+        except ImportError as e:
+            if backend == "orjson":
+                raise ImportError("Для декодера orjson нужен пакет orjson: pip install bitrix24-sdk[fast]") from e
+        else:
+            return "orjson", orjson.loads
+    if backend in ("auto", "msgspec"):
+        try:
+            import msgspec
+        except ImportError as e:
+            if backend == "msgspec":
+                raise ImportError("Для декодера msgspec нужен пакет msgspec: pip install msgspec") from e
+        else:
+            return "msgspec", msgspec.json.Decoder().decode
+    return "json", json.loads
+
+
+def validate_json(model: Type[BaseModel], content: Any) -> Optional[Tuple[BaseModel, Optional[Dict[str, Any]]]]:
+    """
+    Провалидировать ответ сразу из байтов, не строя промежуточный словарь.
+
+    Разбор выполняет pydantic-core (model_validate_json). Блоки error и time
+    читаются в той же проходке через служебную подмодель.
+
+    Args:
+        model: Модель ответа
+        content: Тело ответа
+
+    Returns:
+        (модель, блок time) или None, если в ответе есть ошибка Bitrix —
+        тогда ответ нужно разобрать обычным путём
+    """
+    wire = _wire_model(model).model_validate_json(content)
+    if getattr(wire, "error", None) is not None:
+        return None
+    time_info = getattr(wire, "time", None)
+    if isinstance(time_info, BaseModel):
+        time_info = time_info.model_dump()
+    values = {name: getattr(wire, name) for name in model.model_fields}
+    return model.model_construct(_fields_set=wire.model_fields_set & set(values), **values), time_info
+
+
+@lru_cache(maxsize=None)
+def _wire_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """Подмодель ответа с полями error и time, если их нет в самой модели."""
+    extra: Dict[str, Any] = {}
+    for name in ("error", "time"):
+        if name not in model.model_fields:
+            extra[name] = (Optional[Any], None)
+    if not extra:
+        return model
+    return create_model(f"{model.__name__}Wire", __base__=model, **extra)
@@ -0,0 +1,127 @@
+from typing import Any, Dict, Optional
+
+
+class BitrixError(RuntimeError):
+    """
+    Ошибка, которую вернул Bitrix24.
+
+    Наследуется от RuntimeError, поэтому существующий код, перехватывающий
+    RuntimeError, продолжает работать.
+
+    Attributes:
+        code: Код ошибки Bitrix (поле error)
+        description: Описание ошибки (поле error_description)
+        status_code: HTTP статус ответа
+        method: Метод API, вызвавший ошибку
+        retry_after: Рекомендованная сервером пауза перед повтором, секунды
+    """
+
+    def __init__(self, message: str, code: Optional[str] = None, description: Optional[str] = None,
+                 status_code: Optional[int] = None, method: Optional[str] = None,
+                 retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.code = code
+        self.description = description
+        self.status_code = status_code
+        self.method = method
+        self.retry_after = retry_after
+
+
+class QueryLimitExceeded(BitrixError):
+    """Превышен лимит частоты запросов к порталу (QUERY_LIMIT_EXCEEDED)."""
+
+
+class OperationTimeLimit(BitrixError):
+    """Превышен лимит времени выполнения метода (OPERATION_TIME_LIMIT)."""
+
+
+class ExpiredToken(BitrixError):
+    """Токен авторизации истёк или недействителен."""
+
+
+class AccessDenied(BitrixError):
+    """Недостаточно прав или scope для вызова метода."""
+
+
+class NotFound(BitrixError):
+    """Объект или метод не найден."""
+
+
+class ServerError(BitrixError):
+    """Внутренняя ошибка портала или ответ 5xx."""
+
+
+_ERROR_CODES = {
+    "QUERY_LIMIT_EXCEEDED": QueryLimitExceeded,
+    "OPERATION_TIME_LIMIT": OperationTimeLimit,
+    "EXPIRED_TOKEN": ExpiredToken,
+    "INVALID_TOKEN": ExpiredToken,
+    "NO_AUTH_FOUND": ExpiredToken,
+    "ACCESS_DENIED": AccessDenied,
+    "INSUFFICIENT_SCOPE": AccessDenied,
+    "INVALID_CREDENTIALS": AccessDenied,
+    "WRONG_AUTH_TYPE": AccessDenied,
+    "ERROR_NOT_FOUND": NotFound,
+    "NOT_FOUND": NotFound,
+    "ERROR_METHOD_NOT_FOUND": NotFound,
+    "INTERNAL_SERVER_ERROR": ServerError,
+    "ERROR_UNEXPECTED_ANSWER": ServerError,
+    "PORTAL_DELETED": NotFound,
+}
+
+
+def error_from_response(data: Dict[str, Any], status_code: Optional[int] = None, method: Optional[str] = None,
+                        retry_after: Optional[float] = None) -> BitrixError:
+    """
+    Построить типизированное исключение по телу ошибки Bitrix.
+
+    Args:
+        data: Тело ответа с полями error и error_description
+        status_code: HTTP статус ответа
+        method: Метод API
+        retry_after: Значение заголовка Retry-After
+
+    Returns:
+        BitrixError или его подкласс, соответствующий коду ошибки
+    """
+    code = str(data.get("error"))
+    description = data.get("error_description")
+    cls = _ERROR_CODES.get(code.upper())
+    if cls is None:
+        cls = ServerError if status_code is not None and status_code >= 500 else BitrixError
+    return cls(
+        f"Bitrix error {code}: {description}",
+        code=code,
+        description=description,
+        status_code=status_code,
+        method=method,
+        retry_after=retry_after,
+    )
+
+
+def error_from_status(status_code: int, text: str, method: Optional[str] = None,
+                      retry_after: Optional[float] = None) -> Optional[BitrixError]:
+    """
+    Построить исключение по HTTP статусу ответа без тела ошибки Bitrix.
+
+    Args:
+        status_code: HTTP статус ответа
+        text: Текст ответа
+        method: Метод API
+        retry_after: Значение заголовка Retry-After
+
+    Returns:
+        ServerError для 5xx, NotFound для 404, иначе None
+    """
+    if status_code >= 500:
+        cls = ServerError
+    elif status_code == 404:
+        cls = NotFound
+    else:
+        return None
+    return cls(
+        f"HTTP {status_code}: {text[:200]}",
+        status_code=status_code,
+        method=method,
+        retry_after=retry_after,
+    )
@@ -1,8 +1,24 @@
+from functools import cached_property
+from typing import Sequence, TYPE_CHECKING
+
 from ..config.config import BitrixSettings, load_bitrix_settings
 from .client import BitrixHttpClient
-from ..base.service import BaseService
-from ..disk.service import DiskService
-from ..crm.service import CrmService
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .transport import HttpTransport
+from .cache import ResponseCache
+from .body import BodyEncoder
+from .decoder import JsonDecoder
+from .instrumentation import HookLike
+from .scheduling import CallScheduler, PriorityScheduler
+from .singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from ..base.service import BaseService
+    from ..disk.service import DiskService
+    from ..crm.service import CrmService
+    from .batch import BitrixBatch
+
 
 class BitrixClient:
     """
@@ -24,7 +40,15 @@ class BitrixClient:
         >>> print(f"Найдено смарт-процессов: {types.total}")
     """
 
-    def __init__(self, token: str, user_id: int | str, settings: BitrixSettings | None = None,) -> None:
+    def __init__(self, token: str, user_id: int | str, settings: BitrixSettings | None = None,
+                 rate_limiter: RateLimiter | None = None, retry_policy: RetryPolicy | None = None,
+                 transport: HttpTransport | None = None, cache: ResponseCache | None = None,
+                 single_flight: SingleFlight | None = None,
+                 decoder: JsonDecoder | None = None,
+                 hooks: Sequence[HookLike] | None = None,
+                 body_encoder: BodyEncoder | None = None,
+                 scheduler: CallScheduler | None = None,
+                 priority_scheduler: PriorityScheduler | None = None) -> None:
         """
         Инициализация клиента Bitrix24.
 
@@ -32,6 +56,16 @@ class BitrixClient:
             token: Токен авторизации Bitrix24
             user_id: ID пользователя
             settings: Настройки подключения (опционально)
+            rate_limiter: Ограничитель частоты запросов, общий для нескольких клиентов (опционально)
+            retry_policy: Политика повторов (опционально)
+            transport: Транспорт с пулом соединений, общий для нескольких клиентов (опционально)
+            cache: Кэш ответов методов чтения (опционально)
+            single_flight: Объединение одинаковых одновременных вызовов (опционально)
+            decoder: Декодер JSON ответов (опционально)
+            hooks: Обработчики событий вызовов, например PrometheusHook или OpenTelemetryHook (опционально)
+            body_encoder: Кодировщик тела запросов: JSON и gzip (опционально)
+            scheduler: Планировщик слотов запросов, общий для нескольких клиентов (опционально)
+            priority_scheduler: Планировщик классов приоритета: interactive, normal, bulk (опционально)
 
         Example:
             >>> client = BitrixClient(
@@ -44,8 +78,50 @@ class BitrixClient:
             token=token,
             user_id=user_id,
             settings=self.settings,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            transport=transport,
+            cache=cache,
+            single_flight=single_flight,
+            decoder=decoder,
+            hooks=hooks,
+            body_encoder=body_encoder,
+            scheduler=scheduler,
+            priority_scheduler=priority_scheduler,
         )
-    
-        self.base = BaseService(self.http)
-        self.disk = DiskService(self.http)
-        self.crm = CrmService(self.http)
\ No newline at end of file
+
+    @cached_property
+    def base(self) -> "BaseService":
+        """Сервис базовых методов API (создаётся при первом обращении)."""
+        from ..base.service import BaseService
+        return BaseService(self.http)
+
+    @cached_property
+    def disk(self) -> "DiskService":
+        """Сервис Disk API (создаётся при первом обращении)."""
+        from ..disk.service import DiskService
+        return DiskService(self.http)
+
+    @cached_property
+    def crm(self) -> "CrmService":
+        """Сервис CRM API (создаётся при первом обращении)."""
+        from ..crm.service import CrmService
+        return CrmService(self.http)
+
+    def batch(self, halt: bool = False) -> "BitrixBatch":
+        """
+        Создать пакет вызовов, упаковываемых в запросы batch по 50 команд.
+
+        Args:
+            halt: Прекратить выполнение пакета при первой ошибке
+
+        Returns:
+            BitrixBatch: Пакет с сервисами base, disk и crm
+
+        Example:
+            >>> with client.batch() as batch:
+            ...     folder = batch.disk.get_folder(123)
+            ...     children = batch.disk.get_children(folder.ref("ID"))
+            >>> print(children.result().result)
+        """
+        return self.http.batch(halt=halt)
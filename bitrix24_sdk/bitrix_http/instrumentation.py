@@ -0,0 +1,325 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+PHASES = ("rate_limit", "queue", "network", "decode", "validate", "retry_wait")
+"""Фазы вызова, время которых записывается в CallEvent."""
+
+
+class CallEvent:
+    """
+    Событие одного вызова call или call_pydantic.
+
+    Время фаз суммируется по всем попыткам вызова. При валидации модели
+    сразу из байтов (JSON_VALIDATE_BYTES) разбор JSON и валидация выполняются
+    одним проходом и учитываются в validate, decode остаётся нулевым.
+
+    Attributes:
+        method: Метод API
+        model: Имя модели ответа (для call_pydantic)
+        started_at: Время начала вызова (unix time)
+        duration: Полное время вызова, секунды
+        rate_limit: Ожидание ограничителя частоты запросов, секунды
+        queue: Ожидание очереди планировщика запросов (BitrixClientPool), секунды
+        network: Отправка запроса и получение ответа (включая DNS и подключение), секунды
+        decode: Разбор JSON, секунды
+        validate: Валидация модели ответа, секунды
+        retry_wait: Паузы между повторами, секунды
+        attempts: Количество попыток (1 — без повторов)
+        bytes_out: Отправлено байт тела запросов (после сжатия, по Content-Length)
+        bytes_in: Получено байт тела ответов (до распаковки)
+        bytes_out_raw: Размер тел запросов до сжатия
+        bytes_in_raw: Размер тел ответов после распаковки
+        body_format: Формат тела последнего запроса: form, json или multipart
+        status_code: HTTP статус последнего ответа
+        server_time: Блок time последнего ответа Bitrix (duration, processing, operating и др.)
+        cached: Ответ взят из кэша без запроса
+        coalesced: Вызов дождался результата одинакового одновременного вызова (single-flight)
+        error: Исключение, которым завершился вызов
+        context: Словарь для данных обработчиков (например, span трассировки)
+    """
+
+    __slots__ = ("method", "model", "started_at", "duration", "rate_limit", "queue", "network", "decode", "validate",
+                 "retry_wait", "attempts", "bytes_out", "bytes_in", "bytes_out_raw", "bytes_in_raw", "body_format",
+                 "status_code", "server_time", "cached", "coalesced", "error", "context", "_started")
+
+    def __init__(self, method: str, model: Optional[str] = None) -> None:
+        self.method = method
+        self.model = model
+        self.started_at = time.time()
+        self.duration = 0.0
+        self.rate_limit = 0.0
+        self.queue = 0.0
+        self.network = 0.0
+        self.decode = 0.0
+        self.validate = 0.0
+        self.retry_wait = 0.0
+        self.attempts = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.bytes_out_raw = 0
+        self.bytes_in_raw = 0
+        self.body_format: Optional[str] = None
+        self.status_code: Optional[int] = None
+        self.server_time: Optional[Dict[str, Any]] = None
+        self.cached = False
+        self.coalesced = False
+        self.error: Optional[BaseException] = None
+        self.context: Dict[str, Any] = {}
+        self._started = time.perf_counter()
+
+    @property
+    def ok(self) -> bool:
+        """Вызов завершился без исключения."""
+        return self.error is None
+
+    @property
+    def retries(self) -> int:
+        """Количество повторов."""
+        return max(0, self.attempts - 1)
+
+    @property
+    def outcome(self) -> str:
+        """ok или имя класса исключения (например, QueryLimitExceeded)."""
+        return "ok" if self.error is None else type(self.error).__name__
+
+    def phases(self) -> Dict[str, float]:
+        """Время по фазам, секунды."""
+        return {phase: getattr(self, phase) for phase in PHASES}
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Событие в виде словаря (для логов)."""
+        return {
+            "method": self.method, "model": self.model, "started_at": self.started_at, "duration": self.duration,
+            **self.phases(), "attempts": self.attempts, "bytes_out": self.bytes_out, "bytes_in": self.bytes_in,
+            "bytes_out_raw": self.bytes_out_raw, "bytes_in_raw": self.bytes_in_raw, "body_format": self.body_format,
+            "status_code": self.status_code, "server_time": self.server_time, "cached": self.cached,
+            "coalesced": self.coalesced, "outcome": self.outcome,
+        }
+
+    def __repr__(self) -> str:
+        return f"CallEvent({self.method!r}, {self.outcome}, duration={self.duration:.4f})"
+
+
+class CallHook:
+    """
+    Обработчик событий вызовов.
+
+    on_call_start вызывается перед вызовом, on_call_end — после него (в том
+    числе при ошибке, тогда event.error заполнен). Обработчики вызываются в
+    потоке вызова; исключение обработчика прерывает вызов.
+
+    Example:
+        >>> class SlowCalls(CallHook):
+        ...     def on_call_end(self, event):
+        ...         if event.duration > 1:
+        ...             print(event.as_dict())
+        >>> client = BitrixClient(token="...", user_id=123, hooks=[SlowCalls()])
+    """
+
+    def on_call_start(self, event: CallEvent) -> None:
+        """Вызов начинается."""
+
+    def on_call_end(self, event: CallEvent) -> None:
+        """Вызов завершён."""
+
+
+HookLike = Union[CallHook, Callable[[CallEvent], Any]]
+"""Обработчик: CallHook или функция, вызываемая по завершении вызова."""
+
+
+class _FunctionHook(CallHook):
+    def __init__(self, fn: Callable[[CallEvent], Any]) -> None:
+        self.fn = fn
+
+    def on_call_end(self, event: CallEvent) -> None:
+        self.fn(event)
+
+
+def as_hooks(hooks: Optional[Sequence[HookLike]]) -> List[CallHook]:
+    """Привести обработчики к CallHook."""
+    return [hook if isinstance(hook, CallHook) else _FunctionHook(hook) for hook in hooks or ()]
+
+
+@contextmanager
+def instrumented(hooks: Sequence[CallHook], method: str, model: Optional[str] = None) -> Iterator[CallEvent]:
+    """Событие вызова: уведомить обработчики о начале и завершении, записать ошибку и длительность."""
+    event = CallEvent(method, model)
+    for hook in hooks:
+        hook.on_call_start(event)
+    try:
+        yield event
+    except BaseException as e:
+        event.error = e
+        raise
+    finally:
+        event.duration = time.perf_counter() - event._started
+        for hook in hooks:
+            hook.on_call_end(event)
+
+
+def request_size(resp: Any) -> int:
+    """Размер тела запроса по заголовку Content-Length (0 для потоковых тел без длины)."""
+    request = getattr(resp, "request", None)
+    headers = getattr(request, "headers", None)
+    value = headers.get("Content-Length") if headers is not None else None
+    try:
+        return int(value) if value is not None else 0
+    except ValueError:
+        return 0
+
+
+def response_size(resp: Any) -> int:
+    """Размер тела ответа, полученного по сети (до распаковки gzip)."""
+    downloaded = getattr(resp, "num_bytes_downloaded", None)
+    if isinstance(downloaded, int):
+        return downloaded
+    # requests: urllib3 считает прочитанные из сокета байты
+    tell = getattr(getattr(resp, "raw", None), "tell", None)
+    if tell is not None:
+        try:
+            position = tell()
+        except (OSError, ValueError):
+            position = None
+        if isinstance(position, int) and position > 0:
+            return position
+    return len(resp.content)
+
+
+class PrometheusHook(CallHook):
+    """
+    Метрики вызовов в prometheus_client.
+
+    Метрики (namespace по умолчанию bitrix):
+
+    - bitrix_calls_total{method, outcome} — вызовы по результату;
+    - bitrix_call_duration_seconds{method} — полное время вызова;
+    - bitrix_call_phase_seconds{method, phase} — время фаз (rate_limit, queue, network, decode, validate, retry_wait);
+    - bitrix_retries_total{method} — повторы;
+    - bitrix_bytes_total{method, direction} — объём переданных данных (in, out);
+    - bitrix_raw_bytes_total{method, direction} — объём данных до сжатия и после распаковки;
+    - bitrix_server_seconds{method, kind} — блок time ответа (duration, processing).
+
+    Требует пакет prometheus-client.
+
+    Example:
+        >>> from prometheus_client import start_http_server
+        >>> start_http_server(9100)
+        >>> client = BitrixClient(token="...", user_id=123, hooks=[PrometheusHook()])
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "bitrix",
+                 buckets: Optional[Sequence[float]] = None) -> None:
+        """
+        Инициализация.
+
+        Args:
+            registry: CollectorRegistry (по умолчанию глобальный REGISTRY)
+            namespace: Префикс имён метрик
+            buckets: Границы корзин гистограмм, секунды
+        """
+        try:
+            import prometheus_client
+        except ImportError as e:
+            raise ImportError("Для метрик Prometheus нужен пакет prometheus-client: "
+                              "pip install bitrix24-sdk[metrics]") from e
+        options: Dict[str, Any] = {"namespace": namespace}
+        if registry is not None:
+            options["registry"] = registry
+        histogram: Dict[str, Any] = dict(options, buckets=tuple(buckets)) if buckets else options
+        self.calls = prometheus_client.Counter("calls", "Вызовы методов API", ["method", "outcome"], **options)
+        self.duration = prometheus_client.Histogram("call_duration_seconds", "Время вызова метода API",
+                                                    ["method"], **histogram)
+        self.phase = prometheus_client.Histogram("call_phase_seconds", "Время фаз вызова метода API",
+                                                 ["method", "phase"], **histogram)
+        self.retries = prometheus_client.Counter("retries", "Повторы вызовов", ["method"], **options)
+        self.bytes = prometheus_client.Counter("bytes", "Объём данных вызовов", ["method", "direction"], **options)
+        self.raw_bytes = prometheus_client.Counter("raw_bytes", "Объём данных вызовов без сжатия",
+                                                   ["method", "direction"], **options)
+        self.server = prometheus_client.Histogram("server_seconds", "Время выполнения на портале (блок time)",
+                                                  ["method", "kind"], **histogram)
+
+    def on_call_end(self, event: CallEvent) -> None:
+        method = event.method
+        self.calls.labels(method, event.outcome).inc()
+        self.duration.labels(method).observe(event.duration)
+        if not event.cached:
+            for phase, seconds in event.phases().items():
+                self.phase.labels(method, phase).observe(seconds)
+        if event.retries:
+            self.retries.labels(method).inc(event.retries)
+        if event.bytes_out:
+            self.bytes.labels(method, "out").inc(event.bytes_out)
+        if event.bytes_in:
+            self.bytes.labels(method, "in").inc(event.bytes_in)
+        if event.bytes_out_raw:
+            self.raw_bytes.labels(method, "out").inc(event.bytes_out_raw)
+        if event.bytes_in_raw:
+            self.raw_bytes.labels(method, "in").inc(event.bytes_in_raw)
+        server_time = event.server_time or {}
+        for kind in ("duration", "processing"):
+            value = server_time.get(kind)
+            if isinstance(value, (int, float)):
+                self.server.labels(method, kind).observe(value)
+
+
+class OpenTelemetryHook(CallHook):
+    """
+    Span OpenTelemetry на каждый вызов.
+
+    Span (kind CLIENT) создаётся в текущем контексте трассировки и получает
+    атрибуты rpc.method, http.response.status_code, время фаз
+    (bitrix.phase.*), объём данных, число попыток и блок time сервера. Ошибка
+    вызова записывается в span со статусом ERROR. Требует пакет opentelemetry-api.
+
+    Example:
+        >>> client = BitrixClient(token="...", user_id=123, hooks=[OpenTelemetryHook()])
+    """
+
+    def __init__(self, tracer: Any = None, tracer_provider: Any = None) -> None:
+        """
+        Инициализация.
+
+        Args:
+            tracer: Готовый Tracer (по умолчанию trace.get_tracer("bitrix24_sdk"))
+            tracer_provider: TracerProvider для get_tracer (по умолчанию глобальный)
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError("Для трассировки нужен пакет opentelemetry-api: pip install bitrix24-sdk[otel]") from e
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("bitrix24_sdk", tracer_provider=tracer_provider)
+
+    def on_call_start(self, event: CallEvent) -> None:
+        event.context["otel_span"] = self.tracer.start_span(
+            f"bitrix {event.method}", kind=self._trace.SpanKind.CLIENT,
+            attributes={"rpc.system": "bitrix24", "rpc.method": event.method},
+        )
+
+    def on_call_end(self, event: CallEvent) -> None:
+        span = event.context.pop("otel_span", None)
+        if span is None:
+            return
+        attributes: Dict[str, Any] = {
+            "bitrix.attempts": event.attempts, "bitrix.cached": event.cached, "bitrix.coalesced": event.coalesced,
+            "bitrix.bytes_out": event.bytes_out, "bitrix.bytes_in": event.bytes_in,
+            "bitrix.bytes_out_raw": event.bytes_out_raw, "bitrix.bytes_in_raw": event.bytes_in_raw,
+            **{f"bitrix.phase.{phase}": seconds for phase, seconds in event.phases().items()},
+        }
+        if event.model is not None:
+            attributes["bitrix.model"] = event.model
+        if event.body_format is not None:
+            attributes["bitrix.body_format"] = event.body_format
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        server_time = event.server_time or {}
+        for kind in ("duration", "processing", "operating"):
+            value = server_time.get(kind)
+            if isinstance(value, (int, float)):
+                attributes[f"bitrix.server.{kind}"] = value
+        span.set_attributes(attributes)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(event.error)))
+        span.end()
@@ -0,0 +1,170 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from ..config.config import BitrixSettings, load_bitrix_settings
+from .body import BodyEncoder
+from .decoder import JsonDecoder
+from .http_client import BitrixClient
+from .instrumentation import HookLike, as_hooks
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .scheduling import FlowStats, PriorityScheduler, StrideScheduler
+from .transport import HttpTransport, TransportStats
+
+
+class BitrixClientPool:
+    """
+    Клиенты множества порталов и пользователей с общими соединениями.
+
+    Все клиенты пула используют один HttpTransport: по одному ограниченному
+    пулу соединений на хост (POOL_MAXSIZE, с ожиданием свободного соединения),
+    а не отдельную сессию на каждый токен. Ограничитель частоты запросов у
+    каждого портала свой, а одновременные запросы всех порталов делятся
+    StrideScheduler: слоты выдаются порталам по очереди пропорционально весам,
+    поэтому портал с сотнями запросов не задерживает остальные. Если задан
+    PRIORITY_CAPACITY, у каждого портала также свой PriorityScheduler,
+    общий для всех его клиентов.
+
+    Клиенты создаются лениво и запоминаются по (портал, пользователь, токен),
+    повторный вызов client() возвращает тот же клиент.
+
+    Example:
+        >>> with BitrixClientPool(max_in_flight=20) as pool:
+        ...     a = pool.client("token-a", 1, base_url="https://a.bitrix24.ru/rest")
+        ...     b = pool.client("token-b", 7, base_url="https://b.bitrix24.ru/rest", weight=2)
+        ...     a.crm.item_list(1040)
+        ...     print(pool.stats())
+    """
+
+    def __init__(self, settings: Optional[BitrixSettings] = None, max_in_flight: Optional[int] = None,
+                 transport: Optional[HttpTransport] = None, hooks: Optional[Sequence[HookLike]] = None,
+                 max_clients: int = 1024) -> None:
+        """
+        Инициализация пула.
+
+        Args:
+            settings: Общие настройки клиентов (BASE_URL — портал по умолчанию)
+            max_in_flight: Максимум одновременных запросов всех порталов (по умолчанию POOL_MAXSIZE)
+            transport: Общий транспорт (по умолчанию из настроек, с ожиданием свободного соединения)
+            hooks: Обработчики событий вызовов всех клиентов
+            max_clients: Сколько клиентов хранить; давно не запрошенные вытесняются
+        """
+        self.settings = settings or load_bitrix_settings()
+        if transport is None:
+            transport = HttpTransport.from_settings(self.settings.model_copy(update={"POOL_BLOCK": True}))
+        self.transport = transport
+        self.scheduler = StrideScheduler(max_in_flight or self.settings.POOL_MAXSIZE)
+        self.hooks = as_hooks(hooks)
+        self.max_clients = max_clients
+        # Не зависят от портала и не хранят состояния — общие для всех клиентов
+        self._retry_policy = RetryPolicy.from_settings(self.settings)
+        self._decoder = JsonDecoder.from_settings(self.settings)
+        self._body_encoder = BodyEncoder.from_settings(self.settings)
+        self._portals: Dict[str, Tuple[BitrixSettings, Optional[RateLimiter], Optional[PriorityScheduler]]] = {}
+        self._clients: "OrderedDict[Tuple[str, str, str], BitrixClient]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def client(self, token: str, user_id: int | str, base_url: Optional[str] = None,
+               weight: Optional[float] = None) -> BitrixClient:
+        """
+        Получить клиент пользователя портала.
+
+        Args:
+            token: Токен авторизации Bitrix24
+            user_id: ID пользователя
+            base_url: Адрес REST API портала (по умолчанию BASE_URL настроек)
+            weight: Доля портала в слотах запросов относительно других (по умолчанию 1)
+
+        Returns:
+            BitrixClient: Клиент с общим транспортом и ограничителем портала
+        """
+        base_url = (base_url or self.settings.BASE_URL).rstrip("/")
+        portal = portal_key(base_url)
+        key = (base_url, str(user_id), token)
+        with self._lock:
+            if weight is not None:
+                self.scheduler.set_weight(portal, weight)
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+            settings, rate_limiter, priority_scheduler = self._portal(base_url, portal)
+            client = BitrixClient(
+                token=token,
+                user_id=user_id,
+                settings=settings,
+                rate_limiter=rate_limiter,
+                retry_policy=self._retry_policy,
+                transport=self.transport,
+                decoder=self._decoder,
+                hooks=self.hooks,
+                body_encoder=self._body_encoder,
+                scheduler=self.scheduler.flow(portal),
+                priority_scheduler=priority_scheduler,
+            )
+            self._clients[key] = client
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+            return client
+
+    def set_weight(self, base_url: str, weight: float) -> None:
+        """Задать долю портала в слотах запросов."""
+        self.scheduler.set_weight(portal_key(base_url), weight)
+
+    def rate_limiter(self, base_url: Optional[str] = None) -> Optional[RateLimiter]:
+        """Ограничитель частоты запросов портала (None, если ограничение отключено)."""
+        base_url = (base_url or self.settings.BASE_URL).rstrip("/")
+        with self._lock:
+            return self._portal(base_url, portal_key(base_url))[1]
+
+    def priority_scheduler(self, base_url: Optional[str] = None) -> Optional[PriorityScheduler]:
+        """Планировщик классов приоритета портала (None, если PRIORITY_CAPACITY не задан)."""
+        base_url = (base_url or self.settings.BASE_URL).rstrip("/")
+        with self._lock:
+            return self._portal(base_url, portal_key(base_url))[2]
+
+    def _portal(self, base_url: str,
+                portal: str) -> Tuple[BitrixSettings, Optional[RateLimiter], Optional[PriorityScheduler]]:
+        """Настройки, ограничитель и планировщик приоритетов портала (создаются при первом обращении, под блокировкой)."""
+        entry = self._portals.get(base_url)
+        if entry is None:
+            update = {"BASE_URL": base_url}
+            if self.settings.RATE_LIMIT_FILE:
+                root, ext = os.path.splitext(self.settings.RATE_LIMIT_FILE)
+                update["RATE_LIMIT_FILE"] = f"{root}.{re.sub(r'[^A-Za-z0-9_.-]', '_', portal)}{ext}"
+            settings = self.settings.model_copy(update=update)
+            entry = self._portals[base_url] = (settings, RateLimiter.from_settings(settings),
+                                               PriorityScheduler.from_settings(settings))
+        return entry
+
+    def stats(self) -> Dict[str, FlowStats]:
+        """Очереди запросов по порталам: вес, выполняется, ждёт, выдано слотов и время ожидания."""
+        return {str(key): stats for key, stats in self.scheduler.stats().items()}
+
+    def transport_stats(self) -> TransportStats:
+        """Статистика переиспользования соединений общего транспорта."""
+        return self.transport.stats()
+
+    def close(self) -> None:
+        """Закрыть соединения и забыть клиентов."""
+        with self._lock:
+            self._clients.clear()
+        self.transport.close()
+
+    def __enter__(self) -> "BitrixClientPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+def portal_key(base_url: str) -> str:
+    """Портал по адресу REST API: хост (с портом, если он указан)."""
+    return urlsplit(base_url).netloc.lower() or base_url
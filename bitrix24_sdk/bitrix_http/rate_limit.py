@@ -0,0 +1,222 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, ContextManager, Dict, Iterator, Optional, Protocol
+
+from ..config.config import BitrixSettings
+
+
+class StateBackend(Protocol):
+    """Хранилище состояния ограничителя, доступ к которому сериализуется блокировкой."""
+
+    def transaction(self) -> ContextManager[Dict[str, Any]]:
+        """Захватить блокировку и вернуть изменяемое состояние, сохраняемое при выходе."""
+        ...
+
+
+class MemoryStateBackend:
+    """Состояние в памяти процесса, общее для всех потоков."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._state: Dict[str, Any] = {}
+
+    @contextmanager
+    def transaction(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            yield self._state
+
+
+class FileStateBackend:
+    """
+    Состояние в локальном файле, общее для нескольких процессов.
+
+    Доступ сериализуется через flock, поэтому все процессы, указавшие один
+    и тот же путь, делят один бюджет запросов к порталу.
+    """
+
+    def __init__(self, path: str) -> None:
+        try:
+            import fcntl  # noqa: F401
+        except ImportError as e:
+            raise RuntimeError("FileStateBackend требует POSIX-систему с поддержкой fcntl") from e
+        self._path = path
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def transaction(self) -> Iterator[Dict[str, Any]]:
+        import fcntl
+
+        with self._lock:
+            fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                with os.fdopen(os.dup(fd), "r+", encoding="utf-8") as f:
+                    content = f.read()
+                    try:
+                        state = json.loads(content) if content else {}
+                    except ValueError:
+                        state = {}
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+
+
+class RateLimiter:
+    """
+    Ограничитель частоты запросов к порталу Bitrix24.
+
+    Совмещает две квоты Bitrix:
+
+    - leaky bucket на количество запросов (по умолчанию 2 запроса в секунду
+      с накоплением до 50), реализованный как токен-бакет;
+    - лимит времени выполнения (operating) каждого метода за окно в 10 минут,
+      который учитывается по блокам time из ответов.
+
+    Метод reserve() не блокирует поток, а резервирует слот и возвращает время
+    ожидания, поэтому один ограничитель подходит и для потоков, и для asyncio.
+
+    Example:
+        >>> limiter = RateLimiter(rate=2.0, burst=50)
+        >>> client = BitrixClient(token="...", user_id=123)
+        >>> client.http.rate_limiter = limiter
+    """
+
+    def __init__(self, rate: float = 2.0, burst: int = 50, safety: float = 0.9,
+                 operating_limit: float = 480.0, operating_window: float = 600.0,
+                 backend: Optional[StateBackend] = None) -> None:
+        """
+        Инициализация ограничителя.
+
+        Args:
+            rate: Допустимое количество запросов в секунду
+            burst: Размер накопителя запросов
+            safety: Доля лимита, которую разрешено расходовать (запас до блокировки)
+            operating_limit: Лимит суммарного времени выполнения метода за окно, секунды
+            operating_window: Длительность окна учета operating, секунды
+            backend: Хранилище состояния (по умолчанию в памяти процесса)
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate должен быть больше 0, burst — не меньше 1")
+        if not 0 < safety <= 1:
+            raise ValueError("safety должен быть в диапазоне (0, 1]")
+        self.rate = rate * safety
+        self.burst = max(1.0, burst * safety)
+        self.operating_limit = operating_limit * safety
+        self.operating_window = operating_window
+        self._backend = backend or MemoryStateBackend()
+
+    @classmethod
+    def from_settings(cls, settings: BitrixSettings) -> Optional["RateLimiter"]:
+        """
+        Создать ограничитель по настройкам клиента.
+
+        Args:
+            settings: Настройки подключения
+
+        Returns:
+            RateLimiter или None, если ограничение отключено (RATE_LIMIT = null)
+        """
+        if settings.RATE_LIMIT is None:
+            return None
+        backend = FileStateBackend(settings.RATE_LIMIT_FILE) if settings.RATE_LIMIT_FILE else None
+        return cls(
+            rate=settings.RATE_LIMIT,
+            burst=settings.RATE_LIMIT_BURST,
+            safety=settings.RATE_LIMIT_SAFETY,
+            operating_limit=settings.OPERATING_LIMIT,
+            backend=backend,
+        )
+
+    def reserve(self, method: str) -> float:
+        """
+        Зарезервировать слот под запрос.
+
+        Args:
+            method: Название метода API
+
+        Returns:
+            Время в секундах, которое нужно выждать перед отправкой запроса
+        """
+        now = time.time()
+        with self._backend.transaction() as state:
+            tokens = state.get("tokens", self.burst)
+            updated = state.get("updated", now)
+            tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+            tokens -= 1
+            state["tokens"] = tokens
+            state["updated"] = now
+
+            delay = max(0.0, -tokens / self.rate)
+            delay = max(delay, state.get("blocked_until", 0.0) - now)
+
+            operating = state.get("operating", {}).get(method)
+            if operating is not None:
+                used, reset_at = operating
+                if reset_at <= now:
+                    state["operating"].pop(method, None)
+                elif used >= self.operating_limit:
+                    delay = max(delay, reset_at - now)
+        return delay
+
+    def acquire(self, method: str) -> float:
+        """
+        Дождаться разрешения на запрос, блокируя текущий поток.
+
+        Args:
+            method: Название метода API
+
+        Returns:
+            Фактическое время ожидания в секундах
+        """
+        delay = self.reserve(method)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def record(self, method: str, time_info: Optional[Dict[str, Any]]) -> None:
+        """
+        Учесть блок time из ответа Bitrix.
+
+        Args:
+            method: Название метода API
+            time_info: Блок time ответа (operating, operating_reset_at)
+        """
+        if not isinstance(time_info, dict) or time_info.get("operating") is None:
+            return
+        now = time.time()
+        used = float(time_info["operating"])
+        reset_at = time_info.get("operating_reset_at")
+        reset_at = float(reset_at) if reset_at else now + self.operating_window
+        with self._backend.transaction() as state:
+            state.setdefault("operating", {})[method] = [used, reset_at]
+
+    def penalize(self, method: Optional[str] = None, retry_after: Optional[float] = None) -> None:
+        """
+        Учесть ответ портала о превышении лимита.
+
+        Без метода — исчерпан общий бюджет запросов (QUERY_LIMIT_EXCEEDED): накопитель
+        обнуляется. С методом — исчерпан лимит operating (OPERATION_TIME_LIMIT): метод
+        блокируется до конца окна.
+
+        Args:
+            method: Название метода, превысившего лимит operating
+            retry_after: Время блокировки в секундах, если его сообщил сервер
+        """
+        now = time.time()
+        with self._backend.transaction() as state:
+            if method is None:
+                state["tokens"] = 0.0
+                state["updated"] = now
+                if retry_after:
+                    state["blocked_until"] = max(state.get("blocked_until", 0.0), now + retry_after)
+            else:
+                reset_at = now + (retry_after if retry_after else self.operating_window)
+                state.setdefault("operating", {})[method] = [self.operating_limit, reset_at]
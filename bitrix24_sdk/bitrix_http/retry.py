@@ -0,0 +1,114 @@
+import random
+import sys
+from fnmatch import fnmatchcase
+from typing import Iterable, Optional
+
+from ..config.config import BitrixSettings, DEFAULT_RETRY_METHODS
+from .errors import OperationTimeLimit, QueryLimitExceeded, ServerError
+
+
+class RetryPolicy:
+    """
+    Политика повторов временно неудачных вызовов.
+
+    Повторяются только временные ошибки (лимиты, 5xx, сетевые сбои) и только
+    для идемпотентных методов из списка. QUERY_LIMIT_EXCEEDED повторяется для
+    любого метода: портал отклоняет такой запрос до выполнения.
+
+    Example:
+        >>> policy = RetryPolicy(max_attempts=5, extra_methods=["disk.folder.addsubfolder"])
+        >>> client.http.retry_policy = policy
+    """
+
+    def __init__(self, max_attempts: int = 3, backoff: float = 0.5, backoff_max: float = 30.0,
+                 jitter: bool = True, respect_retry_after: bool = True,
+                 methods: Iterable[str] = DEFAULT_RETRY_METHODS, extra_methods: Iterable[str] = ()) -> None:
+        """
+        Инициализация политики.
+
+        Args:
+            max_attempts: Максимум попыток, включая первую
+            backoff: Базовая пауза экспоненциального роста, секунды
+            backoff_max: Максимальная пауза между попытками, секунды
+            jitter: Добавлять случайный разброс паузы (full jitter)
+            respect_retry_after: Учитывать заголовок Retry-After
+            methods: Шаблоны методов (fnmatch), которые можно повторять
+            extra_methods: Дополнительно разрешённые неидемпотентные методы
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts должен быть не меньше 1")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.methods = tuple(methods) + tuple(extra_methods)
+
+    @classmethod
+    def from_settings(cls, settings: BitrixSettings) -> "RetryPolicy":
+        """
+        Создать политику по настройкам клиента.
+
+        Args:
+            settings: Настройки подключения
+
+        Returns:
+            RetryPolicy: Политика повторов
+        """
+        return cls(
+            max_attempts=settings.RETRY_MAX_ATTEMPTS,
+            backoff=settings.RETRY_BACKOFF,
+            backoff_max=settings.RETRY_BACKOFF_MAX,
+            jitter=settings.RETRY_JITTER,
+            methods=settings.RETRY_METHODS,
+            extra_methods=settings.RETRY_EXTRA_METHODS,
+        )
+
+    def is_idempotent(self, method: str) -> bool:
+        """Метод разрешён к повтору."""
+        return any(fnmatchcase(method, pattern) for pattern in self.methods)
+
+    def is_transient(self, exc: BaseException) -> bool:
+        """Ошибка временная, и повтор может пройти успешно."""
+        if isinstance(exc, (QueryLimitExceeded, OperationTimeLimit, ServerError)):
+            return True
+        # Ошибки транспортов проверяются, только если библиотека уже загружена: иначе их не может быть
+        requests = sys.modules.get("requests")
+        if requests is not None and isinstance(
+                exc, (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)):
+            return True
+        httpx = sys.modules.get("httpx")
+        return httpx is not None and isinstance(exc, httpx.TransportError)
+
+    def should_retry(self, method: str, exc: BaseException, attempt: int) -> bool:
+        """
+        Решить, нужно ли повторить вызов.
+
+        Args:
+            method: Название метода API
+            exc: Ошибка попытки
+            attempt: Номер завершившейся попытки (с 1)
+
+        Returns:
+            True, если вызов нужно повторить
+        """
+        if attempt >= self.max_attempts or not self.is_transient(exc):
+            return False
+        return isinstance(exc, QueryLimitExceeded) or self.is_idempotent(method)
+
+    def delay(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        """
+        Пауза перед следующей попыткой.
+
+        Args:
+            attempt: Номер завершившейся попытки (с 1)
+            exc: Ошибка попытки
+
+        Returns:
+            Пауза в секундах
+        """
+        retry_after = getattr(exc, "retry_after", None)
+        if self.respect_retry_after and retry_after:
+            return min(float(retry_after), self.backoff_max)
+        delay = min(self.backoff_max, self.backoff * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
@@ -0,0 +1,567 @@
+import heapq
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from fnmatch import fnmatchcase
+from typing import (Any, AsyncIterator, ContextManager, Deque, Dict, Hashable, Iterator, List, Mapping, NamedTuple,
+                    Optional, Protocol, Tuple, Type, TypeVar, TYPE_CHECKING)
+
+from pydantic import BaseModel, Field
+
+from ..config.config import BitrixSettings, DEFAULT_PRIORITY_WEIGHTS
+
+if TYPE_CHECKING:
+    import asyncio
+
+STRIDE1 = float(1 << 20)
+"""Шаг очереди с весом 1; у очереди с весом w шаг STRIDE1 / w."""
+
+
+class CallScheduler(Protocol):
+    """Планировщик, выдающий вызову слот на выполнение HTTP-запроса."""
+
+    def slot(self, method: str) -> ContextManager[float]:
+        """Дождаться слота; значение контекста — время ожидания в секундах."""
+        ...
+
+
+class FlowStats(BaseModel):
+    """Статистика очереди планировщика."""
+    weight: float = Field(..., description="Вес очереди")
+    in_flight: int = Field(0, description="Запросов выполняется")
+    queued: int = Field(0, description="Запросов ждёт слота")
+    dispatched: int = Field(0, description="Слотов выдано")
+    waited: float = Field(0.0, description="Суммарное ожидание слотов, секунды")
+
+
+class _Flow:
+    """Очередь одного потока запросов (арендатора или класса приоритета)."""
+
+    __slots__ = ("key", "weight", "stride", "pass_", "waiters", "in_flight", "dispatched", "waited", "version")
+
+    def __init__(self, key: Hashable, weight: float) -> None:
+        self.key = key
+        self.waiters: Deque[Any] = deque()
+        self.pass_ = 0.0
+        self.in_flight = 0
+        self.dispatched = 0
+        self.waited = 0.0
+        self.version = 0
+        self.set_weight(weight)
+
+    def set_weight(self, weight: float) -> None:
+        if weight <= 0:
+            raise ValueError("weight должен быть больше 0")
+        self.weight = weight
+        self.stride = STRIDE1 / weight
+
+
+class StrideQueue:
+    """
+    Ядро stride-планирования без блокировок и ожидания.
+
+    Одновременно выполняется не больше capacity запросов. Пока слоты есть и
+    никто не ждёт, слот выдаётся сразу; иначе ожидающий ставится в очередь
+    своего потока, а освободившийся слот получает поток с наименьшим pass.
+    После каждого слота pass потока растёт на STRIDE1 / weight, поэтому потоки
+    получают слоты пропорционально весам. Поток, простаивавший без запросов,
+    начинает с текущего виртуального времени и не копит «долг» слотов.
+
+    Вызывающий код сам сериализует доступ (StrideScheduler — блокировкой).
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity должен быть не меньше 1")
+        self.capacity = capacity
+        self.in_flight = 0
+        self.flows: Dict[Hashable, _Flow] = {}
+        self._ready: List[Tuple[float, int, int, _Flow]] = []
+        self._seq = 0
+        self._vtime = 0.0
+
+    def flow(self, key: Hashable, weight: Optional[float] = None) -> _Flow:
+        """Очередь потока key (создаётся при первом обращении, weight обновляет вес)."""
+        flow = self.flows.get(key)
+        if flow is None:
+            flow = self.flows[key] = _Flow(key, weight or 1.0)
+        elif weight is not None and weight != flow.weight:
+            flow.set_weight(weight)
+        return flow
+
+    def admit(self, flow: _Flow) -> bool:
+        """Выдать слот сразу, если он свободен и очередь пуста."""
+        while self._ready and self._ready[0][2] != self._ready[0][3].version:
+            heapq.heappop(self._ready)
+        if self.in_flight >= self.capacity or self._ready:
+            return False
+        self._activate(flow)
+        self._grant(flow)
+        return True
+
+    def enqueue(self, flow: _Flow, waiter: Any) -> None:
+        """Поставить ожидающего в очередь потока."""
+        if not flow.waiters:
+            self._activate(flow)
+            self._push(flow)
+        flow.waiters.append(waiter)
+
+    def discard(self, flow: _Flow, waiter: Any) -> bool:
+        """Убрать ожидающего из очереди (дедлайн или отмена); False — его там уже нет."""
+        try:
+            flow.waiters.remove(waiter)
+        except ValueError:
+            return False
+        if not flow.waiters:
+            flow.version += 1
+        return True
+
+    def drain(self, flow: _Flow) -> List[Any]:
+        """Убрать из очереди потока всех ожидающих и вернуть их."""
+        waiters = list(flow.waiters)
+        flow.waiters.clear()
+        flow.version += 1
+        return waiters
+
+    def release(self, flow: _Flow) -> Optional[Tuple[_Flow, Any]]:
+        """
+        Вернуть слот потока flow.
+
+        Returns:
+            (поток, ожидающий), которому передан слот, или None
+        """
+        self.in_flight -= 1
+        flow.in_flight -= 1
+        return self.dispatch()
+
+    def dispatch(self) -> Optional[Tuple[_Flow, Any]]:
+        """Передать свободный слот первому ожидающему потока с наименьшим pass."""
+        while self.in_flight < self.capacity and self._ready:
+            _, _, version, flow = heapq.heappop(self._ready)
+            if version != flow.version or not flow.waiters:
+                continue
+            waiter = flow.waiters.popleft()
+            self._grant(flow)
+            if flow.waiters:
+                self._push(flow)
+            else:
+                flow.version += 1
+            return flow, waiter
+        return None
+
+    def _activate(self, flow: _Flow) -> None:
+        flow.pass_ = max(flow.pass_, self._vtime)
+
+    def _grant(self, flow: _Flow) -> None:
+        self._vtime = max(self._vtime, flow.pass_)
+        flow.pass_ += flow.stride
+        flow.in_flight += 1
+        flow.dispatched += 1
+        self.in_flight += 1
+
+    def _push(self, flow: _Flow) -> None:
+        flow.version += 1
+        self._seq += 1
+        heapq.heappush(self._ready, (flow.pass_, self._seq, flow.version, flow))
+
+
+class StrideScheduler:
+    """
+    Справедливое распределение ограниченного числа одновременных запросов между потоками.
+
+    Потоками (flow) могут быть порталы, пользователи или классы запросов:
+    у каждого своя очередь, а слоты делятся пропорционально весам, поэтому
+    поток с сотнями запросов в очереди не задерживает остальные дольше,
+    чем на свою долю.
+
+    Example:
+        >>> scheduler = StrideScheduler(capacity=20)
+        >>> with scheduler.slot("portal-a.bitrix24.ru", weight=2):
+        ...     resp = transport.post(url, data=body)
+    """
+
+    def __init__(self, capacity: int = 10) -> None:
+        """
+        Инициализация.
+
+        Args:
+            capacity: Максимум одновременно выполняющихся запросов
+        """
+        self._core = StrideQueue(capacity)
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """Максимум одновременно выполняющихся запросов."""
+        return self._core.capacity
+
+    def set_weight(self, key: Hashable, weight: float) -> None:
+        """Задать вес потока."""
+        with self._lock:
+            self._core.flow(key, weight)
+
+    def acquire(self, key: Hashable, weight: Optional[float] = None) -> float:
+        """
+        Дождаться слота для потока key.
+
+        Args:
+            key: Поток запросов
+            weight: Вес потока (None — оставить текущий, для нового потока 1)
+
+        Returns:
+            Время ожидания в секундах
+        """
+        with self._lock:
+            flow = self._core.flow(key, weight)
+            if self._core.admit(flow):
+                return 0.0
+            waiter = threading.Event()
+            self._core.enqueue(flow, waiter)
+        started = time.perf_counter()
+        waiter.wait()
+        waited = time.perf_counter() - started
+        with self._lock:
+            flow.waited += waited
+        return waited
+
+    def release(self, key: Hashable) -> None:
+        """Вернуть слот потока key."""
+        with self._lock:
+            granted = self._core.release(self._core.flows[key])
+            if granted is not None:
+                granted[1].set()
+
+    @contextmanager
+    def slot(self, key: Hashable, weight: Optional[float] = None) -> Iterator[float]:
+        """Занять слот на время блока; значение — время ожидания в секундах."""
+        waited = self.acquire(key, weight)
+        try:
+            yield waited
+        finally:
+            self.release(key)
+
+    def flow(self, key: Hashable, weight: Optional[float] = None) -> "ScheduledFlow":
+        """Планировщик вызовов клиента, все запросы которого идут в поток key."""
+        if weight is not None:
+            self.set_weight(key, weight)
+        return ScheduledFlow(self, key)
+
+    def stats(self) -> Dict[Hashable, FlowStats]:
+        """Статистика по потокам."""
+        with self._lock:
+            return {
+                key: FlowStats(weight=flow.weight, in_flight=flow.in_flight, queued=len(flow.waiters),
+                               dispatched=flow.dispatched, waited=round(flow.waited, 6))
+                for key, flow in self._core.flows.items()
+            }
+
+
+class ScheduledFlow:
+    """Поток StrideScheduler, привязанный к клиенту (реализует CallScheduler)."""
+
+    __slots__ = ("scheduler", "key")
+
+    def __init__(self, scheduler: StrideScheduler, key: Hashable) -> None:
+        self.scheduler = scheduler
+        self.key = key
+
+    def slot(self, method: str) -> ContextManager[float]:
+        return self.scheduler.slot(self.key)
+
+    def __repr__(self) -> str:
+        return f"ScheduledFlow({self.key!r})"
+
+
+class DeadlineExceeded(TimeoutError):
+    """Вызов не получил слот планировщика приоритетов до дедлайна."""
+
+
+class CallCancelled(RuntimeError):
+    """Ожидание слота отменено через PriorityScheduler.cancel()."""
+
+
+class CallPriority(NamedTuple):
+    """Класс приоритета вызовов текущего контекста."""
+    name: str
+    deadline: Optional[float] = None
+
+
+_current: ContextVar[Optional[CallPriority]] = ContextVar("bitrix_priority", default=None)
+
+
+@contextmanager
+def priority(name: str, deadline: Optional[float] = None, override: bool = True) -> Iterator[CallPriority]:
+    """
+    Выполнять вызовы блока с классом приоритета name.
+
+    Класс хранится в contextvars, поэтому действует и в корутинах, и в
+    потоках выгрузки и обхода, которые SDK запускает из этого блока.
+
+    Args:
+        name: Класс приоритета (interactive, normal, bulk или свой из PRIORITY_WEIGHTS)
+        deadline: Сколько секунд вызов может ждать слота (None — по настройкам класса)
+        override: Заменить класс, заданный внешним блоком (False — только если он не задан)
+
+    Example:
+        >>> with priority("bulk"):
+        ...     client.crm.export_items(1040, sink)
+        >>> with priority("interactive", deadline=2.0):
+        ...     client.disk.get_file(file_id)
+    """
+    current = _current.get()
+    if current is not None and not override:
+        yield current
+        return
+    value = CallPriority(name, deadline)
+    token = _current.set(value)
+    try:
+        yield value
+    finally:
+        _current.reset(token)
+
+
+def current_priority() -> Optional[CallPriority]:
+    """Класс приоритета, заданный блоком priority(), или None."""
+    return _current.get()
+
+
+S = TypeVar("S", bound="_PriorityQueue")
+
+
+class _PriorityQueue:
+    """Классы приоритета поверх StrideQueue: классификация вызовов, дедлайны и статистика."""
+
+    def __init__(self, capacity: int = 2, weights: Optional[Mapping[str, float]] = None,
+                 methods: Optional[Mapping[str, str]] = None, default: str = "normal",
+                 deadlines: Optional[Mapping[str, float]] = None) -> None:
+        """
+        Инициализация.
+
+        Args:
+            capacity: Сколько вызовов одновременно проходят ограничитель частоты и отправку
+            weights: Классы приоритета и их доли (по умолчанию interactive 8, normal 4, bulk 1)
+            methods: Класс по шаблону метода (fnmatch), например {"crm.item.list": "bulk"}
+            default: Класс вызовов вне блока priority() и без шаблона
+            deadlines: Сколько секунд вызовы класса могут ждать слота
+        """
+        weights = dict(weights or DEFAULT_PRIORITY_WEIGHTS)
+        methods = dict(methods or {})
+        deadlines = dict(deadlines or {})
+        unknown = {default, *methods.values(), *deadlines} - set(weights)
+        if unknown:
+            raise ValueError(f"Неизвестные классы приоритета: {', '.join(sorted(unknown))}")
+        self._core = StrideQueue(capacity)
+        for name, weight in weights.items():
+            self._core.flow(name, weight)
+        self.methods = methods
+        self.default = default
+        self.deadlines = deadlines
+
+    @classmethod
+    def from_settings(cls: Type[S], settings: BitrixSettings) -> Optional[S]:
+        """
+        Создать планировщик по настройкам клиента.
+
+        Returns:
+            Планировщик или None, если PRIORITY_CAPACITY не задан
+        """
+        if settings.PRIORITY_CAPACITY is None:
+            return None
+        return cls(
+            capacity=settings.PRIORITY_CAPACITY,
+            weights=settings.PRIORITY_WEIGHTS,
+            methods=settings.PRIORITY_METHODS,
+            default=settings.PRIORITY_DEFAULT,
+            deadlines=settings.PRIORITY_DEADLINES,
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Сколько вызовов одновременно проходят ограничитель частоты и отправку."""
+        return self._core.capacity
+
+    def classify(self, method: str) -> CallPriority:
+        """Класс и дедлайн вызова: блок priority(), затем шаблоны методов, затем класс по умолчанию."""
+        current = _current.get()
+        if current is not None:
+            name = current.name
+            if name not in self._core.flows:
+                raise ValueError(f"Неизвестный класс приоритета: {name}")
+            deadline = current.deadline
+        else:
+            name = next((cls for pattern, cls in self.methods.items() if fnmatchcase(method, pattern)), self.default)
+            deadline = None
+        return CallPriority(name, deadline if deadline is not None else self.deadlines.get(name))
+
+    def _stats(self) -> Dict[str, FlowStats]:
+        return {
+            key: FlowStats(weight=flow.weight, in_flight=flow.in_flight, queued=len(flow.waiters),
+                           dispatched=flow.dispatched, waited=round(flow.waited, 6))
+            for key, flow in self._core.flows.items()
+        }
+
+    def _drain(self, name: Optional[str]) -> List[Any]:
+        flows = self._core.flows.values() if name is None else [self._core.flows[name]]
+        return [waiter for flow in flows for waiter in self._core.drain(flow)]
+
+
+class _Waiter:
+    __slots__ = ("event", "granted", "cancelled")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.granted = False
+        self.cancelled = False
+
+
+class PriorityScheduler(_PriorityQueue):
+    """
+    Планировщик вызовов по классам приоритета (для потоков).
+
+    Вызов занимает слот до ограничителя частоты запросов и держит его до
+    получения ответа, поэтому массовая выгрузка не может зарезервировать
+    бюджет портала на сотни запросов вперёд: одновременно выполняется не
+    больше capacity вызовов, а освободившийся слот получает класс с
+    наименьшим pass (stride scheduling по весам классов). Вызов, не
+    получивший слот до дедлайна, завершается DeadlineExceeded; cancel()
+    прерывает ожидающие вызовы с CallCancelled.
+
+    Example:
+        >>> scheduler = PriorityScheduler(capacity=2, methods={"crm.item.list": "bulk"})
+        >>> client = BitrixClient(token="...", user_id=123, priority_scheduler=scheduler)
+        >>> with priority("interactive", deadline=2.0):
+        ...     client.disk.get_file(file_id)
+    """
+
+    def __init__(self, capacity: int = 2, weights: Optional[Mapping[str, float]] = None,
+                 methods: Optional[Mapping[str, str]] = None, default: str = "normal",
+                 deadlines: Optional[Mapping[str, float]] = None) -> None:
+        super().__init__(capacity, weights, methods, default, deadlines)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, method: str) -> Iterator[float]:
+        """
+        Занять слот на время блока.
+
+        Args:
+            method: Метод API (для классификации по шаблонам)
+
+        Yields:
+            Время ожидания слота в секундах
+
+        Raises:
+            DeadlineExceeded: Слот не получен до дедлайна класса
+            CallCancelled: Ожидание отменено cancel()
+        """
+        cls, deadline = self.classify(method)
+        waited = 0.0
+        with self._lock:
+            flow = self._core.flows[cls]
+            waiter = None if self._core.admit(flow) else _Waiter()
+            if waiter is not None:
+                self._core.enqueue(flow, waiter)
+        if waiter is not None:
+            started = time.perf_counter()
+            waiter.event.wait(deadline)
+            waited = time.perf_counter() - started
+            with self._lock:
+                flow.waited += waited
+                if not waiter.granted:
+                    self._core.discard(flow, waiter)
+                    if waiter.cancelled:
+                        raise CallCancelled(f"Ожидание слота для {method} отменено")
+                    raise DeadlineExceeded(f"{method}: нет слота класса {cls} за {deadline} с")
+        try:
+            yield waited
+        finally:
+            with self._lock:
+                granted = self._core.release(flow)
+                if granted is not None:
+                    granted[1].granted = True
+                    granted[1].event.set()
+
+    def cancel(self, name: Optional[str] = None) -> int:
+        """
+        Прервать ожидающие вызовы класса name (None — всех классов) с CallCancelled.
+
+        Returns:
+            Количество прерванных вызовов
+        """
+        with self._lock:
+            waiters = self._drain(name)
+            for waiter in waiters:
+                waiter.cancelled = True
+                waiter.event.set()
+        return len(waiters)
+
+    def stats(self) -> Dict[str, FlowStats]:
+        """Статистика по классам приоритета."""
+        with self._lock:
+            return self._stats()
+
+
+class AsyncPriorityScheduler(_PriorityQueue):
+    """
+    Асинхронный вариант PriorityScheduler для одного event loop.
+
+    Отмена задачи, ожидающей слот, убирает её из очереди.
+
+    Example:
+        >>> scheduler = AsyncPriorityScheduler(capacity=4)
+        >>> client = AsyncBitrixClient(token="...", user_id=123, priority_scheduler=scheduler)
+    """
+
+    @asynccontextmanager
+    async def slot(self, method: str) -> AsyncIterator[float]:
+        """Занять слот на время блока (см. PriorityScheduler.slot)."""
+        import asyncio
+        cls, deadline = self.classify(method)
+        flow = self._core.flows[cls]
+        waited = 0.0
+        if not self._core.admit(flow):
+            waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+            self._core.enqueue(flow, waiter)
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter), deadline)
+            except BaseException as e:
+                if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                    # Слот уже выдан: вернуть его следующему
+                    self._release(flow)
+                else:
+                    self._core.discard(flow, waiter)
+                    waiter.cancel()
+                if isinstance(e, asyncio.TimeoutError):
+                    raise DeadlineExceeded(f"{method}: нет слота класса {cls} за {deadline} с") from None
+                raise
+            finally:
+                waited = time.perf_counter() - started
+                flow.waited += waited
+        try:
+            yield waited
+        finally:
+            self._release(flow)
+
+    def _release(self, flow: _Flow) -> None:
+        granted = self._core.release(flow)
+        while granted is not None:
+            waiter = granted[1]
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+            granted = self._core.release(granted[0])
+
+    def cancel(self, name: Optional[str] = None) -> int:
+        """Прервать ожидающие вызовы класса name (None — всех классов) с CallCancelled."""
+        waiters = self._drain(name)
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(CallCancelled("Ожидание слота отменено"))
+        return len(waiters)
+
+    def stats(self) -> Dict[str, FlowStats]:
+        """Статистика по классам приоритета."""
+        return self._stats()
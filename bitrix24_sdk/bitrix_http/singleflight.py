@@ -0,0 +1,163 @@
+import threading
+from fnmatch import fnmatchcase
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Sequence, Type, TypeVar, TYPE_CHECKING
+
+from pydantic import BaseModel
+
+from ..config.config import BitrixSettings
+from .cache import _cache_key
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """Выполняющийся вызов, результат которого ждут остальные потоки."""
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _Coalescer:
+    """Общая часть: выбор методов и ключ вызова."""
+
+    def __init__(self, methods: Iterable[str]) -> None:
+        self.methods = tuple(methods)
+        self.shared = 0
+
+    def applies(self, method: str) -> bool:
+        """Одинаковые одновременные вызовы метода объединяются."""
+        return any(fnmatchcase(method, pattern) for pattern in self.methods)
+
+    @staticmethod
+    def key(method: str, params: Optional[Dict[str, Any]], model: Type[BaseModel], mode: str = "model",
+            fields: Optional[Sequence[str]] = None) -> str:
+        """Ключ вызова: метод, нормализованные параметры, модель и режим разбора ответа."""
+        projection = ",".join(fields) if fields is not None else "*"
+        return f"{model.__module__}.{model.__qualname__}:{mode}:{projection}:{_cache_key(method, params)}"
+
+
+class SingleFlight(_Coalescer):
+    """
+    Объединение одинаковых одновременных вызовов методов чтения (single-flight).
+
+    Пока первый поток выполняет запрос, остальные потоки с тем же методом и
+    параметрами не отправляют свои запросы, а ждут его и получают тот же
+    результат (тот же экземпляр модели) или ту же ошибку. Повторный вызов
+    после завершения запроса отправляется заново.
+
+    Example:
+        >>> client = BitrixClient(token="...", user_id=123,
+        ...                       single_flight=SingleFlight(["crm.type.list", "disk.file.get"]))
+    """
+
+    def __init__(self, methods: Iterable[str]) -> None:
+        """
+        Инициализация.
+
+        Args:
+            methods: Шаблоны методов (fnmatch), вызовы которых объединяются
+        """
+        super().__init__(methods)
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+
+    @classmethod
+    def from_settings(cls, settings: BitrixSettings) -> Optional["SingleFlight"]:
+        """
+        Создать объединитель по настройкам клиента.
+
+        Returns:
+            SingleFlight или None, если список COALESCE_METHODS пуст
+        """
+        return cls(settings.COALESCE_METHODS) if settings.COALESCE_METHODS else None
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Выполнить fn или дождаться уже выполняющегося вызова с тем же ключом.
+
+        Args:
+            key: Ключ вызова
+            fn: Выполнение запроса
+
+        Returns:
+            Результат fn, общий для всех ожидавших потоков
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.shared += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.event.set()
+
+
+class AsyncSingleFlight(_Coalescer):
+    """
+    Асинхронный вариант SingleFlight для одного event loop.
+
+    Запрос выполняется отдельной задачей, поэтому отмена одного из ожидающих
+    вызовов не отменяет запрос для остальных.
+    """
+
+    def __init__(self, methods: Iterable[str]) -> None:
+        """
+        Инициализация.
+
+        Args:
+            methods: Шаблоны методов (fnmatch), вызовы которых объединяются
+        """
+        super().__init__(methods)
+        self._flights: Dict[str, "asyncio.Future[Any]"] = {}
+
+    @classmethod
+    def from_settings(cls, settings: BitrixSettings) -> Optional["AsyncSingleFlight"]:
+        """
+        Создать объединитель по настройкам клиента.
+
+        Returns:
+            AsyncSingleFlight или None, если список COALESCE_METHODS пуст
+        """
+        return cls(settings.COALESCE_METHODS) if settings.COALESCE_METHODS else None
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Выполнить fn или дождаться уже выполняющегося вызова с тем же ключом.
+
+        Args:
+            key: Ключ вызова
+            fn: Корутина выполнения запроса
+
+        Returns:
+            Результат fn, общий для всех ожидавших задач
+        """
+        import asyncio
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(fn())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda done: self._flights.get(key) is done and self._flights.pop(key))
+        else:
+            self.shared += 1
+        return await asyncio.shield(flight)
@@ -0,0 +1,143 @@
+from typing import Any, Optional, Tuple
+
+import requests
+from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+
+from ..config.config import BitrixSettings
+
+
+class TransportStats(BaseModel):
+    """Статистика использования пула соединений."""
+    requests: int = Field(0, description="Количество отправленных запросов")
+    connections_opened: int = Field(0, description="Количество открытых TCP/TLS соединений")
+    pools: int = Field(0, description="Количество пулов (по одному на хост)")
+
+    @property
+    def reused(self) -> int:
+        """Количество запросов, отправленных через уже открытое соединение."""
+        return max(0, self.requests - self.connections_opened)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Доля запросов, переиспользовавших соединение."""
+        return self.reused / self.requests if self.requests else 0.0
+
+
+class HttpTransport:
+    """
+    Общий HTTP-транспорт с пулом соединений.
+
+    Через него идут вызовы REST API, загрузка файлов по uploadUrl и скачивание
+    по DOWNLOAD_URL, поэтому соединения с порталом переиспользуются
+    (keep-alive), а каждый запрос ограничен таймаутами подключения и чтения.
+
+    Example:
+        >>> transport = HttpTransport(pool_maxsize=20, connect_timeout=5, read_timeout=120)
+        >>> client = BitrixClient(token="...", user_id=123, transport=transport)
+        >>> print(transport.stats().reuse_ratio)
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                 connect_timeout: float = 10.0, read_timeout: float = 60.0, keep_alive: bool = True,
+                 session: Optional[requests.Session] = None) -> None:
+        """
+        Инициализация транспорта.
+
+        Args:
+            pool_connections: Количество хостов, для которых хранятся пулы соединений
+            pool_maxsize: Максимум соединений в пуле одного хоста
+            pool_block: Ждать свободного соединения вместо открытия сверх pool_maxsize
+            connect_timeout: Таймаут подключения, секунды
+            read_timeout: Таймаут чтения ответа, секунды
+            keep_alive: Держать соединения открытыми между запросами
+            session: Готовая HTTP-сессия (адаптеры пула не подменяются)
+        """
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.keep_alive = keep_alive
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        self.session = session
+
+    @classmethod
+    def from_settings(cls, settings: BitrixSettings, session: Optional[requests.Session] = None) -> "HttpTransport":
+        """
+        Создать транспорт по настройкам клиента.
+
+        Args:
+            settings: Настройки подключения
+            session: Готовая HTTP-сессия (опционально)
+
+        Returns:
+            HttpTransport: Транспорт с пулом соединений
+        """
+        return cls(
+            pool_connections=settings.POOL_CONNECTIONS,
+            pool_maxsize=settings.POOL_MAXSIZE,
+            pool_block=settings.POOL_BLOCK,
+            connect_timeout=settings.CONNECT_TIMEOUT or settings.TIMEOUT,
+            read_timeout=settings.READ_TIMEOUT or settings.TIMEOUT,
+            keep_alive=settings.KEEP_ALIVE,
+            session=session,
+        )
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """Таймауты (подключение, чтение) для requests."""
+        return self.connect_timeout, self.read_timeout
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Выполнить HTTP-запрос через пул соединений.
+
+        Args:
+            method: HTTP-метод
+            url: Абсолютный URL
+            **kwargs: Аргументы requests.Session.request
+
+        Returns:
+            requests.Response: Ответ сервера
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Выполнить POST-запрос через пул соединений."""
+        return self.request("POST", url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Выполнить GET-запрос через пул соединений."""
+        return self.request("GET", url, **kwargs)
+
+    def stats(self) -> TransportStats:
+        """
+        Получить статистику переиспользования соединений.
+
+        Returns:
+            TransportStats: Счётчики запросов и открытых соединений по всем пулам
+        """
+        stats = TransportStats()
+        seen = set()
+        for adapter in self.session.adapters.values():
+            manager = getattr(adapter, "poolmanager", None)
+            if manager is None or id(manager) in seen:
+                continue
+            seen.add(id(manager))
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+                if pool is None:
+                    continue
+                stats.pools += 1
+                stats.requests += getattr(pool, "num_requests", 0)
+                stats.connections_opened += getattr(pool, "num_connections", 0)
+        return stats
+
+    def close(self) -> None:
+        """Закрыть все соединения пула."""
+        self.session.close()
@@ -1,3 +1,3 @@
-from .config import BitrixSettings, load_bitrix_settings
+from .config import BitrixSettings, clear_settings_cache, load_bitrix_settings
 
-__all__ = ["BitrixSettings", "load_bitrix_settings"]
+__all__ = ["BitrixSettings", "clear_settings_cache", "load_bitrix_settings"]
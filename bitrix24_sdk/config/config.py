@@ -1,4 +1,6 @@
 import os
+import threading
+from typing import Dict, List, Literal, Optional, Tuple
 from pydantic import BaseModel, Field, Extra
 from json import JSONDecodeError
 
@@ -6,6 +8,20 @@ from json import JSONDecodeError
 CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_CONFIG_PATH = os.path.join(CONFIG_DIR, "bitrix_settings.json")
 
+_settings_cache: Dict[str, Tuple[Tuple[int, int], "BitrixSettings"]] = {}
+_settings_lock = threading.Lock()
+
+DEFAULT_RETRY_METHODS = (
+    "*.list", "*.get", "*.getlist", "*.getchildren", "*.fields", "*.getfields", "methods", "scope",
+)
+
+DEFAULT_PRIORITY_WEIGHTS = {"interactive": 8.0, "normal": 4.0, "bulk": 1.0}
+
+DEFAULT_CACHE_TTLS = {
+    "disk.folder.get": 60, "disk.storage.get": 300, "disk.storage.getlist": 300,
+    "crm.type.list": 300, "crm.type.get": 300, "crm.item.fields": 600, "methods": 3600, "scope": 3600,
+}
+
 
 class BitrixSettings(BaseModel, extra="forbid"):
     """
@@ -14,18 +30,97 @@ class BitrixSettings(BaseModel, extra="forbid"):
     Attributes:
         BASE_URL: Базовый URL для API Bitrix24
         TIMEOUT: Таймаут для HTTP запросов в секундах
+        MAX_CONCURRENCY: Максимум одновременных запросов асинхронного клиента
+        RATE_LIMIT: Допустимое количество запросов в секунду (null — без ограничения)
+        RATE_LIMIT_BURST: Размер накопителя запросов портала
+        RATE_LIMIT_SAFETY: Доля лимитов, которую разрешено расходовать
+        RATE_LIMIT_FILE: Файл состояния ограничителя, общий для нескольких процессов
+        OPERATING_LIMIT: Лимит времени выполнения метода за 10 минут в секундах
+        RETRY_MAX_ATTEMPTS: Максимум попыток вызова, включая первую
+        RETRY_BACKOFF: Базовая пауза экспоненциальных повторов в секундах
+        RETRY_BACKOFF_MAX: Максимальная пауза между повторами в секундах
+        RETRY_JITTER: Случайный разброс паузы между повторами
+        RETRY_METHODS: Шаблоны идемпотентных методов, которые можно повторять
+        RETRY_EXTRA_METHODS: Дополнительно разрешённые к повтору методы
+        POOL_CONNECTIONS: Количество хостов, для которых хранятся пулы соединений
+        POOL_MAXSIZE: Максимум соединений в пуле одного хоста
+        POOL_BLOCK: Ждать свободного соединения вместо открытия сверх POOL_MAXSIZE
+        CONNECT_TIMEOUT: Таймаут подключения в секундах (по умолчанию TIMEOUT)
+        READ_TIMEOUT: Таймаут чтения ответа в секундах (по умолчанию TIMEOUT)
+        KEEP_ALIVE: Переиспользовать соединения между запросами
+        CACHE_ENABLED: Кэшировать ответы редко меняющихся методов чтения
+        CACHE_TTLS: Время жизни записей кэша в секундах по шаблонам методов
+        CACHE_MAX_ENTRIES: Максимум записей в кэше
+        CACHE_FILE: Файл SQLite для кэша на диске (по умолчанию кэш в памяти)
+        COALESCE_METHODS: Шаблоны методов, одинаковые одновременные вызовы которых объединяются в один запрос
+        RESPONSE_MODE: Режим разбора строк списочных методов по умолчанию: model, raw или lazy
+        JSON_DECODER: Декодер JSON ответов: auto (orjson или msgspec, если установлены), orjson, msgspec или json
+        JSON_VALIDATE_BYTES: Валидировать модели ответов сразу из байтов, не строя промежуточный словарь
+        REQUEST_FORMAT: Формат тела запросов: auto (JSON, если он компактнее формы), form или json
+        REQUEST_JSON_MIN_SIZE: Размер формы в байтах, начиная с которого в режиме auto сравнивается JSON
+        REQUEST_GZIP: Сжимать тела запросов gzip (сервер портала должен принимать Content-Encoding: gzip)
+        REQUEST_GZIP_MIN_SIZE: Минимальный размер тела запроса для сжатия в байтах
+        RESPONSE_GZIP: Запрашивать сжатые ответы (Accept-Encoding: gzip)
+        PRIORITY_CAPACITY: Вызовов, одновременно проходящих ограничитель и отправку (null — без классов приоритета)
+        PRIORITY_WEIGHTS: Классы приоритета и их доли в слотах запросов
+        PRIORITY_METHODS: Класс приоритета по шаблону метода
+        PRIORITY_DEFAULT: Класс вызовов без блока priority() и шаблона
+        PRIORITY_DEADLINES: Сколько секунд вызовы класса могут ждать слота
     """
     BASE_URL: str = Field(..., title="Базовый url Bitrix24")
     TIMEOUT: float = Field(60, title="Время на отправку запроса")
-
-
-def load_bitrix_settings(path: str | None = None, override: BitrixSettings | None = None) -> BitrixSettings:
+    MAX_CONCURRENCY: int = Field(20, ge=1, title="Максимум одновременных запросов асинхронного клиента")
+    RATE_LIMIT: Optional[float] = Field(2.0, gt=0, title="Допустимое количество запросов в секунду")
+    RATE_LIMIT_BURST: int = Field(50, ge=1, title="Размер накопителя запросов портала")
+    RATE_LIMIT_SAFETY: float = Field(0.9, gt=0, le=1, title="Доля лимитов, которую разрешено расходовать")
+    RATE_LIMIT_FILE: Optional[str] = Field(None, title="Файл состояния ограничителя для нескольких процессов")
+    OPERATING_LIMIT: float = Field(480, gt=0, title="Лимит времени выполнения метода за 10 минут")
+    RETRY_MAX_ATTEMPTS: int = Field(3, ge=1, title="Максимум попыток вызова")
+    RETRY_BACKOFF: float = Field(0.5, ge=0, title="Базовая пауза между повторами")
+    RETRY_BACKOFF_MAX: float = Field(30, ge=0, title="Максимальная пауза между повторами")
+    RETRY_JITTER: bool = Field(True, title="Случайный разброс паузы")
+    RETRY_METHODS: List[str] = Field(list(DEFAULT_RETRY_METHODS), title="Шаблоны методов, которые можно повторять")
+    RETRY_EXTRA_METHODS: List[str] = Field(default_factory=list, title="Дополнительно разрешённые к повтору методы")
+    POOL_CONNECTIONS: int = Field(10, ge=1, title="Количество хостов с пулами соединений")
+    POOL_MAXSIZE: int = Field(10, ge=1, title="Максимум соединений в пуле одного хоста")
+    POOL_BLOCK: bool = Field(False, title="Ждать свободного соединения при заполненном пуле")
+    CONNECT_TIMEOUT: Optional[float] = Field(None, gt=0, title="Таймаут подключения")
+    READ_TIMEOUT: Optional[float] = Field(None, gt=0, title="Таймаут чтения ответа")
+    KEEP_ALIVE: bool = Field(True, title="Переиспользовать соединения")
+    CACHE_ENABLED: bool = Field(False, title="Кэшировать ответы методов чтения")
+    CACHE_TTLS: Dict[str, float] = Field(dict(DEFAULT_CACHE_TTLS), title="Время жизни записей кэша по методам")
+    CACHE_MAX_ENTRIES: int = Field(1024, ge=1, title="Максимум записей в кэше")
+    CACHE_FILE: Optional[str] = Field(None, title="Файл SQLite для кэша на диске")
+    COALESCE_METHODS: List[str] = Field(default_factory=list, title="Методы с объединением одинаковых вызовов")
+    RESPONSE_MODE: Literal["model", "raw", "lazy"] = Field("model", title="Режим разбора строк списочных методов")
+    JSON_DECODER: Literal["auto", "orjson", "msgspec", "json"] = Field("auto", title="Декодер JSON ответов")
+    JSON_VALIDATE_BYTES: bool = Field(True, title="Валидировать модели ответов сразу из байтов")
+    REQUEST_FORMAT: Literal["auto", "form", "json"] = Field("auto", title="Формат тела запросов")
+    REQUEST_JSON_MIN_SIZE: int = Field(1024, ge=0, title="Размер формы, с которого сравнивается JSON")
+    REQUEST_GZIP: bool = Field(False, title="Сжимать тела запросов")
+    REQUEST_GZIP_MIN_SIZE: int = Field(4096, ge=0, title="Минимальный размер тела для сжатия")
+    RESPONSE_GZIP: bool = Field(True, title="Запрашивать сжатые ответы")
+    PRIORITY_CAPACITY: Optional[int] = Field(None, ge=1, title="Одновременных вызовов в планировщике приоритетов")
+    PRIORITY_WEIGHTS: Dict[str, float] = Field(dict(DEFAULT_PRIORITY_WEIGHTS), title="Доли классов приоритета")
+    PRIORITY_METHODS: Dict[str, str] = Field(default_factory=dict, title="Класс приоритета по шаблону метода")
+    PRIORITY_DEFAULT: str = Field("normal", title="Класс приоритета по умолчанию")
+    PRIORITY_DEADLINES: Dict[str, float] = Field(default_factory=dict, title="Дедлайны ожидания по классам")
+
+
+def load_bitrix_settings(path: str | None = None, override: BitrixSettings | None = None,
+                         reload: bool = False) -> BitrixSettings:
     """
     Загрузить настройки Bitrix24 из файла или использовать переданные.
 
+    Файл разбирается один раз на процесс: повторные вызовы с тем же путём
+    возвращают тот же объект, пока файл не изменится (сверяются время
+    изменения и размер). Настройки не изменяются на месте — для другой
+    конфигурации используйте settings.model_copy(update=...).
+
     Args:
         path: Путь к JSON файлу с настройками
         override: Готовый объект настроек (игнорирует файл)
+        reload: Перечитать файл, не используя запомненные настройки
 
     Returns:
         BitrixSettings: Загруженные настройки
@@ -38,12 +133,19 @@ def load_bitrix_settings(path: str | None = None, override: BitrixSettings | Non
     if override is not None:
         return override
 
-    config_path = path or DEFAULT_CONFIG_PATH
+    config_path = os.path.abspath(path or DEFAULT_CONFIG_PATH)
 
     try:
+        stat = os.stat(config_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _settings_cache.get(config_path)
+        if cached is not None and cached[0] == version and not reload:
+            return cached[1]
         with open(config_path, "r", encoding="utf-8") as f:
-            return BitrixSettings.model_validate_json(f.read())
-
+            settings = BitrixSettings.model_validate_json(f.read())
+        with _settings_lock:
+            _settings_cache[config_path] = (version, settings)
+        return settings
 
     except FileNotFoundError:
         raise FileNotFoundError(f"Файл конфигурации не найден: {config_path}")
@@ -55,6 +157,12 @@ def load_bitrix_settings(path: str | None = None, override: BitrixSettings | Non
         raise RuntimeError(f"Ошибка загрузки настроек Bitrix: {e}")
 
 
+def clear_settings_cache() -> None:
+    """Забыть настройки, запомненные load_bitrix_settings."""
+    with _settings_lock:
+        _settings_cache.clear()
+
+
 if __name__ == "__main__":
     settings = load_bitrix_settings()
     print(settings.BASE_URL)
@@ -1,12 +1,28 @@
-from .service import CrmService
-from .models import (
-    TypeList, TypeListParams, TypeInfo, TimeInfo, TypeListResult,
-    ItemList, ItemListParams, Item, ItemListResult
-)
-
-__all__ = [
-    "CrmService",
-    "TypeList", "TypeListParams", "TypeInfo", "TimeInfo", "TypeListResult",
-    "ItemList", "ItemListParams", "Item", "ItemListResult"
-]
+from typing import TYPE_CHECKING
 
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .service import CrmService
+    from .async_service import AsyncCrmService
+    from .export import CrmItemExporter, ExportPartition, ExportState
+    from .schema import ItemSchema
+    from .models import (
+        TypeList, TypeListParams, TypeInfo, TimeInfo, TypeListResult,
+        ItemList, ItemListParams, Item, ItemListResult,
+        ItemFields, ItemFieldsParams, ItemFieldInfo, ItemFieldsResult
+    )
+
+_EXPORTS = {
+    "CrmService": ".service", "AsyncCrmService": ".async_service",
+    "CrmItemExporter": ".export", "ExportPartition": ".export", "ExportState": ".export",
+    "ItemSchema": ".schema",
+    **dict.fromkeys([
+        "TypeList", "TypeListParams", "TypeInfo", "TimeInfo", "TypeListResult",
+        "ItemList", "ItemListParams", "Item", "ItemListResult",
+        "ItemFields", "ItemFieldsParams", "ItemFieldInfo", "ItemFieldsResult",
+    ], ".models"),
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,245 @@
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Union, AsyncIterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..bitrix_http import AsyncBitrixHttpClient
+
+from .models import (
+    TypeListParams, TypeList, TypeInfo, ItemListParams, ItemList, Item, ItemFieldsParams, ItemFields
+)
+from .schema import ItemSchema, _list_model
+from ..utils.response import ResponseMode, row_get
+from ..utils.pagination import PAGE_SIZE, aiter_pages, offset_step
+
+
+class AsyncCrmService:
+    """
+    Асинхронный сервис для работы с Bitrix24 CRM API.
+
+    Повторяет методы CrmService и использует те же модели параметров и ответов.
+
+    Example:
+        >>> client = AsyncBitrixClient(token="...", user_id=123)
+        >>> types = await client.crm.type_list()
+    """
+
+    def __init__(self, http: "AsyncBitrixHttpClient"):
+        self._http = http
+        self._schemas: Dict[Tuple[int, Optional[bool]], ItemSchema] = {}
+
+    async def type_list(
+        self,
+        order: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        start: Optional[int] = None,
+        mode: Optional[ResponseMode] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> TypeList:
+        """
+        Получить список пользовательских типов (смарт-процессов).
+
+        Args:
+            order: Объект сортировки формата { field: 'ASC'|'DESC' }
+            filter: Объект фильтрации смарт-процессов
+            start: Параметр для постраничной навигации (start = (N-1) * 50)
+            mode: Режим разбора смарт-процессов: model, raw (словари) или lazy (None — RESPONSE_MODE клиента)
+            fields: Поля смарт-процессов, которые нужно оставить
+
+        Returns:
+            TypeList: Список смарт-процессов
+        """
+        params = TypeListParams(order=order, filter=filter, start=start)
+        return await self._http.call_pydantic(
+            method="crm.type.list",
+            params=params.to_bx_params(),
+            model=TypeList,
+            mode=mode,
+            fields=fields,
+        )
+
+    async def item_list(
+        self,
+        entity_type_id: int,
+        select: Optional[List[str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        order: Optional[Dict[str, str]] = None,
+        start: Optional[int] = None,
+        use_original_uf_names: Optional[bool] = None,
+        mode: Optional[ResponseMode] = None,
+        fields: Optional[Sequence[str]] = None,
+        schema: Union[ItemSchema, bool, None] = None
+    ) -> ItemList:
+        """
+        Получить список элементов определенного типа объекта CRM.
+
+        Args:
+            entity_type_id: Идентификатор системного или пользовательского типа (обязательный)
+            select: Список полей для выборки или ['*'] для всех полей
+            filter: Объект фильтрации элементов
+            order: Объект сортировки формата { field: 'ASC'|'DESC' }
+            start: Параметр для постраничной навигации (start = (N-1) * 50)
+            use_original_uf_names: Использовать оригинальные имена пользовательских полей (True/False)
+            mode: Режим разбора элементов: model, raw (словари) или lazy (None — RESPONSE_MODE клиента)
+            fields: Поля элементов, которые нужно оставить (в отличие от select, отбор на стороне клиента)
+            schema: Типизированная схема из item_schema() или True, чтобы загрузить её;
+                элементы разбираются в её компактный класс (только в режиме model)
+
+        Returns:
+            ItemList: Список элементов CRM
+        """
+        params = ItemListParams(
+            entity_type_id=entity_type_id,
+            select=select,
+            filter=filter,
+            order=order,
+            start=start,
+            use_original_uf_names=use_original_uf_names
+        )
+        if schema is True:
+            schema = await self.item_schema(entity_type_id, use_original_uf_names=use_original_uf_names)
+        return await self._item_list(params.to_bx_params(), mode, fields, schema or None)
+
+    async def _item_list(self, params: Dict[str, str], mode: Optional[ResponseMode],
+                         fields: Optional[Sequence[str]], schema: Optional[ItemSchema]) -> ItemList:
+        """Вызвать crm.item.list с уже закодированными параметрами."""
+        model, mode = _list_model(schema, mode, fields)
+        return await self._http.call_pydantic(
+            method="crm.item.list",
+            params=params,
+            model=model,
+            mode=mode,
+            fields=fields,
+        )
+
+    async def item_fields(self, entity_type_id: int, use_original_uf_names: Optional[bool] = None) -> ItemFields:
+        """
+        Получить описание полей элементов CRM.
+
+        Args:
+            entity_type_id: Идентификатор системного или пользовательского типа
+            use_original_uf_names: Использовать оригинальные имена пользовательских полей
+
+        Returns:
+            ItemFields: Описания полей по их именам
+        """
+        params = ItemFieldsParams(entity_type_id=entity_type_id, use_original_uf_names=use_original_uf_names)
+        return await self._http.call_pydantic(
+            method="crm.item.fields",
+            params=params.to_bx_params(),
+            model=ItemFields,
+        )
+
+    async def item_schema(self, entity_type_id: int, use_original_uf_names: Optional[bool] = None,
+                          refresh: bool = False) -> ItemSchema:
+        """
+        Получить типизированную схему элементов по crm.item.fields.
+
+        Схема загружается один раз для типа сущности и запоминается в сервисе.
+
+        Args:
+            entity_type_id: Идентификатор системного или пользовательского типа
+            use_original_uf_names: Использовать оригинальные имена пользовательских полей
+            refresh: Загрузить схему заново (например, после добавления полей на портале)
+
+        Returns:
+            ItemSchema: Схема с классом элемента и моделью ответа crm.item.list
+        """
+        key = (entity_type_id, use_original_uf_names)
+        schema = self._schemas.get(key)
+        if schema is None or refresh:
+            fields = await self.item_fields(entity_type_id, use_original_uf_names=use_original_uf_names)
+            schema = self._schemas[key] = ItemSchema(entity_type_id, fields.result.fields)
+        return schema
+
+    async def iter_types(
+        self,
+        order: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        prefetch: int = 0,
+        mode: Optional[ResponseMode] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[TypeInfo]:
+        """
+        Перебрать все смарт-процессы с автоматической постраничной навигацией.
+
+        Args:
+            order: Объект сортировки формата { field: 'ASC'|'DESC' }
+            filter: Объект фильтрации смарт-процессов
+            prefetch: Сколько страниц загружать заранее, пока обрабатывается текущая
+            mode: Режим разбора смарт-процессов (см. type_list)
+            fields: Поля смарт-процессов, которые нужно оставить
+
+        Yields:
+            TypeInfo: Смарт-процессы по одному
+        """
+        query = TypeListParams(order=order, filter=filter).page_query()
+        pages = aiter_pages(
+            fetch=lambda start: self._http.call_pydantic(
+                method="crm.type.list", params=query.at(start), model=TypeList, mode=mode, fields=fields,
+            ),
+            next_cursor=lambda page, start: page.next,
+            prefetch=prefetch,
+            speculate=offset_step,
+        )
+        async for page in pages:
+            for item in page.result.types:
+                yield item
+
+    async def iter_items(
+        self,
+        entity_type_id: int,
+        select: Optional[List[str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        order: Optional[Dict[str, str]] = None,
+        use_original_uf_names: Optional[bool] = None,
+        prefetch: int = 0,
+        keyset: bool = False,
+        mode: Optional[ResponseMode] = None,
+        fields: Optional[Sequence[str]] = None,
+        schema: Union[ItemSchema, bool, None] = None
+    ) -> AsyncIterator[Item]:
+        """
+        Перебрать все элементы CRM с автоматической постраничной навигацией.
+
+        Параметры совпадают с CrmService.iter_items.
+
+        Yields:
+            Item: Элементы CRM по одному
+        """
+        if schema is True:
+            schema = await self.item_schema(entity_type_id, use_original_uf_names=use_original_uf_names)
+        if not keyset:
+            query = ItemListParams(
+                entity_type_id=entity_type_id, select=select, filter=filter, order=order,
+                use_original_uf_names=use_original_uf_names,
+            ).page_query()
+            pages = aiter_pages(
+                fetch=lambda start: self._item_list(query.at(start), mode, fields, schema or None),
+                next_cursor=lambda page, start: page.next,
+                prefetch=prefetch,
+                speculate=offset_step,
+            )
+        else:
+            if order:
+                raise ValueError("В режиме keyset сортировка задаётся автоматически по ID")
+            if select and "*" not in select and "id" not in select:
+                select = ["id", *select]
+            if fields is not None and "id" not in fields:
+                fields = ["id", *fields]
+
+            query = ItemListParams(
+                entity_type_id=entity_type_id, select=select, filter=filter, order={"id": "ASC"}, start=-1,
+                use_original_uf_names=use_original_uf_names,
+            ).page_query()
+
+            def fetch(last_id: Optional[int]):
+                return self._item_list(query.at(extra={"filter": {">id": last_id}}), mode, fields, schema or None)
+
+            def next_cursor(page: ItemList, last_id: Optional[int]) -> Optional[int]:
+                items = page.result.items
+                return row_get(items[-1], "id") if len(items) >= PAGE_SIZE else None
+
+            pages = aiter_pages(fetch=fetch, next_cursor=next_cursor, prefetch=prefetch)
+
+        async for page in pages:
+            for item in page.result.items:
+                yield item
@@ -0,0 +1,256 @@
+import contextvars
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from pydantic import BaseModel, Field
+
+from .models import Item, ItemListParams
+from .schema import ItemSchema
+from ..bitrix_http.scheduling import priority
+from ..utils.pagination import PAGE_SIZE
+from ..utils.response import ResponseMode, row_get
+
+if TYPE_CHECKING:
+    from .service import CrmService
+
+
+ExportSink = Callable[[List[Item], "ExportPartition"], None]
+"""Приёмник выгрузки: получает страницу элементов и раздел, к которому она относится."""
+
+_DONE = object()
+
+
+class ExportPartition(BaseModel):
+    """Диапазон ID, выгружаемый одним потоком."""
+    index: int = Field(..., description="Порядковый номер раздела")
+    lower: int = Field(..., description="Нижняя граница ID (не включается)")
+    upper: int = Field(..., description="Верхняя граница ID (включается)")
+    last_id: Optional[int] = Field(None, description="ID последнего переданного в приёмник элемента")
+    rows: int = Field(0, description="Количество переданных в приёмник элементов")
+    done: bool = Field(False, description="Раздел выгружен полностью")
+
+    @property
+    def cursor(self) -> int:
+        """ID, после которого продолжается выгрузка раздела."""
+        return self.last_id if self.last_id is not None else self.lower
+
+
+class ExportState(BaseModel):
+    """Состояние выгрузки, по которому её можно продолжить после сбоя."""
+    entity_type_id: int = Field(..., description="Идентификатор типа сущности")
+    partitions: List[ExportPartition] = Field(default_factory=list, description="Разделы выгрузки по возрастанию ID")
+
+    @property
+    def done(self) -> bool:
+        """Все разделы выгружены."""
+        return all(partition.done for partition in self.partitions)
+
+    @property
+    def rows(self) -> int:
+        """Всего элементов передано в приёмник."""
+        return sum(partition.rows for partition in self.partitions)
+
+    def save(self, path: str) -> None:
+        """Атомарно сохранить состояние в JSON файл."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.model_dump_json())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ExportState":
+        """Загрузить состояние из JSON файла."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.model_validate_json(f.read())
+
+
+class CrmItemExporter:
+    """
+    Параллельная выгрузка всех элементов CRM по разделам диапазона ID.
+
+    Диапазон ID определяется двумя упорядоченными запросами, делится на
+    разделы, и каждый раздел выгружается отдельным потоком с навигацией по ID
+    (filter >id/<=id, start=-1). Страницы передаются в приёмник в порядке
+    возрастания ID независимо от того, какой поток загрузил их раньше, поэтому
+    результат детерминирован. Частота запросов ограничивается общим RateLimiter клиента.
+
+    Example:
+        >>> exporter = CrmItemExporter(client.crm, entity_type_id=1040, select=["*"], partitions=16)
+        >>> state = exporter.run(lambda items, part: writer.writerows(i.model_dump() for i in items),
+        ...                      state_path="export_1040.json")
+    """
+
+    def __init__(self, crm: "CrmService", entity_type_id: int, select: Optional[List[str]] = None,
+                 filter: Optional[Dict[str, Any]] = None, partitions: int = 8, workers: int = 4,
+                 buffer_pages: int = 4, use_original_uf_names: Optional[bool] = None,
+                 mode: Optional[ResponseMode] = None, fields: Optional[Sequence[str]] = None,
+                 schema: Optional[ItemSchema] = None) -> None:
+        """
+        Инициализация выгрузки.
+
+        Args:
+            crm: Сервис CRM
+            entity_type_id: Идентификатор типа сущности
+            select: Список полей для выборки (ID добавляется автоматически)
+            filter: Дополнительный фильтр элементов (без условий на id)
+            partitions: Количество разделов диапазона ID
+            workers: Количество потоков выгрузки
+            buffer_pages: Сколько страниц раздел может загрузить впрок, ожидая своей очереди
+            use_original_uf_names: Использовать оригинальные имена пользовательских полей
+            mode: Режим разбора элементов: model, raw (словари) или lazy (None — RESPONSE_MODE клиента)
+            fields: Поля элементов, которые нужно оставить (ID добавляется автоматически)
+            schema: Типизированная схема элементов (см. CrmService.item_schema)
+        """
+        if partitions < 1 or workers < 1 or buffer_pages < 1:
+            raise ValueError("partitions, workers и buffer_pages должны быть не меньше 1")
+        if filter and any(key.lstrip("<>=!@") == "id" for key in filter):
+            raise ValueError("Фильтр по id задаётся разделами выгрузки")
+        if select and "*" not in select and "id" not in select:
+            select = ["id", *select]
+        if fields is not None and "id" not in fields:
+            fields = ["id", *fields]
+        self._crm = crm
+        self.entity_type_id = entity_type_id
+        self.select = select
+        self.filter = filter or {}
+        self.partitions = partitions
+        self.workers = workers
+        self.buffer_pages = buffer_pages
+        self.use_original_uf_names = use_original_uf_names
+        self.mode = mode
+        self.fields = fields
+        self.schema = schema
+
+    def probe(self) -> Optional[Tuple[int, int]]:
+        """
+        Определить минимальный и максимальный ID элементов.
+
+        Returns:
+            (min_id, max_id) или None, если элементов нет
+        """
+        bounds = []
+        for direction in ("ASC", "DESC"):
+            page = self._crm.item_list(
+                entity_type_id=self.entity_type_id, select=["id"], filter=self.filter or None,
+                order={"id": direction}, start=-1, mode="model",
+            )
+            if not page.result.items:
+                return None
+            bounds.append(page.result.items[0].id)
+        return bounds[0], bounds[1]
+
+    def plan(self) -> ExportState:
+        """
+        Разбить диапазон ID на разделы.
+
+        Returns:
+            ExportState: Новое состояние выгрузки
+        """
+        state = ExportState(entity_type_id=self.entity_type_id)
+        bounds = self.probe()
+        if bounds is None:
+            return state
+        min_id, max_id = bounds
+        span = max_id - min_id + 1
+        count = min(self.partitions, span)
+        lower = min_id - 1
+        for index in range(count):
+            upper = min_id - 1 + span * (index + 1) // count
+            state.partitions.append(ExportPartition(index=index, lower=lower, upper=upper))
+            lower = upper
+        return state
+
+    def run(self, sink: ExportSink, state: Optional[ExportState] = None,
+            state_path: Optional[str] = None) -> ExportState:
+        """
+        Выполнить выгрузку.
+
+        Args:
+            sink: Приёмник страниц элементов
+            state: Состояние прерванной выгрузки для продолжения
+            state_path: JSON файл состояния; если он существует, выгрузка продолжается с места остановки,
+                и после каждой страницы состояние сохраняется в него
+
+        Returns:
+            ExportState: Итоговое состояние выгрузки
+        """
+        if state is None and state_path and os.path.exists(state_path):
+            state = ExportState.load(state_path)
+        if state is None:
+            state = self.plan()
+        if state.entity_type_id != self.entity_type_id:
+            raise ValueError("Состояние относится к другому типу сущности")
+        if state_path:
+            state.save(state_path)
+
+        pending = [partition for partition in state.partitions if not partition.done]
+        if not pending:
+            return state
+
+        stop = threading.Event()
+        queues = {partition.index: queue.Queue(maxsize=self.buffer_pages) for partition in pending}
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bitrix-export")
+        try:
+            # Разделы ставятся в очередь по порядку, поэтому текущий раздел всегда уже выполняется
+            for partition in pending:
+                executor.submit(contextvars.copy_context().run, self._fetch_partition, partition.model_copy(),
+                                queues[partition.index], stop)
+
+            for partition in pending:
+                q = queues[partition.index]
+                while True:
+                    page = q.get()
+                    if page is _DONE:
+                        partition.done = True
+                        break
+                    if isinstance(page, BaseException):
+                        raise page
+                    sink(page, partition)
+                    partition.last_id = row_get(page[-1], "id")
+                    partition.rows += len(page)
+                    if state_path:
+                        state.save(state_path)
+                if state_path:
+                    state.save(state_path)
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+        return state
+
+    def _fetch_partition(self, partition: ExportPartition, q: "queue.Queue[Any]", stop: threading.Event) -> None:
+        try:
+            # Страницы выгрузки идут классом bulk, если вызывающий код не задал свой priority()
+            with priority("bulk", override=False):
+                cursor = partition.cursor
+                query = ItemListParams(
+                    entity_type_id=self.entity_type_id, select=self.select,
+                    filter={**self.filter, "<=id": partition.upper}, order={"id": "ASC"}, start=-1,
+                    use_original_uf_names=self.use_original_uf_names,
+                ).page_query()
+                while not stop.is_set():
+                    page = self._crm._item_list(query.at(extra={"filter": {">id": cursor}}), self.mode, self.fields,
+                                                self.schema)
+                    items = page.result.items
+                    if items:
+                        if not _put(q, items, stop):
+                            return
+                        cursor = row_get(items[-1], "id")
+                    if len(items) < PAGE_SIZE:
+                        break
+                _put(q, _DONE, stop)
+        except BaseException as e:
+            _put(q, e, stop)
+
+
+def _put(q: "queue.Queue[Any]", item: Any, stop: threading.Event) -> bool:
+    """Положить элемент в ограниченную очередь, прерываясь при остановке выгрузки."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
@@ -49,6 +49,7 @@ class TimeInfo(BaseModel):
     date_start: str = Field(..., description="Дата и время начала")
     date_finish: str = Field(..., description="Дата и время окончания")
     operating: float = Field(..., description="Время работы")
+    operating_reset_at: Optional[float] = Field(None, description="Момент сброса счетчика operating (unix time)")
 
 
 class TypeListResult(BaseModel):
@@ -61,6 +62,7 @@ class TypeList(BaseModel):
     result: TypeListResult = Field(..., description="Результат запроса")
     time: Optional[TimeInfo] = Field(None, description="Информация о времени выполнения запроса")
     total: Optional[int] = Field(None, description="Общее количество найденных записей")
+    next: Optional[int] = Field(None, description="Значение для следующего запроса в параметр start")
 
 
 class ItemListParams(BitrixParams):
@@ -75,8 +77,8 @@ class ItemListParams(BitrixParams):
     def to_bx_params(self) -> Dict[str, Any]:
         """Преобразовать параметры в формат Bitrix API."""
         params = super().to_bx_params()
-        if "useOriginalUfNames" in params and isinstance(params["useOriginalUfNames"], bool):
-            params["useOriginalUfNames"] = "Y" if params["useOriginalUfNames"] else "N"
+        if self.use_original_uf_names is not None:
+            params["useOriginalUfNames"] = "Y" if self.use_original_uf_names else "N"
         return params
 
 
@@ -99,3 +101,38 @@ class ItemList(BaseModel):
     total: Optional[int] = Field(None, description="Общее количество найденных элементов")
     next: Optional[int] = Field(None, description="Значение для следующего запроса в параметр start")
     time: Optional[TimeInfo] = Field(None, description="Информация о времени выполнения запроса")
+
+
+class ItemFieldsParams(BitrixParams):
+    """Параметры для crm.item.fields."""
+    entity_type_id: int = Field(..., serialization_alias="entityTypeId", description="Идентификатор системного или пользовательского типа")
+    use_original_uf_names: Optional[bool] = Field(None, serialization_alias="useOriginalUfNames", description="Использовать оригинальные имена пользовательских полей (Y/N)")
+
+    def to_bx_params(self) -> Dict[str, Any]:
+        """Преобразовать параметры в формат Bitrix API."""
+        params = super().to_bx_params()
+        if self.use_original_uf_names is not None:
+            params["useOriginalUfNames"] = "Y" if self.use_original_uf_names else "N"
+        return params
+
+
+class ItemFieldInfo(BaseModel):
+    """Описание поля элемента CRM."""
+    type: str = Field(..., description="Тип поля (integer, string, double, datetime, user, money, crm_status и др.)")
+    title: Optional[str] = Field(None, description="Название поля")
+    is_required: bool = Field(False, alias="isRequired", description="Обязательное поле")
+    is_read_only: bool = Field(False, alias="isReadOnly", description="Поле только для чтения")
+    is_immutable: bool = Field(False, alias="isImmutable", description="Поле нельзя изменить после создания")
+    is_multiple: bool = Field(False, alias="isMultiple", description="Множественное поле")
+    is_dynamic: bool = Field(False, alias="isDynamic", description="Пользовательское поле")
+
+
+class ItemFieldsResult(BaseModel):
+    """Результат метода crm.item.fields."""
+    fields: Dict[str, ItemFieldInfo] = Field(..., description="Описания полей по их именам")
+
+
+class ItemFields(BaseModel):
+    """Ответ метода crm.item.fields."""
+    result: ItemFieldsResult = Field(..., description="Результат запроса")
+    time: Optional[TimeInfo] = Field(None, description="Информация о времени выполнения запроса")
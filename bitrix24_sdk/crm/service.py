@@ -1,9 +1,18 @@
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+import os
+import threading
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Union, Iterator, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..bitrix_http import BitrixHttpClient
 
-from .models import TypeListParams, TypeList, ItemListParams, ItemList
+from .models import (
+    TypeListParams, TypeList, TypeInfo, ItemListParams, ItemList, Item, ItemFieldsParams, ItemFields
+)
+from .schema import ItemSchema, _list_model
+from .export import CrmItemExporter, ExportSink, ExportState
+from ..utils.columnar import DEFAULT_BATCH_ROWS, open_table_writer
+from ..utils.response import ResponseMode, row_get
+from ..utils.pagination import PAGE_SIZE, iter_pages, offset_step
 
 
 class CrmService:
@@ -23,12 +32,16 @@ class CrmService:
     
     def __init__(self, http: "BitrixHttpClient"):
         self._http = http
+        self._schemas: Dict[Tuple[int, Optional[bool]], ItemSchema] = {}
+        self._schemas_lock = threading.Lock()
 
     def type_list(
         self,
         order: Optional[Dict[str, str]] = None,
         filter: Optional[Dict[str, Any]] = None,
-        start: Optional[int] = None
+        start: Optional[int] = None,
+        mode: Optional[ResponseMode] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> TypeList:
         """
         Получить список пользовательских типов (смарт-процессов).
@@ -37,6 +50,8 @@ class CrmService:
             order: Объект сортировки формата { field: 'ASC'|'DESC' }
             filter: Объект фильтрации смарт-процессов
             start: Параметр для постраничной навигации (start = (N-1) * 50)
+            mode: Режим разбора смарт-процессов: model, raw (словари) или lazy (None — RESPONSE_MODE клиента)
+            fields: Поля смарт-процессов, которые нужно оставить
         
         Returns:
             TypeList: Список смарт-процессов
@@ -61,6 +76,8 @@ class CrmService:
             method="crm.type.list",
             params=params.to_bx_params(),
             model=TypeList,
+            mode=mode,
+            fields=fields,
         )
 
     def item_list(
@@ -70,7 +87,10 @@ class CrmService:
         filter: Optional[Dict[str, Any]] = None,
         order: Optional[Dict[str, str]] = None,
         start: Optional[int] = None,
-        use_original_uf_names: Optional[bool] = None
+        use_original_uf_names: Optional[bool] = None,
+        mode: Optional[ResponseMode] = None,
+        fields: Optional[Sequence[str]] = None,
+        schema: Union[ItemSchema, bool, None] = None
     ) -> ItemList:
         """
         Получить список элементов определенного типа объекта CRM.
@@ -82,6 +102,10 @@ class CrmService:
             order: Объект сортировки формата { field: 'ASC'|'DESC' }
             start: Параметр для постраничной навигации (start = (N-1) * 50)
             use_original_uf_names: Использовать оригинальные имена пользовательских полей (True/False)
+            mode: Режим разбора элементов: model, raw (словари) или lazy (None — RESPONSE_MODE клиента)
+            fields: Поля элементов, которые нужно оставить (в отличие от select, отбор на стороне клиента)
+            schema: Типизированная схема из item_schema() или True, чтобы загрузить её;
+                элементы разбираются в её компактный класс (только в режиме model)
         
         Returns:
             ItemList: Список элементов CRM
@@ -115,8 +139,267 @@ class CrmService:
             start=start,
             use_original_uf_names=use_original_uf_names
         )
+        if schema is True:
+            schema = self.item_schema(entity_type_id, use_original_uf_names=use_original_uf_names)
+        return self._item_list(params.to_bx_params(), mode, fields, schema or None)
+
+    def _item_list(self, params: Dict[str, str], mode: Optional[ResponseMode], fields: Optional[Sequence[str]],
+                   schema: Optional[ItemSchema]) -> ItemList:
+        """Вызвать crm.item.list с уже закодированными параметрами."""
+        model, mode = _list_model(schema, mode, fields)
         return self._http.call_pydantic(
             method="crm.item.list",
+            params=params,
+            model=model,
+            mode=mode,
+            fields=fields,
+        )
+
+    def item_fields(self, entity_type_id: int, use_original_uf_names: Optional[bool] = None) -> ItemFields:
+        """
+        Получить описание полей элементов CRM.
+
+        Args:
+            entity_type_id: Идентификатор системного или пользовательского типа
+            use_original_uf_names: Использовать оригинальные имена пользовательских полей
+
+        Returns:
+            ItemFields: Описания полей по их именам
+        """
+        params = ItemFieldsParams(entity_type_id=entity_type_id, use_original_uf_names=use_original_uf_names)
+        return self._http.call_pydantic(
+            method="crm.item.fields",
             params=params.to_bx_params(),
-            model=ItemList,
+            model=ItemFields,
+        )
+
+    def item_schema(self, entity_type_id: int, use_original_uf_names: Optional[bool] = None,
+                    refresh: bool = False) -> ItemSchema:
+        """
+        Получить типизированную схему элементов по crm.item.fields.
+
+        Схема загружается один раз для типа сущности и запоминается в сервисе.
+
+        Args:
+            entity_type_id: Идентификатор системного или пользовательского типа
+            use_original_uf_names: Использовать оригинальные имена пользовательских полей
+            refresh: Загрузить схему заново (например, после добавления полей на портале)
+
+        Returns:
+            ItemSchema: Схема с классом элемента и моделью ответа crm.item.list
+        """
+        key = (entity_type_id, use_original_uf_names)
+        with self._schemas_lock:
+            schema = self._schemas.get(key)
+            if schema is None or refresh:
+                fields = self.item_fields(entity_type_id, use_original_uf_names=use_original_uf_names)
+                schema = self._schemas[key] = ItemSchema(entity_type_id, fields.result.fields)
+            return schema
+
+    def iter_types(
+        self,
+        order: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        prefetch: int = 0,
+        mode: Optional[ResponseMode] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> Iterator[TypeInfo]:
+        """
+        Перебрать все смарт-процессы с автоматической постраничной навигацией.
+
+        Args:
+            order: Объект сортировки формата { field: 'ASC'|'DESC' }
+            filter: Объект фильтрации смарт-процессов
+            prefetch: Сколько страниц загружать заранее, пока обрабатывается текущая
+            mode: Режим разбора смарт-процессов (см. type_list)
+            fields: Поля смарт-процессов, которые нужно оставить
+
+        Yields:
+            TypeInfo: Смарт-процессы по одному
+        """
+        query = TypeListParams(order=order, filter=filter).page_query()
+        pages = iter_pages(
+            fetch=lambda start: self._http.call_pydantic(
+                method="crm.type.list", params=query.at(start), model=TypeList, mode=mode, fields=fields,
+            ),
+            next_cursor=lambda page, start: page.next,
+            prefetch=prefetch,
+            speculate=offset_step,
+        )
+        for page in pages:
+            yield from page.result.types
+
+    def iter_items(
+        self,
+        entity_type_id: int,
+        select: Optional[List[str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        order: Optional[Dict[str, str]] = None,
+        use_original_uf_names: Optional[bool] = None,
+        prefetch: int = 0,
+        keyset: bool = False,
+        mode: Optional[ResponseMode] = None,
+        fields: Optional[Sequence[str]] = None,
+        schema: Union[ItemSchema, bool, None] = None
+    ) -> Iterator[Item]:
+        """
+        Перебрать все элементы CRM с автоматической постраничной навигацией.
+
+        В памяти держится не больше prefetch + 1 страниц. В режиме keyset
+        используется быстрая навигация Bitrix по ID (filter >id и start=-1):
+        портал не считает общее количество записей, что заметно ускоряет
+        выборку из больших таблиц. Сортировка в этом режиме всегда по возрастанию ID.
+
+        Args:
+            entity_type_id: Идентификатор системного или пользовательского типа
+            select: Список полей для выборки или ['*'] для всех полей
+            filter: Объект фильтрации элементов
+            order: Объект сортировки (недоступен в режиме keyset)
+            use_original_uf_names: Использовать оригинальные имена пользовательских полей
+            prefetch: Сколько страниц загружать заранее, пока обрабатывается текущая
+            keyset: Использовать навигацию по ID вместо смещения
+            mode: Режим разбора элементов (см. item_list)
+            fields: Поля элементов, которые нужно оставить
+            schema: Типизированная схема элементов или True, чтобы загрузить её (см. item_schema)
+
+        Yields:
+            Item: Элементы CRM по одному (в режиме raw — словари, lazy — LazyRecord)
+
+        Example:
+            >>> for item in client.crm.iter_items(1, select=["id", "title"], keyset=True, prefetch=1):
+            ...     print(item.id, item.title)
+        """
+        if schema is True:
+            schema = self.item_schema(entity_type_id, use_original_uf_names=use_original_uf_names)
+        if not keyset:
+            query = ItemListParams(
+                entity_type_id=entity_type_id, select=select, filter=filter, order=order,
+                use_original_uf_names=use_original_uf_names,
+            ).page_query()
+            pages = iter_pages(
+                fetch=lambda start: self._item_list(query.at(start), mode, fields, schema or None),
+                next_cursor=lambda page, start: page.next,
+                prefetch=prefetch,
+                speculate=offset_step,
+            )
+        else:
+            if order:
+                raise ValueError("В режиме keyset сортировка задаётся автоматически по ID")
+            if select and "*" not in select and "id" not in select:
+                select = ["id", *select]
+            if fields is not None and "id" not in fields:
+                fields = ["id", *fields]
+
+            query = ItemListParams(
+                entity_type_id=entity_type_id, select=select, filter=filter, order={"id": "ASC"}, start=-1,
+                use_original_uf_names=use_original_uf_names,
+            ).page_query()
+
+            def fetch(last_id: Optional[int]) -> ItemList:
+                page = query.at(extra={"filter": {">id": last_id}})
+                return self._item_list(page, mode, fields, schema or None)
+
+            def next_cursor(page: ItemList, last_id: Optional[int]) -> Optional[int]:
+                items = page.result.items
+                return row_get(items[-1], "id") if len(items) >= PAGE_SIZE else None
+
+            pages = iter_pages(fetch=fetch, next_cursor=next_cursor, prefetch=prefetch)
+
+        for page in pages:
+            yield from page.result.items
+
+    def export_items(
+        self,
+        entity_type_id: int,
+        sink: ExportSink,
+        select: Optional[List[str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        partitions: int = 8,
+        workers: int = 4,
+        state_path: Optional[str] = None,
+        use_original_uf_names: Optional[bool] = None,
+        mode: Optional[ResponseMode] = None,
+        fields: Optional[Sequence[str]] = None,
+        schema: Union[ItemSchema, bool, None] = None
+    ) -> ExportState:
+        """
+        Выгрузить все элементы CRM параллельно по разделам диапазона ID.
+
+        Страницы передаются в sink по возрастанию ID. Если указан state_path,
+        прогресс каждого раздела сохраняется, и повторный вызов продолжает выгрузку.
+
+        Args:
+            entity_type_id: Идентификатор системного или пользовательского типа
+            sink: Приёмник страниц: sink(items, partition)
+            select: Список полей для выборки или ['*'] для всех полей
+            filter: Дополнительный фильтр элементов (без условий на id)
+            partitions: Количество разделов диапазона ID
+            workers: Количество потоков выгрузки
+            state_path: JSON файл состояния для продолжения выгрузки
+            use_original_uf_names: Использовать оригинальные имена пользовательских полей
+            mode: Режим разбора элементов: model, raw (словари) или lazy; raw заметно экономит CPU
+            fields: Поля элементов, которые нужно оставить
+            schema: Типизированная схема элементов или True, чтобы загрузить её (см. item_schema)
+
+        Returns:
+            ExportState: Итоговое состояние выгрузки
+
+        Example:
+            >>> rows = []
+            >>> state = client.crm.export_items(1040, lambda items, part: rows.extend(items), select=["*"])
+            >>> print(state.rows)
+        """
+        if schema is True:
+            schema = self.item_schema(entity_type_id, use_original_uf_names=use_original_uf_names)
+        exporter = CrmItemExporter(
+            self, entity_type_id=entity_type_id, select=select, filter=filter, partitions=partitions,
+            workers=workers, use_original_uf_names=use_original_uf_names, mode=mode, fields=fields,
+            schema=schema or None,
         )
+        return exporter.run(sink, state_path=state_path)
+
+    def export_table(
+        self,
+        entity_type_id: int,
+        path: Union[str, "os.PathLike[str]"],
+        select: Optional[List[str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        format: Optional[str] = None,
+        partitions: int = 8,
+        workers: int = 4,
+        use_original_uf_names: Optional[bool] = None,
+        batch_rows: int = DEFAULT_BATCH_ROWS
+    ) -> ExportState:
+        """
+        Выгрузить элементы CRM в таблицу CSV, Parquet или Arrow.
+
+        Колонки и их типы берутся из crm.item.fields (см. ItemSchema.columns),
+        элементы запрашиваются в режиме raw и приводятся к типам колонок при
+        записи. Страницы пишутся по мере поступления, в памяти одновременно
+        находится не больше batch_rows строк и буфер страниц выгрузки.
+
+        Args:
+            entity_type_id: Идентификатор системного или пользовательского типа
+            path: Путь к файлу
+            select: Список полей (колонок); по умолчанию все поля
+            filter: Дополнительный фильтр элементов (без условий на id)
+            format: csv, parquet или arrow; по умолчанию по расширению path
+            partitions: Количество разделов диапазона ID
+            workers: Количество потоков выгрузки
+            use_original_uf_names: Использовать оригинальные имена пользовательских полей
+            batch_rows: Строк в пакете записи (группе строк Parquet)
+
+        Returns:
+            ExportState: Итоговое состояние выгрузки
+
+        Example:
+            >>> state = client.crm.export_table(1040, "items.parquet")
+            >>> print(state.rows)
+        """
+        schema = self.item_schema(entity_type_id, use_original_uf_names=use_original_uf_names)
+        columns = schema.columns(select)
+        with open_table_writer(path, columns, format=format, batch_rows=batch_rows) as writer:
+            return self.export_items(
+                entity_type_id, writer, select=select or ["*"], filter=filter, partitions=partitions,
+                workers=workers, use_original_uf_names=use_original_uf_names, mode="raw",
+            )
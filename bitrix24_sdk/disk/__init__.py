@@ -1,19 +1,34 @@
-from .service import DiskService
-from .models import (
-    FolderInfo, FileInfo, GetChildrenParams, GetChildren,
-    StorageInfo, GetListParams, GetList, GetStorageParams, GetStorage,
-    GetFolderParams, GetFolder, AddFolderParams, AddFolder,
-    AddSubfolderParams, AddSubfolder, GetFileParams, GetFile,
-    DeleteTreeParams, DeleteTree, UploadFileParams, UploadFile,
-    UploadUrlInfo, GetUploadUrl, UploadFileComplete
-)
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "DiskService",
-    "FolderInfo", "FileInfo", "GetChildrenParams", "GetChildren",
-    "StorageInfo", "GetListParams", "GetList", "GetStorageParams", "GetStorage",
-    "GetFolderParams", "GetFolder", "AddFolderParams", "AddFolder",
-    "AddSubfolderParams", "AddSubfolder", "GetFileParams", "GetFile",
-    "DeleteTreeParams", "DeleteTree", "UploadFileParams", "UploadFile",
-    "UploadUrlInfo", "GetUploadUrl", "UploadFileComplete"
-]
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .service import DiskService
+    from .async_service import AsyncDiskService
+    from .download import FileDownloader
+    from .walk import TreeWalker
+    from .snapshot import DiskSnapshot, SnapshotEvent
+    from .models import (
+        FolderInfo, FileInfo, GetChildrenParams, GetChildren,
+        StorageInfo, GetListParams, GetList, GetStorageParams, GetStorage,
+        GetFolderParams, GetFolder, AddFolderParams, AddFolder,
+        AddSubfolderParams, AddSubfolder, GetFileParams, GetFile,
+        DeleteTreeParams, DeleteTree, UploadFileParams, UploadFile,
+        UploadUrlInfo, GetUploadUrl, UploadFileComplete, UploadResult, SyncDirectoryResult
+    )
+
+_EXPORTS = {
+    "DiskService": ".service", "AsyncDiskService": ".async_service", "FileDownloader": ".download",
+    "TreeWalker": ".walk", "DiskSnapshot": ".snapshot", "SnapshotEvent": ".snapshot",
+    **dict.fromkeys([
+        "FolderInfo", "FileInfo", "GetChildrenParams", "GetChildren",
+        "StorageInfo", "GetListParams", "GetList", "GetStorageParams", "GetStorage",
+        "GetFolderParams", "GetFolder", "AddFolderParams", "AddFolder",
+        "AddSubfolderParams", "AddSubfolder", "GetFileParams", "GetFile",
+        "DeleteTreeParams", "DeleteTree", "UploadFileParams", "UploadFile",
+        "UploadUrlInfo", "GetUploadUrl", "UploadFileComplete", "UploadResult", "SyncDirectoryResult",
+    ], ".models"),
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
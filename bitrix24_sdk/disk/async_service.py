@@ -0,0 +1,317 @@
+from typing import Optional, TYPE_CHECKING, List, Dict, Any, AsyncIterator, Sequence, Union
+
+from .models import (
+    FolderInfo, FileInfo, StorageInfo,
+    GetChildrenParams, GetChildren,
+    GetListParams, GetList, GetStorageParams, GetStorage,
+    GetFolderParams, GetFolder, AddFolderParams, AddFolder,
+    AddSubfolderParams, AddSubfolder, GetFileParams, GetFile,
+    DeleteTreeParams, DeleteTree, UploadFileParams, UploadFile,
+    GetUploadUrl, UploadFileComplete
+)
+from ..utils.multipart import DEFAULT_CHUNK_SIZE, FileSource, MultipartStream, ProgressCallback, source_name
+from ..utils.pagination import aiter_pages, offset_step
+from ..utils.response import ResponseMode
+
+if TYPE_CHECKING:
+    from ..bitrix_http import AsyncBitrixHttpClient
+
+
+class AsyncDiskService:
+    """
+    Асинхронный сервис для работы с Bitrix24 Disk API.
+
+    Повторяет методы DiskService и использует те же модели параметров и ответов.
+
+    Example:
+        >>> client = AsyncBitrixClient(token="...", user_id=123)
+        >>> storages = await client.disk.get_list()
+    """
+
+    def __init__(self, http: "AsyncBitrixHttpClient") -> None:
+        self._http = http
+
+    async def get_children(self, id: int | str, filter: Optional[Dict[str, Any]] = None,
+                           start: Optional[int] = None, mode: Optional[ResponseMode] = None,
+                           fields: Optional[Sequence[str]] = None) -> GetChildren:
+        """
+        Получить содержимое папки (файлы и подпапки).
+
+        Args:
+            id: ID папки
+            filter: Опциональный фильтр по полям
+            start: Начальная позиция для пагинации
+            mode: Режим разбора объектов: model, raw (словари) или lazy (None — RESPONSE_MODE клиента)
+            fields: Поля объектов, которые нужно оставить
+
+        Returns:
+            GetChildren: Список файлов и папок
+        """
+        params = GetChildrenParams(id=id, filter=filter, start=start)
+        return await self._http.call_pydantic(
+            method="disk.folder.getchildren",
+            params=params.to_bx_params(),
+            model=GetChildren,
+            mode=mode,
+            fields=fields,
+        )
+
+    async def get_list(self, filter: Optional[Dict[str, Any]] = None, start: Optional[int] = None) -> GetList:
+        """
+        Получить список доступных хранилищ.
+
+        Args:
+            filter: Фильтр по полям
+            start: Начальная позиция для пагинации
+
+        Returns:
+            GetList: Список хранилищ
+        """
+        params = GetListParams(filter=filter, start=start)
+        return await self._http.call_pydantic(
+            method="disk.storage.getlist",
+            params=params.to_bx_params(),
+            model=GetList,
+        )
+
+    async def get_storage(self, id: str) -> GetStorage:
+        """
+        Получить информацию о хранилище по ID.
+
+        Args:
+            id: ID хранилища
+
+        Returns:
+            GetStorage: Информация о хранилище
+        """
+        params = GetStorageParams(id=id)
+        return await self._http.call_pydantic(
+            method="disk.storage.get",
+            params=params.to_bx_params(),
+            model=GetStorage,
+        )
+
+    async def get_folder(self, id: int) -> GetFolder:
+        """
+        Получить информацию о папке по ID.
+
+        Args:
+            id: ID папки
+
+        Returns:
+            GetFolder: Информация о папке
+        """
+        params = GetFolderParams(id=id)
+        return await self._http.call_pydantic(
+            method="disk.folder.get",
+            params=params.to_bx_params(),
+            model=GetFolder,
+        )
+
+    async def add_folder(self, id: str, data: Dict[str, Any]) -> AddFolder:
+        """
+        Создать папку в корне хранилища.
+
+        Args:
+            id: ID хранилища
+            data: Данные папки, обязательно поле "NAME"
+
+        Returns:
+            AddFolder: Информация о созданной папке
+        """
+        params = AddFolderParams(id=id, data=data)
+        return await self._http.call_pydantic(
+            method="disk.storage.addfolder",
+            params=params.to_bx_params(),
+            model=AddFolder,
+        )
+
+    async def add_subfolder(self, id: int, data: Dict[str, Any]) -> AddSubfolder:
+        """
+        Создать подпапку в указанной папке.
+
+        Args:
+            id: ID родительской папки
+            data: Данные папки, обязательно поле "NAME"
+
+        Returns:
+            AddSubfolder: Информация о созданной папке
+        """
+        params = AddSubfolderParams(id=id, data=data)
+        return await self._http.call_pydantic(
+            method="disk.folder.addsubfolder",
+            params=params.to_bx_params(),
+            model=AddSubfolder,
+        )
+
+    async def get_file(self, id: int) -> GetFile:
+        """
+        Получить информацию о файле по ID.
+
+        Args:
+            id: ID файла
+
+        Returns:
+            GetFile: Информация о файле
+        """
+        params = GetFileParams(id=id)
+        return await self._http.call_pydantic(
+            method="disk.file.get",
+            params=params.to_bx_params(),
+            model=GetFile,
+        )
+
+    async def delete_tree(self, id: int) -> DeleteTree:
+        """
+        Уничтожить папку и все дочерние элементы навсегда.
+
+        Args:
+            id: ID папки
+
+        Returns:
+            DeleteTree: Результат удаления
+        """
+        params = DeleteTreeParams(id=id)
+        return await self._http.call_pydantic(
+            method="disk.folder.deletetree",
+            params=params.to_bx_params(),
+            model=DeleteTree,
+        )
+
+    async def upload_file(self, id: int, data: Dict[str, Any], file_content: Optional[str] = None,
+                          generate_unique_name: Optional[bool] = None,
+                          rights: Optional[List[Dict[str, Any]]] = None) -> UploadFile:
+        """
+        Загрузить файл в папку (с base64 или получить uploadUrl).
+
+        Args:
+            id: ID папки
+            data: Данные файла, обязательно поле "NAME"
+            file_content: Содержимое файла в Base64
+            generate_unique_name: Генерировать уникальное имя при конфликте
+            rights: Права доступа
+
+        Returns:
+            UploadFile или GetUploadUrl: Результат загрузки или URL для загрузки
+        """
+        params = UploadFileParams(
+            id=id, data=data, file_content=file_content,
+            generate_unique_name=generate_unique_name, rights=rights
+        )
+
+        raw_result = await self._http.call(method="disk.folder.uploadfile", params=params.to_bx_params())
+
+        result = raw_result['result']
+        if 'uploadUrl' in result and 'field' in result:
+            return GetUploadUrl.model_validate(raw_result)
+        else:
+            return UploadFile.model_validate(raw_result)
+
+    async def upload_file_complete(self, folder_id: int, file_content: FileSource, file_name: Optional[str] = None,
+                                   content_type: Optional[str] = None, on_progress: Optional[ProgressCallback] = None,
+                                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> UploadFileComplete:
+        """
+        Загрузить файл в папку Bitrix24 Disk.
+
+        Выполняет полную загрузку файла: получает upload URL и отправляет файл потоком.
+
+        Args:
+            folder_id: ID папки для загрузки
+            file_content: Содержимое файла: байты, путь, файловый объект или итератор байтов
+            file_name: Имя файла (по умолчанию имя исходного файла)
+            content_type: MIME тип файла (по умолчанию определяется по имени)
+            on_progress: Обратный вызов прогресса: (отправлено байт, всего байт или None)
+            chunk_size: Размер читаемой части в байтах
+
+        Returns:
+            UploadFileComplete: Информация о загруженном файле
+
+        Raises:
+            Exception: При ошибке загрузки
+        """
+        file_name = file_name or source_name(file_content)
+        if not file_name:
+            raise ValueError("Не удалось определить имя файла, передайте file_name")
+
+        upload_info = await self.get_upload_url(folder_id)
+        upload_url = upload_info.result.upload_url
+        field_name = upload_info.result.field
+
+        body = MultipartStream(field_name, file_name, file_content, content_type=content_type,
+                               chunk_size=chunk_size, on_progress=on_progress)
+        response = await self._http.request("POST", upload_url, content=body.aiter_chunks(), headers=body.headers())
+
+        if response.status_code == 200:
+            return UploadFileComplete.model_validate_json(response.content)
+        else:
+            raise Exception(f"Ошибка загрузки: {response.status_code}, {response.text}")
+
+    async def get_upload_url(self, id: int) -> GetUploadUrl:
+        """
+        Получить URL для загрузки файла (двухэтапная загрузка).
+
+        Args:
+            id: ID папки
+
+        Returns:
+            GetUploadUrl: URL и поле для загрузки файла
+        """
+        return await self._http.call_pydantic(
+            method="disk.folder.uploadfile",
+            params={"id": id},
+            model=GetUploadUrl,
+        )
+
+
+    async def iter_children(self, id: int | str, filter: Optional[Dict[str, Any]] = None,
+                            prefetch: int = 0, mode: Optional[ResponseMode] = None,
+                            fields: Optional[Sequence[str]] = None) -> AsyncIterator[Union[FolderInfo, FileInfo]]:
+        """
+        Перебрать содержимое папки с автоматической постраничной навигацией.
+
+        Args:
+            id: ID папки
+            filter: Опциональный фильтр по полям
+            prefetch: Сколько страниц загружать заранее, пока обрабатывается текущая
+            mode: Режим разбора объектов (см. get_children)
+            fields: Поля объектов, которые нужно оставить
+
+        Yields:
+            FolderInfo | FileInfo: Папки и файлы по одному (в режиме raw — словари, lazy — LazyRecord)
+        """
+        query = GetChildrenParams(id=id, filter=filter).page_query()
+        pages = aiter_pages(
+            fetch=lambda start: self._http.call_pydantic(
+                method="disk.folder.getchildren", params=query.at(start), model=GetChildren, mode=mode, fields=fields,
+            ),
+            next_cursor=lambda page, start: page.next,
+            prefetch=prefetch,
+            speculate=offset_step,
+        )
+        async for page in pages:
+            for item in page.result or []:
+                yield item
+
+    async def iter_storages(self, filter: Optional[Dict[str, Any]] = None,
+                            prefetch: int = 0) -> AsyncIterator[StorageInfo]:
+        """
+        Перебрать все доступные хранилища с автоматической постраничной навигацией.
+
+        Args:
+            filter: Фильтр по полям
+            prefetch: Сколько страниц загружать заранее, пока обрабатывается текущая
+
+        Yields:
+            StorageInfo: Хранилища по одному
+        """
+        query = GetListParams(filter=filter).page_query()
+        pages = aiter_pages(
+            fetch=lambda start: self._http.call_pydantic(method="disk.storage.getlist", params=query.at(start),
+                                                         model=GetList),
+            next_cursor=lambda page, start: page.next,
+            prefetch=prefetch,
+            speculate=offset_step,
+        )
+        async for page in pages:
+            for item in page.result or []:
+                yield item
@@ -0,0 +1,258 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union, TYPE_CHECKING
+
+from .models import FileInfo, FolderInfo, SyncDirectoryResult, UploadResult, UploadUrlInfo
+from ..bitrix_http.batch import BATCH_MAX_COMMANDS
+from ..utils.multipart import DEFAULT_CHUNK_SIZE, FileSource, source_name
+
+if TYPE_CHECKING:
+    from .service import DiskService
+    from ..bitrix_http.batch import BatchCommand, BitrixBatch
+
+
+UploadSource = Union[FileSource, Tuple[FileSource, str]]
+"""Файл для массовой загрузки: источник содержимого или пара (источник, имя файла)."""
+
+ResultCallback = Callable[[UploadResult], None]
+"""Обратный вызов, получающий результат каждого файла по мере готовности."""
+
+
+class _Job(NamedTuple):
+    index: int
+    folder_id: int
+    source: FileSource
+    name: str
+
+
+class BulkUploader:
+    """
+    Массовая загрузка файлов в Bitrix24 Disk.
+
+    URL загрузки запрашиваются пакетами по 50 через метод batch, а сами файлы
+    отправляются пулом потоков с ограниченным числом одновременных загрузок.
+    URL для следующей части файлов запрашиваются, пока загружается текущая,
+    но не дальше, чем на одну часть вперёд, чтобы они не успевали устареть.
+    Ошибка одного файла не прерывает загрузку: она попадает в его UploadResult.
+
+    Example:
+        >>> uploader = BulkUploader(client.disk, workers=8)
+        >>> results = uploader.upload_many(123, ["/reports/a.pdf", "/reports/b.pdf"])
+        >>> print([r.error for r in results if not r.ok])
+    """
+
+    def __init__(self, disk: "DiskService", workers: int = 4, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 on_result: Optional[ResultCallback] = None) -> None:
+        """
+        Инициализация загрузчика.
+
+        Args:
+            disk: Сервис Disk API
+            workers: Максимум одновременных загрузок
+            chunk_size: Размер читаемой части файла в байтах
+            on_result: Обратный вызов с результатом каждого файла
+        """
+        if workers < 1:
+            raise ValueError("workers должен быть не меньше 1")
+        self._disk = disk
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.on_result = on_result
+
+    def upload_many(self, folder_id: int, files: Iterable[UploadSource]) -> List[UploadResult]:
+        """
+        Загрузить файлы в одну папку.
+
+        Args:
+            folder_id: ID папки назначения
+            files: Пути, файловые объекты или пары (источник, имя файла)
+
+        Returns:
+            Результаты загрузки в порядке исходного списка
+        """
+        jobs = []
+        for index, item in enumerate(files):
+            source, name = item if isinstance(item, tuple) else (item, source_name(item))
+            if not name:
+                raise ValueError(f"Не удалось определить имя файла #{index}, передайте пару (источник, имя)")
+            jobs.append(_Job(index, folder_id, source, name))
+        return self._upload(jobs)
+
+    def sync_directory(self, local_path: Union[str, "os.PathLike[str]"], folder_id: int,
+                       skip_existing: bool = True, follow_symlinks: bool = False) -> SyncDirectoryResult:
+        """
+        Загрузить локальный каталог в папку, повторив структуру подкаталогов.
+
+        Подпапки создаются уровень за уровнем пакетными вызовами add_subfolder;
+        уже существующие подпапки используются повторно. Ссылки на каталоги
+        по умолчанию пропускаются; при follow_symlinks каждый каталог
+        обходится один раз, поэтому ссылка на родительский каталог не
+        зацикливает обход.
+
+        Args:
+            local_path: Локальный каталог
+            folder_id: ID папки назначения
+            skip_existing: Не загружать файлы, имя которых уже есть в папке назначения
+            follow_symlinks: Заходить в каталоги по символическим ссылкам
+
+        Returns:
+            SyncDirectoryResult: ID папок по относительным путям и результаты по файлам
+        """
+        root = os.fspath(local_path)
+        if not os.path.isdir(root):
+            raise ValueError(f"{root} не является каталогом")
+
+        result = SyncDirectoryResult(folders={"": folder_id})
+        slots: List[Union[UploadResult, _Job]] = []
+        created = set()
+        visited = {_dir_key(os.stat(root))}
+        level = [""]
+        while level:
+            next_level: List[str] = []
+            pending: List[Tuple[str, int, str]] = []
+            for rel in level:
+                parent_id = result.folders[rel]
+                remote: Dict[str, Union[FolderInfo, FileInfo]] = {}
+                if rel not in created:
+                    remote = {item.name: item for item in self._disk.iter_children(parent_id, mode="model")}
+                for entry in sorted(os.scandir(os.path.join(root, rel)), key=lambda e: e.name):
+                    child = f"{rel}/{entry.name}" if rel else entry.name
+                    existing = remote.get(entry.name)
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        key = _dir_key(entry.stat())
+                        if key in visited:
+                            continue
+                        visited.add(key)
+                        if isinstance(existing, FolderInfo):
+                            result.folders[child] = existing.id
+                            next_level.append(child)
+                        else:
+                            pending.append((child, parent_id, entry.name))
+                    elif entry.is_file():
+                        if skip_existing and isinstance(existing, FileInfo):
+                            slots.append(UploadResult(source=entry.path, name=entry.name, folder_id=parent_id,
+                                                      file=existing, skipped=True))
+                        else:
+                            slots.append(_Job(0, parent_id, entry.path, entry.name))
+
+            for (child, parent_id, _), created_folder in zip(pending, self._create_folders(pending)):
+                if isinstance(created_folder, FolderInfo):
+                    result.folders[child] = created_folder.id
+                    created.add(child)
+                    next_level.append(child)
+                    continue
+                # Файлы каталога, для которого не удалось создать папку, отмечаются ошибкой
+                for dir_path, dir_names, names in os.walk(os.path.join(root, child), followlinks=follow_symlinks):
+                    dir_names[:] = [name for name in dir_names
+                                    if _visit(os.path.join(dir_path, name), follow_symlinks, visited)]
+                    for file_name in sorted(names):
+                        slots.append(UploadResult(source=os.path.join(dir_path, file_name), name=file_name,
+                                                  folder_id=parent_id,
+                                                  error=f"Не удалось создать папку {child}: {created_folder}"))
+            level = next_level
+
+        for slot in slots:
+            if isinstance(slot, UploadResult) and self.on_result is not None:
+                self.on_result(slot)
+        jobs = [slot._replace(index=index) for index, slot in enumerate(s for s in slots if isinstance(s, _Job))]
+        uploaded = iter(self._upload(jobs))
+        result.files = [next(uploaded) if isinstance(slot, _Job) else slot for slot in slots]
+        return result
+
+    def _create_folders(self, pending: List[Tuple[str, int, str]]) -> List[Union[FolderInfo, Exception]]:
+        """Создать подпапки пакетными вызовами add_subfolder."""
+        if not pending:
+            return []
+        batch = self._disk._http.batch()
+        commands = [batch.disk.add_subfolder(parent_id, {"NAME": name}) for _, parent_id, name in pending]
+        return _batch_results(batch, commands)
+
+    def _upload_urls(self, jobs: List[_Job]) -> List[Union[UploadUrlInfo, Exception]]:
+        """Получить URL загрузки для каждого файла одним пакетным вызовом."""
+        batch = self._disk._http.batch()
+        commands = [batch.disk.get_upload_url(job.folder_id) for job in jobs]
+        return _batch_results(batch, commands)
+
+    def _upload(self, jobs: List[_Job]) -> List[UploadResult]:
+        results: List[Optional[UploadResult]] = [None] * len(jobs)
+
+        def complete(job: _Job, result: UploadResult) -> None:
+            results[job.index] = result
+            if self.on_result is not None:
+                self.on_result(result)
+
+        inflight: Deque[Tuple[_Job, "Future[UploadResult]"]] = deque()
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bitrix-upload")
+        try:
+            for offset in range(0, len(jobs), BATCH_MAX_COMMANDS):
+                chunk = jobs[offset:offset + BATCH_MAX_COMMANDS]
+                for job, url in zip(chunk, self._upload_urls(chunk)):
+                    if isinstance(url, Exception):
+                        complete(job, _failed(job, url))
+                    else:
+                        inflight.append((job, executor.submit(self._upload_one, job, url)))
+                # URL следующей части запрашиваются, только когда в работе остались последние файлы текущей
+                while len(inflight) > self.workers:
+                    job, future = inflight.popleft()
+                    complete(job, future.result())
+            while inflight:
+                job, future = inflight.popleft()
+                complete(job, future.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return [result for result in results if result is not None]
+
+    def _upload_one(self, job: _Job, upload_info: UploadUrlInfo) -> UploadResult:
+        try:
+            response = self._disk.upload_to_url(upload_info, job.source, job.name, chunk_size=self.chunk_size)
+        except Exception as e:
+            return _failed(job, e)
+        return UploadResult(source=_describe(job.source, job.name), name=job.name, folder_id=job.folder_id,
+                            file=response.result)
+
+
+def _batch_results(batch: "BitrixBatch", commands: List["BatchCommand"]) -> List[Any]:
+    """Выполнить пакет и вернуть поле result ответа каждой команды или её ошибку."""
+    try:
+        batch.execute()
+    except Exception as e:
+        return [e] * len(commands)
+    results: List[Any] = []
+    for command in commands:
+        if command.error is not None:
+            results.append(command.error)
+        elif command.result().result is None:
+            results.append(RuntimeError(f"Пустой ответ {command.method}"))
+        else:
+            results.append(command.result().result)
+    return results
+
+
+def _describe(source: FileSource, name: str) -> str:
+    """Строковое описание источника для UploadResult."""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    path = getattr(source, "name", None)
+    return path if isinstance(path, str) else name
+
+
+def _failed(job: _Job, error: Exception) -> UploadResult:
+    return UploadResult(source=_describe(job.source, job.name), name=job.name, folder_id=job.folder_id,
+                        error=str(error) or type(error).__name__)
+
+
+def _dir_key(stat: os.stat_result) -> Tuple[int, int]:
+    """Устройство и inode каталога: один и тот же каталог по разным путям."""
+    return stat.st_dev, stat.st_ino
+
+
+def _visit(path: str, follow_symlinks: bool, visited: Set[Tuple[int, int]]) -> bool:
+    """Отметить каталог обойдённым; False — ссылку не обходить или каталог уже обойдён."""
+    if not follow_symlinks and os.path.islink(path):
+        return False
+    key = _dir_key(os.stat(path))
+    if key in visited:
+        return False
+    visited.add(key)
+    return True
@@ -0,0 +1,267 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Union, TYPE_CHECKING
+from urllib.parse import urljoin
+
+from .models import FileInfo
+from ..utils.multipart import DEFAULT_CHUNK_SIZE, ProgressCallback
+
+if TYPE_CHECKING:
+    from .service import DiskService
+
+
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+"""Размер диапазона байтов, скачиваемого одним потоком при параллельном скачивании."""
+
+PART_SUFFIX = ".part"
+"""Суффикс временного файла, в который идёт скачивание до проверки размера."""
+
+
+class FileDownloader:
+    """
+    Потоковое скачивание файлов Bitrix24 Disk по DOWNLOAD_URL.
+
+    Файл пишется на диск частями chunk_size во временный файл <dest>.part и
+    переименовывается в dest только после проверки размера по метаданным
+    disk.file.get, поэтому потребление памяти не зависит от размера файла.
+    Прерванное скачивание продолжается с места остановки запросом Range,
+    в том числе автоматически при временных сетевых ошибках. Большие файлы
+    можно скачивать параллельно диапазонами байтов.
+
+    Example:
+        >>> downloader = FileDownloader(client.disk, workers=4)
+        >>> path = downloader.download(456, "/data/backup/")
+    """
+
+    def __init__(self, disk: "DiskService", chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1,
+                 part_size: int = DEFAULT_PART_SIZE) -> None:
+        """
+        Инициализация скачивания.
+
+        Args:
+            disk: Сервис Disk API
+            chunk_size: Размер записываемой части в байтах
+            workers: Количество потоков; больше 1 — параллельное скачивание диапазонами
+            part_size: Размер диапазона байтов одного потока
+        """
+        if workers < 1 or chunk_size < 1 or part_size < 1:
+            raise ValueError("chunk_size, workers и part_size должны быть не меньше 1")
+        self._disk = disk
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.part_size = part_size
+
+    def download(self, file: Union[int, FileInfo], dest: Union[str, "os.PathLike[str]"], resume: bool = True,
+                 verify: bool = True, on_progress: Optional[ProgressCallback] = None) -> str:
+        """
+        Скачать файл.
+
+        Args:
+            file: ID файла или FileInfo
+            dest: Путь к файлу или существующий каталог (тогда файл сохраняется под своим именем)
+            resume: Продолжить скачивание из оставшегося <dest>.part
+            verify: Сверить размер скачанного файла с метаданными disk.file.get
+            on_progress: Обратный вызов прогресса: (получено байт, всего байт или None)
+
+        Returns:
+            Путь к скачанному файлу
+
+        Raises:
+            OSError: Если размер скачанного файла не совпадает с метаданными
+        """
+        info = file
+        if not isinstance(info, FileInfo) or (verify and info.size is None):
+            info = self._disk.get_file(info.id if isinstance(info, FileInfo) else info).result
+            if info is None:
+                raise ValueError(f"Файл {file} не найден")
+
+        path = os.fspath(dest)
+        if os.path.isdir(path):
+            path = os.path.join(path, info.name)
+        part_path = path + PART_SUFFIX
+        url = urljoin(self._disk._http.settings.BASE_URL, info.download_url)
+
+        state_path = _state_path(part_path)
+        part_size = self.part_size
+        ranged = self.workers > 1 and info.size is not None and info.size > self.part_size
+        if os.path.exists(state_path):
+            # .part рядом с .part.json заранее имеет полный размер и может содержать пропуски:
+            # продолжать его можно только по диапазонам, а не с конца файла
+            state = _load_state(state_path) if resume else {}
+            if info.size is not None and state.get("size") == info.size and isinstance(state.get("part_size"), int):
+                ranged, part_size = True, state["part_size"]
+            elif not ranged:
+                _remove(part_path)
+                _remove(state_path)
+
+        if ranged:
+            try:
+                self._download_ranges(url, part_path, info.size, resume, on_progress, part_size)
+            except _RangesNotSupported:
+                _remove(part_path)
+                _remove(state_path)
+                self._download_stream(url, part_path, info.size, False, on_progress)
+        else:
+            self._download_stream(url, part_path, info.size, resume, on_progress)
+
+        received = os.path.getsize(part_path)
+        if verify and info.size is not None and received != info.size:
+            os.remove(part_path)
+            raise OSError(f"Размер скачанного файла {info.name} ({received}) не совпадает с ожидаемым ({info.size})")
+        os.replace(part_path, path)
+        _remove(_state_path(part_path))
+        return path
+
+    def _download_stream(self, url: str, part_path: str, size: Optional[int], resume: bool,
+                         on_progress: Optional[ProgressCallback]) -> None:
+        """Скачать файл одним потоком, продолжая с конца .part файла после обрыва."""
+        if not resume:
+            _remove(part_path)
+        if size == 0:
+            # Пустой файл скачивать нечего
+            open(part_path, "wb").close()
+            return
+        attempt = 0
+        while True:
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            if size is not None and offset == size:
+                return
+            try:
+                self._fetch(url, part_path, offset, None, size, on_progress)
+                return
+            except Exception as e:
+                attempt += 1
+                self._backoff(e, attempt)
+
+    def _download_ranges(self, url: str, part_path: str, size: int, resume: bool,
+                         on_progress: Optional[ProgressCallback], part_size: Optional[int] = None) -> None:
+        """Скачать файл параллельно диапазонами байтов; готовые диапазоны запоминаются в <dest>.part.json."""
+        part_size = part_size or self.part_size
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+        state_path = _state_path(part_path)
+        done = set()
+        if resume and os.path.exists(part_path) and os.path.exists(state_path):
+            state = _load_state(state_path)
+            if state.get("size") == size and state.get("part_size") == part_size:
+                done = set(state.get("done", []))
+        if not done:
+            # Состояние записывается до того, как .part получит полный размер,
+            # иначе прерванное скачивание выглядело бы завершённым
+            _save_state(state_path, {"size": size, "part_size": part_size, "done": []})
+            with open(part_path, "wb") as f:
+                f.truncate(size)
+
+        lock = threading.Lock()
+        received = [sum(ranges[index][1] - ranges[index][0] + 1 for index in done)]
+
+        def progress(delta: int) -> None:
+            with lock:
+                received[0] += delta
+                if on_progress is not None:
+                    on_progress(received[0], size)
+
+        def fetch_range(index: int) -> None:
+            start, end = ranges[index]
+            offset = [start]
+
+            def on_chunk(length: int) -> None:
+                offset[0] += length
+                progress(length)
+
+            attempt = 0
+            while True:
+                try:
+                    self._fetch(url, part_path, offset[0], end, size, None, on_chunk)
+                    break
+                except Exception as e:
+                    attempt += 1
+                    self._backoff(e, attempt)
+            with lock:
+                done.add(index)
+                _save_state(state_path, {"size": size, "part_size": part_size, "done": sorted(done)})
+
+        pending = [index for index in range(len(ranges)) if index not in done]
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bitrix-download") as executor:
+            for future in [executor.submit(fetch_range, index) for index in pending]:
+                future.result()
+
+    def _fetch(self, url: str, part_path: str, start: int, end: Optional[int], size: Optional[int],
+               on_progress: Optional[ProgressCallback],
+               on_chunk: Optional[Callable[[int], None]] = None) -> int:
+        """
+        Скачать байты [start, end] (до конца файла, если end не задан) в part_path.
+
+        Returns:
+            Количество записанных байт
+        """
+        headers: Dict[str, str] = {}
+        if start or end is not None:
+            headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+        with self._disk._http.transport.get(url, headers=headers, stream=True) as response:
+            if response.status_code == 416 and end is None and size is not None and start >= size:
+                return 0
+            response.raise_for_status()
+            if end is not None and response.status_code != 206:
+                raise _RangesNotSupported(url)
+            if start and response.status_code != 206:
+                # Сервер проигнорировал Range — файл скачивается заново
+                start = 0
+            total = size
+            if total is None and response.headers.get("Content-Length") and end is None:
+                total = start + int(response.headers["Content-Length"])
+
+            written = 0
+            mode = "r+b" if end is not None else ("ab" if start else "wb")
+            with open(part_path, mode) as f:
+                if end is not None:
+                    f.seek(start)
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if not chunk:
+                        continue
+                    f.write(chunk)
+                    written += len(chunk)
+                    if on_chunk is not None:
+                        on_chunk(len(chunk))
+                    if on_progress is not None:
+                        on_progress(start + written, total)
+            return written
+
+    def _backoff(self, exc: Exception, attempt: int) -> None:
+        """Подождать перед повтором или пробросить ошибку, если она не временная."""
+        policy = self._disk._http.retry_policy
+        if policy is None or attempt >= policy.max_attempts or not policy.is_transient(exc):
+            raise exc
+        time.sleep(policy.delay(attempt, exc))
+
+
+class _RangesNotSupported(OSError):
+    """Сервер отвечает на запрос диапазона целым файлом."""
+
+
+def _state_path(part_path: str) -> str:
+    return part_path + ".json"
+
+
+def _load_state(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(path: str, state: Dict[str, Any]) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
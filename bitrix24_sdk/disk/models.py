@@ -35,6 +35,7 @@ class FileInfo(BaseModel):
     created_by: int = Field(..., alias="CREATED_BY", description="Идентификатор пользователя, создавшего файл")
     updated_by: int = Field(..., alias="UPDATED_BY", description="Идентификатор пользователя, изменившего файл")
     deleted_by: Optional[int] = Field(None, alias="DELETED_BY", description="Идентификатор пользователя, переместившего в корзину файл")
+    size: Optional[int] = Field(None, alias="SIZE", description="Размер файла в байтах")
     download_url: str = Field(..., alias="DOWNLOAD_URL", description="URL для скачивания файла приложением")
     detail_url: str = Field(..., alias="DETAIL_URL", description="Ссылка на страницу детальной информации о файле")
 
@@ -50,6 +51,7 @@ class GetChildren(BaseModel):
     """Ответ метода disk.folder.getchildren."""
     result: Optional[List[Union[FolderInfo, FileInfo]]] = Field(None, description="Список папок и файлов")
     next: Optional[int] = Field(None, description="Номер следующего элемента для постраничной навигации")
+    total: Optional[int] = Field(None, description="Общее количество элементов в папке")
 
 
 class StorageInfo(BaseModel):
@@ -72,6 +74,8 @@ class GetListParams(BitrixParams):
 class GetList(BaseModel):
     """Ответ метода disk.storage.getlist."""
     result: Optional[List[StorageInfo]] = Field(None, description="Список доступных хранилищ")
+    next: Optional[int] = Field(None, description="Номер следующего элемента для постраничной навигации")
+    total: Optional[int] = Field(None, description="Общее количество хранилищ")
 
 
 class GetStorageParams(BitrixParams):
@@ -166,3 +170,29 @@ class UploadFileComplete(BaseModel):
     result: Optional[FileInfo] = Field(None, description="Информация о загруженном файле")
 
 
+
+
+class UploadResult(BaseModel):
+    """Результат загрузки одного файла при массовой загрузке."""
+    source: str = Field(..., description="Исходный файл (путь или имя)")
+    name: str = Field(..., description="Имя файла в Bitrix24 Disk")
+    folder_id: int = Field(..., description="Идентификатор папки назначения")
+    file: Optional[FileInfo] = Field(None, description="Информация о загруженном файле")
+    error: Optional[str] = Field(None, description="Текст ошибки, если загрузка не удалась")
+    skipped: bool = Field(False, description="Файл пропущен, так как уже есть в папке")
+
+    @property
+    def ok(self) -> bool:
+        """Файл загружен или пропущен без ошибки."""
+        return self.error is None
+
+
+class SyncDirectoryResult(BaseModel):
+    """Результат синхронизации локального каталога с папкой Bitrix24 Disk."""
+    folders: Dict[str, int] = Field(default_factory=dict, description="ID папок по относительному пути каталога")
+    files: List[UploadResult] = Field(default_factory=list, description="Результаты загрузки файлов")
+
+    @property
+    def failed(self) -> List[UploadResult]:
+        """Файлы, которые не удалось загрузить."""
+        return [result for result in self.files if not result.ok]
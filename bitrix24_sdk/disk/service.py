@@ -1,18 +1,30 @@
-import io
-import requests
-from typing import Optional, TYPE_CHECKING, List
+import os
+from typing import Optional, TYPE_CHECKING, List, Iterable, Iterator, Sequence, Tuple, Union
 from .models import (
+    FolderInfo, StorageInfo,
     GetChildrenParams, GetChildren,
     GetListParams, GetList, GetStorageParams, GetStorage,
     GetFolderParams, GetFolder, AddFolderParams, AddFolder,
     AddSubfolderParams, AddSubfolder, GetFileParams, GetFile,
     DeleteTreeParams, DeleteTree, UploadFileParams, UploadFile,
-    GetUploadUrl, FileInfo, UploadFileComplete
+    GetUploadUrl, FileInfo, UploadFileComplete, UploadUrlInfo,
+    UploadResult, SyncDirectoryResult
 )
 from typing import Dict, Any
+from ..utils.columnar import DEFAULT_BATCH_ROWS, Column, columns_from_model, open_table_writer
+from ..utils.multipart import DEFAULT_CHUNK_SIZE, FileSource, MultipartStream, ProgressCallback, source_name
+from ..utils.pagination import iter_pages, offset_step
+from ..utils.response import ResponseMode
+from .download import DEFAULT_PART_SIZE, FileDownloader
+from .walk import TreeWalker, WalkErrorHandler, WalkPredicate
+from .snapshot import DiskSnapshot
 
 if TYPE_CHECKING:
     from ..bitrix_http import BitrixHttpClient
+    from .bulk import ResultCallback, UploadSource
+
+_EXPORT_CHUNK = 500
+"""Сколько объектов обхода передаётся в запись за раз."""
 
 
 class DiskService:
@@ -44,7 +56,8 @@ class DiskService:
     def __init__(self, http: "BitrixHttpClient") -> None:
         self._http = http
 
-    def get_children(self, id: int | str, filter: Optional[Dict[str, Any]] = None, start: Optional[int] = None) -> GetChildren:
+    def get_children(self, id: int | str, filter: Optional[Dict[str, Any]] = None, start: Optional[int] = None,
+                     mode: Optional[ResponseMode] = None, fields: Optional[Sequence[str]] = None) -> GetChildren:
         """
         Получить содержимое папки (файлы и подпапки).
 
@@ -52,6 +65,8 @@ class DiskService:
             id: ID папки
             filter: Опциональный фильтр по полям
             start: Начальная позиция для пагинации
+            mode: Режим разбора объектов: model, raw (словари) или lazy (None — RESPONSE_MODE клиента)
+            fields: Поля объектов, которые нужно оставить, например ["id", "name", "size"]
 
         Returns:
             GetChildren: Список файлов и папок
@@ -67,6 +82,8 @@ class DiskService:
             method="disk.folder.getchildren",
             params=params.to_bx_params(),
             model=GetChildren,
+            mode=mode,
+            fields=fields,
         )
 
     def get_list(self, filter: Optional[Dict[str, Any]] = None, start: Optional[int] = None) -> GetList:
@@ -223,17 +240,23 @@ class DiskService:
         else:
             return UploadFile.model_validate(raw_result)
 
-    def upload_file_complete(self, folder_id: int, file_content: bytes, file_name: str, content_type: str = 'application/pdf') -> UploadFileComplete:
+    def upload_file_complete(self, folder_id: int, file_content: FileSource, file_name: Optional[str] = None,
+                             content_type: Optional[str] = None, on_progress: Optional[ProgressCallback] = None,
+                             chunk_size: int = DEFAULT_CHUNK_SIZE) -> UploadFileComplete:
         """
         Загрузить файл в папку Bitrix24 Disk.
 
         Выполняет полную загрузку файла: получает upload URL и отправляет файл.
+        Тело запроса передаётся потоком по частям, поэтому файлы любого размера
+        загружаются с постоянным потреблением памяти.
 
         Args:
             folder_id: ID папки для загрузки
-            file_content: Содержимое файла в байтах
-            file_name: Имя файла
-            content_type: MIME тип файла
+            file_content: Содержимое файла: байты, путь, файловый объект или итератор байтов
+            file_name: Имя файла (по умолчанию имя исходного файла)
+            content_type: MIME тип файла (по умолчанию определяется по имени)
+            on_progress: Обратный вызов прогресса: (отправлено байт, всего байт или None)
+            chunk_size: Размер читаемой части в байтах
 
         Returns:
             UploadFileComplete: Информация о загруженном файле
@@ -250,20 +273,149 @@ class DiskService:
             ...     file_name="report.pdf"
             ... )
             >>> print(f"Файл загружен: {result.result.name}")
+            >>>
+            >>> # Загрузка большого файла с диска без чтения в память
+            >>> result = client.disk.upload_file_complete(
+            ...     folder_id=123,
+            ...     file_content="/data/scan.tiff",
+            ...     on_progress=lambda sent, total: print(sent, total)
+            ... )
         """
+        file_name = file_name or source_name(file_content)
+        if not file_name:
+            raise ValueError("Не удалось определить имя файла, передайте file_name")
+
         upload_info = self.get_upload_url(folder_id)
-        upload_url = upload_info.result.upload_url
-        field_name = upload_info.result.field
+        return self.upload_to_url(upload_info.result, file_content, file_name, content_type=content_type,
+                                  on_progress=on_progress, chunk_size=chunk_size)
 
-        file_obj = io.BytesIO(file_content)
-        files = {field_name: (file_name, file_obj, content_type)}
-        response = requests.post(upload_url, files=files)
+    def upload_to_url(self, upload_info: UploadUrlInfo, file_content: FileSource, file_name: str,
+                      content_type: Optional[str] = None, on_progress: Optional[ProgressCallback] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> UploadFileComplete:
+        """
+        Отправить файл по ранее полученному URL загрузки (второй этап двухэтапной загрузки).
+
+        Args:
+            upload_info: URL и поле для загрузки из get_upload_url
+            file_content: Содержимое файла: байты, путь, файловый объект или итератор байтов
+            file_name: Имя файла
+            content_type: MIME тип файла (по умолчанию определяется по имени)
+            on_progress: Обратный вызов прогресса: (отправлено байт, всего байт или None)
+            chunk_size: Размер читаемой части в байтах
+
+        Returns:
+            UploadFileComplete: Информация о загруженном файле
+
+        Raises:
+            Exception: При ошибке загрузки
+        """
+        body = MultipartStream(upload_info.field, file_name, file_content, content_type=content_type,
+                               chunk_size=chunk_size, on_progress=on_progress)
+        response = self._http.transport.post(upload_info.upload_url, data=body,
+                                             headers={"Content-Type": body.content_type})
 
         if response.status_code == 200:
-            return UploadFileComplete.model_validate(response.json())
+            return UploadFileComplete.model_validate_json(response.content)
         else:
             raise Exception(f"Ошибка загрузки: {response.status_code}, {response.text}")
 
+    def upload_many(self, folder_id: int, files: Iterable["UploadSource"], workers: int = 4,
+                    on_result: Optional["ResultCallback"] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[UploadResult]:
+        """
+        Загрузить несколько файлов в папку параллельно.
+
+        URL загрузки запрашиваются пакетами через batch, файлы отправляются
+        пулом из workers потоков. Ошибка одного файла не прерывает остальные.
+
+        Args:
+            folder_id: ID папки для загрузки
+            files: Пути, файловые объекты или пары (источник, имя файла)
+            workers: Максимум одновременных загрузок
+            on_result: Обратный вызов с результатом каждого файла по мере готовности
+            chunk_size: Размер читаемой части файла в байтах
+
+        Returns:
+            Список UploadResult в порядке исходного списка файлов
+
+        Example:
+            >>> results = client.disk.upload_many(123, glob.glob("/reports/*.pdf"), workers=8)
+            >>> for r in results:
+            ...     if not r.ok:
+            ...         print(r.source, r.error)
+        """
+        from .bulk import BulkUploader
+
+        uploader = BulkUploader(self, workers=workers, chunk_size=chunk_size, on_result=on_result)
+        return uploader.upload_many(folder_id, files)
+
+    def sync_directory(self, local_path: Union[str, "os.PathLike[str]"], folder_id: int, workers: int = 4,
+                       skip_existing: bool = True, on_result: Optional["ResultCallback"] = None,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE, follow_symlinks: bool = False) -> SyncDirectoryResult:
+        """
+        Загрузить локальный каталог в папку с сохранением структуры подкаталогов.
+
+        Недостающие подпапки создаются через add_subfolder (пакетно, по уровням),
+        затем файлы загружаются так же, как в upload_many.
+
+        Args:
+            local_path: Локальный каталог
+            folder_id: ID папки назначения
+            workers: Максимум одновременных загрузок
+            skip_existing: Пропускать файлы, имя которых уже есть в папке назначения
+            on_result: Обратный вызов с результатом каждого файла по мере готовности
+            chunk_size: Размер читаемой части файла в байтах
+            follow_symlinks: Заходить в каталоги по символическим ссылкам (каждый каталог один раз)
+
+        Returns:
+            SyncDirectoryResult: ID папок по относительным путям и результаты по файлам
+
+        Example:
+            >>> sync = client.disk.sync_directory("/var/reports/2024-05", folder_id=123)
+            >>> print(len(sync.files), len(sync.failed))
+        """
+        from .bulk import BulkUploader
+
+        uploader = BulkUploader(self, workers=workers, chunk_size=chunk_size, on_result=on_result)
+        return uploader.sync_directory(local_path, folder_id, skip_existing=skip_existing,
+                                       follow_symlinks=follow_symlinks)
+
+    def download(self, file: int | FileInfo, dest: Union[str, "os.PathLike[str]"], resume: bool = True,
+                 verify: bool = True, workers: int = 1, part_size: int = DEFAULT_PART_SIZE,
+                 on_progress: Optional[ProgressCallback] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+        """
+        Скачать файл на диск потоком, не загружая его целиком в память.
+
+        Файл пишется во временный <dest>.part и переименовывается после
+        проверки размера по метаданным disk.file.get. Оставшийся после обрыва
+        .part файл докачивается запросом Range.
+
+        Args:
+            file: ID файла или FileInfo
+            dest: Путь к файлу или существующий каталог (файл сохраняется под своим именем)
+            resume: Продолжить прерванное скачивание
+            verify: Сверить размер скачанного файла с метаданными
+            workers: Количество потоков; больше 1 — файлы крупнее part_size скачиваются параллельно диапазонами
+            part_size: Размер диапазона байтов одного потока
+            on_progress: Обратный вызов прогресса: (получено байт, всего байт или None)
+            chunk_size: Размер записываемой части в байтах
+
+        Returns:
+            Путь к скачанному файлу
+
+        Raises:
+            OSError: Если размер скачанного файла не совпадает с метаданными
+
+        Example:
+            >>> path = client.disk.download(456, "/data/backup/", workers=4)
+            >>> for item in client.disk.iter_children(123):
+            ...     if isinstance(item, FileInfo):
+            ...         client.disk.download(item, f"/data/backup/{item.name}")
+        """
+        downloader = FileDownloader(self, chunk_size=chunk_size, workers=workers, part_size=part_size)
+        return downloader.download(file, dest, resume=resume, verify=verify, on_progress=on_progress)
+
     def get_upload_url(self, id: int) -> GetUploadUrl:
         """
         Получить URL для загрузки файла (двухэтапная загрузка).
@@ -278,4 +430,150 @@ class DiskService:
             method="disk.folder.uploadfile",
             params={"id": id},
             model=GetUploadUrl,
-        )
\ No newline at end of file
+        )
+
+    def iter_children(self, id: int | str, filter: Optional[Dict[str, Any]] = None,
+                      prefetch: int = 0, mode: Optional[ResponseMode] = None,
+                      fields: Optional[Sequence[str]] = None) -> Iterator[Union[FolderInfo, FileInfo]]:
+        """
+        Перебрать содержимое папки с автоматической постраничной навигацией.
+
+        Args:
+            id: ID папки
+            filter: Опциональный фильтр по полям
+            prefetch: Сколько страниц загружать заранее, пока обрабатывается текущая
+            mode: Режим разбора объектов (см. get_children)
+            fields: Поля объектов, которые нужно оставить
+
+        Yields:
+            FolderInfo | FileInfo: Папки и файлы по одному (в режиме raw — словари, lazy — LazyRecord)
+
+        Example:
+            >>> for item in client.disk.iter_children(123, prefetch=2):
+            ...     print(item.name)
+        """
+        query = GetChildrenParams(id=id, filter=filter).page_query()
+        pages = iter_pages(
+            fetch=lambda start: self._http.call_pydantic(
+                method="disk.folder.getchildren", params=query.at(start), model=GetChildren, mode=mode, fields=fields,
+            ),
+            next_cursor=lambda page, start: page.next,
+            prefetch=prefetch,
+            speculate=offset_step,
+        )
+        for page in pages:
+            yield from page.result or []
+
+    def walk(self, root_id: int, max_depth: Optional[int] = None, filter: Optional[Dict[str, Any]] = None,
+             predicate: Optional[WalkPredicate] = None, skip_deleted: bool = True, workers: int = 4,
+             on_error: Optional[WalkErrorHandler] = None) -> Iterator[Tuple[str, Union[FolderInfo, FileInfo]]]:
+        """
+        Рекурсивно обойти дерево папок с параллельной загрузкой.
+
+        Содержимое соседних папок запрашивается пакетами через batch,
+        до workers запросов выполняются одновременно.
+
+        Args:
+            root_id: ID корневой папки
+            max_depth: Максимальная глубина (1 — только содержимое корня, None — без ограничения)
+            filter: Фильтр disk.folder.getchildren на каждом уровне; в папки, не прошедшие его, обход не заходит
+            predicate: Клиентский фильтр выдаваемых объектов: (путь, объект) -> bool
+            skip_deleted: Пропускать объекты в корзине
+            workers: Максимум одновременных запросов
+            on_error: Обработчик ошибки чтения папки (путь, ошибка); без него ошибка прерывает обход
+
+        Yields:
+            (путь относительно корня, FolderInfo | FileInfo)
+
+        Example:
+            >>> for path, item in client.disk.walk(123, workers=8):
+            ...     if isinstance(item, FileInfo):
+            ...         print(path, item.size)
+        """
+        walker = TreeWalker(self, workers=workers, max_depth=max_depth, filter=filter, predicate=predicate,
+                            skip_deleted=skip_deleted, on_error=on_error)
+        yield from walker.walk(root_id)
+
+    def export_table(self, root_id: int, path: Union[str, "os.PathLike[str]"], format: Optional[str] = None,
+                     max_depth: Optional[int] = None, filter: Optional[Dict[str, Any]] = None,
+                     predicate: Optional[WalkPredicate] = None, workers: int = 4,
+                     batch_rows: int = DEFAULT_BATCH_ROWS) -> int:
+        """
+        Выгрузить дерево папок в таблицу CSV, Parquet или Arrow.
+
+        Колонки: path (путь относительно корня) и поля FileInfo; у папок поля
+        файла пустые. Объекты пишутся по мере обхода (см. walk), в памяти
+        находится не больше batch_rows строк.
+
+        Args:
+            root_id: ID корневой папки
+            path: Путь к файлу
+            format: csv, parquet или arrow; по умолчанию по расширению path
+            max_depth: Максимальная глубина обхода
+            filter: Фильтр disk.folder.getchildren на каждом уровне
+            predicate: Клиентский фильтр объектов: (путь, объект) -> bool
+            workers: Максимум одновременных запросов
+            batch_rows: Строк в пакете записи (группе строк Parquet)
+
+        Returns:
+            int: Количество выгруженных объектов
+
+        Example:
+            >>> client.disk.export_table(123, "tree.csv", workers=8)
+        """
+        columns = [Column("path", "str"), *columns_from_model(FileInfo)]
+        chunk = min(batch_rows, _EXPORT_CHUNK)
+        with open_table_writer(path, columns, format=format, batch_rows=batch_rows) as writer:
+            paths: List[str] = []
+            items: List[Union[FolderInfo, FileInfo]] = []
+            for item_path, item in self.walk(root_id, max_depth=max_depth, filter=filter, predicate=predicate,
+                                             workers=workers):
+                paths.append(item_path)
+                items.append(item)
+                if len(items) >= chunk:
+                    writer.write(items, extra={"path": paths})
+                    paths, items = [], []
+            if items:
+                writer.write(items, extra={"path": paths})
+        return writer.rows_written
+
+    def snapshot(self, root_id: int, path: str, workers: int = 4) -> DiskSnapshot:
+        """
+        Открыть локальный снимок дерева папок для поиска изменений.
+
+        Args:
+            root_id: ID корневой папки
+            path: Путь к файлу базы SQLite
+            workers: Максимум одновременных запросов при обходе
+
+        Returns:
+            DiskSnapshot: Снимок; sync() возвращает изменения с прошлой синхронизации
+
+        Example:
+            >>> with client.disk.snapshot(123, "archive.sqlite") as snapshot:
+            ...     for event in snapshot.sync():
+            ...         print(event.kind, event.path)
+        """
+        return DiskSnapshot(self, path, root_id, workers=workers)
+
+    def iter_storages(self, filter: Optional[Dict[str, Any]] = None, prefetch: int = 0) -> Iterator[StorageInfo]:
+        """
+        Перебрать все доступные хранилища с автоматической постраничной навигацией.
+
+        Args:
+            filter: Фильтр по полям
+            prefetch: Сколько страниц загружать заранее, пока обрабатывается текущая
+
+        Yields:
+            StorageInfo: Хранилища по одному
+        """
+        query = GetListParams(filter=filter).page_query()
+        pages = iter_pages(
+            fetch=lambda start: self._http.call_pydantic(method="disk.storage.getlist", params=query.at(start),
+                                                         model=GetList),
+            next_cursor=lambda page, start: page.next,
+            prefetch=prefetch,
+            speculate=offset_step,
+        )
+        for page in pages:
+            yield from page.result or []
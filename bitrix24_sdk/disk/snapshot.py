@@ -0,0 +1,284 @@
+import math
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Literal, Optional, Set, Union, TYPE_CHECKING
+
+from pydantic import BaseModel, Field
+
+from .models import FileInfo, FolderInfo
+from .walk import TreeWalker
+
+if TYPE_CHECKING:
+    from .service import DiskService
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    id INTEGER PRIMARY KEY,
+    parent_id INTEGER,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    type TEXT NOT NULL,
+    update_time TEXT NOT NULL,
+    size INTEGER,
+    sync_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS objects_parent ON objects (parent_id);
+CREATE INDEX IF NOT EXISTS objects_path ON objects (path);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_FOLDERS = {"TYPE": "folder"}
+"""Фильтр каркаса: только подпапки."""
+
+_OVERLAP = timedelta(seconds=1)
+"""Запас на точность UPDATE_TIME (секунда): изменение в ту же секунду не сдвигает время."""
+
+
+class SnapshotEvent(BaseModel):
+    """Изменение объекта Disk, обнаруженное при синхронизации снимка."""
+    kind: Literal["added", "modified", "deleted", "moved"] = Field(..., description="Вид изменения")
+    id: int = Field(..., description="Идентификатор объекта")
+    path: str = Field(..., description="Путь объекта относительно корня (для deleted — последний известный)")
+    old_path: Optional[str] = Field(None, description="Прежний путь (для moved)")
+    type: str = Field(..., description="Тип объекта: folder или file")
+    item: Optional[Union[FolderInfo, FileInfo]] = Field(None, description="Актуальные данные объекта (кроме deleted)")
+
+
+class DiskSnapshot:
+    """
+    Локальный снимок дерева папок Disk в SQLite с поиском изменений.
+
+    Первая синхронизация обходит дерево целиком. Bitrix24 обновляет
+    UPDATE_TIME только у непосредственного родителя изменённого объекта,
+    поэтому последующие синхронизации проходят каркас дерева — у каждой
+    папки запрашиваются только подпапки, — а полностью перечитывают лишь
+    папки, у которых изменилось UPDATE_TIME, и сравнивают их содержимое со
+    снимком. Папки, время которых попало в последние секунды прошлой
+    синхронизации, перечитываются ещё раз: UPDATE_TIME хранится с точностью
+    до секунды, и изменение в ту же секунду его не сдвигает. Для каждой
+    синхронизации возвращается список событий added/modified/deleted/moved.
+
+    В режиме detect_deletes=False файлы изменившихся папок запрашиваются с
+    фильтром >=UPDATE_TIME, то есть передаются только изменённые объекты.
+    Это ещё дешевле, но удаления файлов и файлы, перенесённые в дерево без
+    изменения UPDATE_TIME, в этом режиме не обнаруживаются.
+
+    Example:
+        >>> snapshot = DiskSnapshot(client.disk, "archive.sqlite", root_id=123)
+        >>> for event in snapshot.sync():
+        ...     print(event.kind, event.path)
+    """
+
+    def __init__(self, disk: "DiskService", path: str, root_id: int, workers: int = 4) -> None:
+        """
+        Инициализация снимка.
+
+        Args:
+            disk: Сервис Disk API
+            path: Путь к файлу базы SQLite (создаётся при первой синхронизации)
+            root_id: ID корневой папки
+            workers: Максимум одновременных запросов при обходе
+        """
+        self._disk = disk
+        self.path = path
+        self.root_id = root_id
+        self.workers = workers
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        stored_root = self._meta("root_id")
+        if stored_root is not None and int(stored_root) != root_id:
+            raise ValueError(f"Снимок {path} построен для папки {stored_root}, а не {root_id}")
+
+    def sync(self, full: bool = False, detect_deletes: bool = True) -> List[SnapshotEvent]:
+        """
+        Синхронизировать снимок с порталом.
+
+        Args:
+            full: Обойти дерево целиком, не полагаясь на UPDATE_TIME папок
+            detect_deletes: Полностью перечитывать изменившиеся папки, чтобы находить удаления и перемещения
+
+        Returns:
+            События изменений с прошлой синхронизации (при первой — added для всех объектов)
+        """
+        started = time.monotonic()
+        root = self._disk.get_folder(self.root_id).result
+        if root is None:
+            raise ValueError(f"Папка {self.root_id} не найдена")
+
+        sync_id = int(self._meta("sync_id") or 0) + 1
+        first = self._meta("sync_id") is None
+        horizon = self._horizon()
+        walker_filter: Optional[Dict[str, Any]] = None
+        if not first and not full and not detect_deletes and horizon is not None:
+            walker_filter = {"TYPE": "file", ">=UPDATE_TIME": horizon.isoformat()}
+
+        events: List[SnapshotEvent] = []
+        listed: Dict[str, int] = {}
+        skeleton: Dict[str, int] = {}
+        failed: Set[int] = set()
+        max_time = root.update_time
+
+        def filters(path: str, folder: FolderInfo) -> List[Dict[str, Any]]:
+            stored = self._stored_time(folder.id)
+            if (first or full or stored is None or folder.update_time > stored
+                    or (horizon is not None and stored >= horizon)):
+                if walker_filter is None:
+                    listed[path] = folder.id
+                    return [{}]
+                skeleton[path] = folder.id
+                return [_FOLDERS, walker_filter]
+            # Содержимое не менялось, но изменения могут быть глубже: нужны только подпапки
+            skeleton[path] = folder.id
+            return [_FOLDERS]
+
+        def on_error(path: str, error: Exception) -> None:
+            folder_id = listed.get(path, skeleton.get(path))
+            if folder_id is not None:
+                failed.add(folder_id)
+
+        walker = TreeWalker(self._disk, workers=self.workers, skip_deleted=True, on_error=on_error, descend=filters)
+        with self._conn:
+            root_filters = filters("", root)
+            self._upsert(root, "", sync_id)
+            for path, item in walker.walk(self.root_id, root_filters=root_filters):
+                max_time = max(max_time, item.update_time)
+                event = self._apply(item, path, sync_id)
+                if event is not None:
+                    events.append(event)
+
+            if detect_deletes or first or full:
+                events.extend(self._collect_deleted(
+                    [folder_id for folder_id in listed.values() if folder_id not in failed], sync_id))
+            # В каркасе видны все подпапки, поэтому удалённые и перенесённые папки находятся и в нём
+            events.extend(self._collect_deleted(
+                [folder_id for folder_id in skeleton.values() if folder_id not in failed], sync_id, "folder"))
+
+            # Изменения в ту же секунду, что и чтение папки, видны только при повторном чтении:
+            # граница отстоит от последнего UPDATE_TIME на длительность синхронизации и запас
+            elapsed = timedelta(seconds=math.ceil(time.monotonic() - started))
+            self._set_meta("horizon", (max_time - elapsed - _OVERLAP).isoformat())
+            self._set_meta("root_id", str(self.root_id))
+            self._set_meta("sync_id", str(sync_id))
+            self._set_meta("max_update_time", max_time.isoformat())
+        return events
+
+    def get(self, id: int) -> Optional[Dict[str, Any]]:
+        """
+        Получить запись снимка по ID объекта.
+
+        Returns:
+            Словарь с полями id, parent_id, name, path, type, update_time, size или None
+        """
+        row = self._conn.execute(
+            "SELECT id, parent_id, name, path, type, update_time, size FROM objects WHERE id = ?", (id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("id", "parent_id", "name", "path", "type", "update_time", "size"), row))
+
+    def __len__(self) -> int:
+        # Корневая папка хранится в снимке, но не считается его объектом
+        return self._conn.execute("SELECT COUNT(*) FROM objects WHERE id != ?", (self.root_id,)).fetchone()[0]
+
+    def close(self) -> None:
+        """Закрыть соединение с базой."""
+        self._conn.close()
+
+    def __enter__(self) -> "DiskSnapshot":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _apply(self, item: Union[FolderInfo, FileInfo], path: str, sync_id: int) -> Optional[SnapshotEvent]:
+        """Записать объект в снимок и вернуть событие, если он изменился."""
+        row = self._conn.execute("SELECT path, update_time, size FROM objects WHERE id = ?", (item.id,)).fetchone()
+        self._upsert(item, path, sync_id)
+        if row is None:
+            return SnapshotEvent(kind="added", id=item.id, path=path, type=item.type, item=item)
+        old_path, old_time, old_size = row
+        if old_path != path:
+            if isinstance(item, FolderInfo):
+                # Пути вложенных объектов меняются вместе с папкой
+                self._conn.execute(
+                    "UPDATE objects SET path = ? || substr(path, ?) WHERE path LIKE ? ESCAPE '\\'",
+                    (path, len(old_path) + 1, _like_prefix(old_path)),
+                )
+            return SnapshotEvent(kind="moved", id=item.id, path=path, old_path=old_path, type=item.type, item=item)
+        # Повторно прочитанные объекты без изменений событий не дают
+        if item.update_time > datetime.fromisoformat(old_time) or getattr(item, "size", None) != old_size:
+            return SnapshotEvent(kind="modified", id=item.id, path=path, type=item.type, item=item)
+        return None
+
+    def _upsert(self, item: Union[FolderInfo, FileInfo], path: str, sync_id: int) -> None:
+        self._conn.execute(
+            "INSERT INTO objects (id, parent_id, name, path, type, update_time, size, sync_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET parent_id = excluded.parent_id, name = excluded.name, "
+            "path = excluded.path, type = excluded.type, update_time = excluded.update_time, "
+            "size = excluded.size, sync_id = excluded.sync_id",
+            (item.id, item.parent_id, item.name, path, item.type, item.update_time.isoformat(),
+             getattr(item, "size", None), sync_id),
+        )
+
+    def _collect_deleted(self, folder_ids: List[int], sync_id: int,
+                         object_type: Optional[str] = None) -> List[SnapshotEvent]:
+        """
+        Удалить из снимка объекты перечитанных папок, не встреченные при синхронизации.
+
+        Args:
+            folder_ids: Папки, содержимое которых прочитано без ошибок
+            sync_id: Номер текущей синхронизации
+            object_type: Проверять только объекты этого типа (для папок, у которых читались только подпапки)
+        """
+        events: List[SnapshotEvent] = []
+        for folder_id in folder_ids:
+            missing = self._conn.execute(
+                "SELECT id, path, type FROM objects "
+                "WHERE parent_id = ? AND sync_id != ? AND type = coalesce(?, type)",
+                (folder_id, sync_id, object_type),
+            ).fetchall()
+            for object_id, path, object_type in missing:
+                events.append(SnapshotEvent(kind="deleted", id=object_id, path=path, type=object_type))
+                if object_type == "folder":
+                    nested = self._conn.execute(
+                        "SELECT id, path, type FROM objects WHERE path LIKE ? ESCAPE '\\' ORDER BY path",
+                        (_like_prefix(path),),
+                    ).fetchall()
+                    events.extend(SnapshotEvent(kind="deleted", id=i, path=p, type=t) for i, p, t in nested)
+                    self._conn.execute("DELETE FROM objects WHERE path LIKE ? ESCAPE '\\'", (_like_prefix(path),))
+                self._conn.execute("DELETE FROM objects WHERE id = ?", (object_id,))
+        return events
+
+    def _horizon(self) -> Optional[datetime]:
+        """Граница прошлой синхронизации: папки со временем не раньше неё перечитываются."""
+        horizon = self._meta("horizon")
+        if horizon is not None:
+            return datetime.fromisoformat(horizon)
+        since = self._meta("max_update_time")
+        return datetime.fromisoformat(since) - _OVERLAP if since is not None else None
+
+    def _stored_time(self, id: int) -> Optional[datetime]:
+        row = self._conn.execute("SELECT update_time FROM objects WHERE id = ?", (id,)).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+
+def _like_prefix(path: str) -> str:
+    """Шаблон LIKE для всех путей внутри папки path."""
+    escaped = path.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}/%"
@@ -0,0 +1,172 @@
+import contextvars
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any, Callable, Deque, Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple, Union, TYPE_CHECKING
+)
+
+from .models import FileInfo, FolderInfo, GetChildren
+
+if TYPE_CHECKING:
+    from .service import DiskService
+
+
+WalkPredicate = Callable[[str, Union[FolderInfo, FileInfo]], bool]
+"""Клиентский фильтр обхода: (путь, объект) -> выдавать ли объект."""
+
+WalkDescend = Callable[[str, FolderInfo], Union[bool, Dict[str, Any], Sequence[Dict[str, Any]]]]
+"""Решение о спуске в папку: (путь, папка) -> загружать ли её содержимое.
+
+Вместо True можно вернуть фильтр disk.folder.getchildren для этой папки или
+несколько фильтров (тогда содержимое загружается отдельными запросами по
+каждому; пересекаться они не должны). Фильтр дополняет filter обхода."""
+
+WalkErrorHandler = Callable[[str, Exception], None]
+"""Обработчик ошибки чтения папки: (путь папки, ошибка)."""
+
+WALK_BATCH_SIZE = 50
+"""Сколько запросов содержимого папок объединяется в один вызов batch."""
+
+
+class _Task(NamedTuple):
+    path: str
+    folder_id: int
+    depth: int
+    start: Optional[int]
+    filter: Optional[Dict[str, Any]]
+
+
+class TreeWalker:
+    """
+    Параллельный обход дерева папок Bitrix24 Disk.
+
+    Запросы содержимого соседних папок объединяются в вызовы batch по 50
+    папок, несколько таких вызовов выполняются одновременно пулом потоков.
+    Очередь папок разбирается с конца, то есть сначала вглубь: в ней
+    ожидают только непрочитанные соседи на каждом уровне текущих веток, и
+    её размер растёт с глубиной дерева, а не с его шириной (на архиве из
+    40 тыс. папок — около 5 тыс. задач вместо почти всех папок сразу).
+    Объекты выдаются потоком по мере загрузки; новые запросы отправляются,
+    только когда вызывающий код забирает результаты, поэтому число
+    одновременных запросов не превышает workers. Порядок выдачи между
+    папками не гарантируется, внутри одной страницы папки он сохраняется.
+
+    Example:
+        >>> walker = TreeWalker(client.disk, workers=8, max_depth=3)
+        >>> for path, item in walker.walk(123):
+        ...     print(path)
+    """
+
+    def __init__(self, disk: "DiskService", workers: int = 4, max_depth: Optional[int] = None,
+                 filter: Optional[Dict[str, Any]] = None, predicate: Optional[WalkPredicate] = None,
+                 skip_deleted: bool = True, on_error: Optional[WalkErrorHandler] = None,
+                 descend: Optional[WalkDescend] = None) -> None:
+        """
+        Инициализация обхода.
+
+        Args:
+            disk: Сервис Disk API
+            workers: Максимум одновременных запросов
+            max_depth: Максимальная глубина (1 — только содержимое корня, None — без ограничения)
+            filter: Фильтр disk.folder.getchildren, применяемый на каждом уровне; в папки,
+                не прошедшие фильтр, обход не заходит
+            predicate: Клиентский фильтр выдаваемых объектов (на обход не влияет)
+            skip_deleted: Пропускать объекты в корзине (deleted_type != 0) и не заходить в такие папки
+            on_error: Обработчик ошибок чтения папки; без него ошибка прерывает обход
+            descend: Решение о спуске в папку (по умолчанию обход заходит во все папки)
+        """
+        if workers < 1:
+            raise ValueError("workers должен быть не меньше 1")
+        if max_depth is not None and max_depth < 1:
+            raise ValueError("max_depth должен быть не меньше 1")
+        self._disk = disk
+        self.workers = workers
+        self.max_depth = max_depth
+        self.filter = filter
+        self.predicate = predicate
+        self.skip_deleted = skip_deleted
+        self.on_error = on_error
+        self.descend = descend
+
+    def walk(
+        self,
+        root_id: int,
+        root_path: str = "",
+        root_filters: Optional[Sequence[Dict[str, Any]]] = None,
+    ) -> Iterator[Tuple[str, Union[FolderInfo, FileInfo]]]:
+        """
+        Обойти дерево папок.
+
+        Args:
+            root_id: ID корневой папки (сама она не выдаётся)
+            root_path: Путь корневой папки, с которого начинаются пути объектов
+            root_filters: Фильтры содержимого корневой папки, как у descend (по умолчанию filter обхода)
+
+        Yields:
+            (путь, FolderInfo | FileInfo) для каждого объекта дерева
+        """
+        # Стек: следующая группа берётся из последних найденных (самых глубоких) папок
+        pending: Deque[_Task] = deque(_Task(root_path, root_id, 1, None, filter)
+                                      for filter in self._filters(True if root_filters is None else root_filters))
+        inflight: Set["Future[List[Tuple[_Task, Any]]]"] = set()
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bitrix-walk")
+        try:
+            while pending or inflight:
+                while pending and len(inflight) < self.workers:
+                    group = [pending.pop() for _ in range(min(WALK_BATCH_SIZE, len(pending)))]
+                    inflight.add(executor.submit(contextvars.copy_context().run, self._fetch, group))
+
+                completed, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    for task, page in future.result():
+                        if isinstance(page, Exception):
+                            if self.on_error is None:
+                                raise page
+                            self.on_error(task.path, page)
+                            continue
+                        if page.next:
+                            pending.append(task._replace(start=page.next))
+                        for item in page.result or []:
+                            if self.skip_deleted and item.deleted_type != 0:
+                                continue
+                            path = f"{task.path}/{item.name}" if task.path else item.name
+                            if (isinstance(item, FolderInfo)
+                                    and (self.max_depth is None or task.depth < self.max_depth)):
+                                decision = True if self.descend is None else self.descend(path, item)
+                                pending.extend(_Task(path, item.id, task.depth + 1, None, filter)
+                                               for filter in self._filters(decision))
+                            if self.predicate is None or self.predicate(path, item):
+                                yield path, item
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _filters(
+        self, decision: Union[bool, Dict[str, Any], Sequence[Dict[str, Any]]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Фильтры запросов содержимого папки по решению descend."""
+        if decision is True:
+            return [self.filter]
+        if not decision:
+            return []
+        filters = [decision] if isinstance(decision, dict) else list(decision)
+        return [{**(self.filter or {}), **filter} or None for filter in filters]
+
+    def _fetch(self, group: List[_Task]) -> List[Tuple[_Task, Union[GetChildren, Exception]]]:
+        """Загрузить страницы содержимого группы папок одним вызовом batch."""
+        if len(group) == 1:
+            task = group[0]
+            try:
+                return [(task, self._disk.get_children(task.folder_id, filter=task.filter, start=task.start,
+                                                           mode="model"))]
+            except Exception as e:
+                return [(task, e)]
+
+        batch = self._disk._http.batch()
+        commands = [batch.disk.get_children(task.folder_id, filter=task.filter, start=task.start, mode="model")
+                    for task in group]
+        try:
+            batch.execute()
+        except Exception as e:
+            return [(task, e) for task in group]
+        return [(task, command.error if command.error is not None else command.result())
+                for task, command in zip(group, commands)]
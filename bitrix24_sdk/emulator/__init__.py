@@ -0,0 +1,14 @@
+"""
+Локальный эмулятор REST API Bitrix24 и замеры производительности SDK.
+
+Запуск сервера: python -m bitrix24_sdk.emulator --items 100000 --latency 0.05
+Замеры: python -m bitrix24_sdk.emulator.benchmark
+"""
+
+from .dataset import DatasetConfig, EmulatorDataset, file_bytes
+from .server import BitrixEmulator, EmulatorConfig, EmulatorError, parse_multipart, parse_params
+
+__all__ = [
+    "BitrixEmulator", "EmulatorConfig", "EmulatorError", "DatasetConfig", "EmulatorDataset",
+    "file_bytes", "parse_multipart", "parse_params",
+]
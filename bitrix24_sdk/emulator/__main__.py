@@ -0,0 +1,39 @@
+import argparse
+
+from .dataset import DatasetConfig
+from .server import BitrixEmulator, EmulatorConfig
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m bitrix24_sdk.emulator", description="Локальный эмулятор REST API Bitrix24")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8024)
+    parser.add_argument("--latency", type=float, default=0.0, help="Задержка ответа, секунды")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Случайная добавка к задержке, секунды")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Запросов в секунду до QUERY_LIMIT_EXCEEDED")
+    parser.add_argument("--burst", type=int, default=50, help="Размер накопителя запросов")
+    parser.add_argument("--types", type=int, default=1, help="Количество смарт-процессов")
+    parser.add_argument("--items", type=int, default=1000, help="Элементов в каждом смарт-процессе")
+    parser.add_argument("--depth", type=int, default=2, help="Глубина дерева папок")
+    parser.add_argument("--folders", type=int, default=3, help="Подпапок в папке")
+    parser.add_argument("--files", type=int, default=10, help="Файлов в папке")
+    parser.add_argument("--file-size", type=int, default=4096, help="Размер файла в байтах")
+    args = parser.parse_args()
+
+    config = EmulatorConfig(
+        latency=args.latency, latency_jitter=args.jitter, rate_limit=args.rate_limit, rate_limit_burst=args.burst,
+        dataset=DatasetConfig(crm_types=args.types, crm_items=args.items, folder_depth=args.depth,
+                              folders_per_folder=args.folders, files_per_folder=args.files, file_size=args.file_size),
+    )
+    emulator = BitrixEmulator(config, host=args.host, port=args.port)
+    print(f"BASE_URL: {emulator.base_url}")
+    try:
+        emulator.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emulator.stop()
+
+
+if __name__ == "__main__":
+    main()
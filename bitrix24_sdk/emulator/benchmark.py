@@ -0,0 +1,299 @@
+"""
+Замеры производительности SDK на локальном эмуляторе.
+
+Каждый сценарий выполняется в отдельном процессе, а эмулятор — в потоке
+родительского процесса, поэтому процессорное время и пиковая память (RSS)
+относятся только к клиенту.
+
+    python -m bitrix24_sdk.emulator.benchmark --items 20000 --latency 0.005
+    python -m bitrix24_sdk.emulator.benchmark --scenario pagination.raw --scenario walk --json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+from ..bitrix_http import BitrixClient, HttpTransport
+from ..config.config import BitrixSettings
+from ..disk.models import FileInfo
+from .dataset import DatasetConfig
+from .server import BitrixEmulator, EmulatorConfig
+
+
+class BenchmarkOptions(BaseModel):
+    """Параметры сценариев замеров."""
+    entity_type_id: int = Field(1040, description="Смарт-процесс для сценариев CRM")
+    workers: int = Field(4, ge=1, description="Потоков в параллельных сценариях (выгрузка, обход, загрузка)")
+    partitions: int = Field(8, ge=1, description="Разделов диапазона ID в сценарии export")
+    upload_files: int = Field(50, ge=1, description="Файлов в сценарии upload")
+    upload_size: int = Field(256 * 1024, ge=1, description="Размер загружаемого файла в байтах")
+    download_files: int = Field(20, ge=1, description="Файлов в сценарии download")
+
+
+class BenchmarkResult(BaseModel):
+    """Результат одного сценария."""
+    scenario: str = Field(..., description="Имя сценария")
+    rows: int = Field(..., description="Обработано строк (элементов, объектов или файлов)")
+    requests: int = Field(..., description="HTTP запросов к эмулятору")
+    seconds: float = Field(..., description="Время выполнения")
+    requests_per_sec: float = Field(..., description="HTTP запросов в секунду")
+    rows_per_sec: float = Field(..., description="Строк в секунду")
+    p50_ms: float = Field(..., description="Медиана времени HTTP запроса до получения заголовков, мс")
+    p99_ms: float = Field(..., description="99-й процентиль времени HTTP запроса, мс")
+    cpu_per_row_us: float = Field(..., description="Процессорное время клиента на строку, мкс")
+    peak_rss_mb: Optional[float] = Field(None, description="Пиковая память процесса сценария, МБ")
+
+
+class _Scenario(NamedTuple):
+    run: Callable[[BitrixClient, BenchmarkOptions, Any], int]
+    setup: Optional[Callable[[BitrixClient, BenchmarkOptions], Any]] = None
+    settings: Dict[str, Any] = {}
+
+
+class _TimedTransport(HttpTransport):
+    """Транспорт, записывающий время каждого HTTP запроса."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.durations: List[float] = []
+        self._lock = threading.Lock()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return super().request(method, url, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.durations.append(elapsed)
+
+
+def _iter_items(**kwargs: Any) -> Callable[[BitrixClient, BenchmarkOptions, Any], int]:
+    def run(client: BitrixClient, options: BenchmarkOptions, state: Any) -> int:
+        return sum(1 for _ in client.crm.iter_items(options.entity_type_id, select=["*"], **kwargs))
+    return run
+
+
+def _export(client: BitrixClient, options: BenchmarkOptions, state: Any) -> int:
+    result = client.crm.export_items(options.entity_type_id, lambda rows, partition: None, select=["*"],
+                                     partitions=options.partitions, workers=options.workers, mode="raw")
+    return result.rows
+
+
+def _walk(client: BitrixClient, options: BenchmarkOptions, state: Any) -> int:
+    root_id = int(client.disk.get_list().result[0].root_object_id)
+    return sum(1 for _ in client.disk.walk(root_id, workers=options.workers))
+
+
+def _upload_setup(client: BitrixClient, options: BenchmarkOptions) -> Any:
+    root_id = int(client.disk.get_list().result[0].root_object_id)
+    folder = client.disk.add_subfolder(root_id, {"NAME": f"benchmark-{os.getpid()}-{time.time_ns()}"}).result
+    payload = os.urandom(options.upload_size)
+    return folder.id, [(payload, f"file{index}.bin") for index in range(options.upload_files)]
+
+
+def _upload(client: BitrixClient, options: BenchmarkOptions, state: Any) -> int:
+    folder_id, files = state
+    results = client.disk.upload_many(folder_id, files, workers=options.workers)
+    failed = [result.error for result in results if not result.ok]
+    if failed:
+        raise RuntimeError(f"Не загружено файлов: {len(failed)}, первая ошибка: {failed[0]}")
+    return len(results)
+
+
+def _download_setup(client: BitrixClient, options: BenchmarkOptions) -> Any:
+    root_id = int(client.disk.get_list().result[0].root_object_id)
+    files = [item for _, item in client.disk.walk(root_id) if isinstance(item, FileInfo)]
+    return files[:options.download_files], tempfile.mkdtemp(prefix="bitrix-benchmark-")
+
+
+def _download(client: BitrixClient, options: BenchmarkOptions, state: Any) -> int:
+    files, directory = state
+    try:
+        for file in files:
+            client.disk.download(file, os.path.join(directory, f"{file.id}.bin"), workers=options.workers)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return len(files)
+
+
+SCENARIOS: Dict[str, _Scenario] = {
+    "pagination.offset": _Scenario(_iter_items()),
+    "pagination.keyset": _Scenario(_iter_items(keyset=True)),
+    "pagination.raw": _Scenario(_iter_items(keyset=True, mode="raw")),
+    "pagination.lazy": _Scenario(_iter_items(keyset=True, mode="lazy")),
+    "pagination.schema": _Scenario(_iter_items(keyset=True, schema=True)),
+    "validation.dict": _Scenario(_iter_items(keyset=True), settings={"JSON_VALIDATE_BYTES": False}),
+    "export": _Scenario(_export),
+    "walk": _Scenario(_walk),
+    "upload": _Scenario(_upload, _upload_setup),
+    "download": _Scenario(_download, _download_setup),
+}
+"""
+Сценарии замеров.
+
+pagination.* перебирают все элементы смарт-процесса: offset и keyset в
+режиме model, raw и lazy — режимы разбора, schema — типизированная схема;
+validation.dict — model без валидации из байтов. export — параллельная
+выгрузка, walk — обход дерева Disk, upload и download — файлы.
+"""
+
+
+def run_scenario(name: str, settings: BitrixSettings, options: Optional[BenchmarkOptions] = None) -> BenchmarkResult:
+    """
+    Выполнить сценарий в текущем процессе.
+
+    Args:
+        name: Имя сценария из SCENARIOS
+        settings: Настройки клиента (BASE_URL эмулятора)
+        options: Параметры сценариев
+
+    Returns:
+        BenchmarkResult: Результат (peak_rss_mb — пик всего процесса)
+    """
+    scenario = SCENARIOS[name]
+    options = options or BenchmarkOptions()
+    if scenario.settings:
+        settings = settings.model_copy(update=scenario.settings)
+    transport = _TimedTransport.from_settings(settings)
+    client = BitrixClient(token="emulator", user_id=1, settings=settings, transport=transport)
+    state = scenario.setup(client, options) if scenario.setup is not None else None
+
+    transport.durations.clear()
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    rows = scenario.run(client, options, state)
+    seconds = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+
+    durations = sorted(transport.durations)
+    return BenchmarkResult(
+        scenario=name, rows=rows, requests=len(durations), seconds=round(seconds, 4),
+        requests_per_sec=round(len(durations) / seconds, 1) if seconds else 0.0,
+        rows_per_sec=round(rows / seconds, 1) if seconds else 0.0,
+        p50_ms=round(_percentile(durations, 0.50) * 1000, 3),
+        p99_ms=round(_percentile(durations, 0.99) * 1000, 3),
+        cpu_per_row_us=round(cpu / rows * 1e6, 2) if rows else 0.0,
+        peak_rss_mb=_peak_rss_mb(),
+    )
+
+
+def run_benchmarks(scenarios: Optional[Sequence[str]] = None, config: Optional[EmulatorConfig] = None,
+                   options: Optional[BenchmarkOptions] = None,
+                   on_result: Optional[Callable[[BenchmarkResult], None]] = None) -> List[BenchmarkResult]:
+    """
+    Запустить эмулятор и выполнить сценарии, каждый в отдельном процессе.
+
+    Args:
+        scenarios: Имена сценариев (по умолчанию все)
+        config: Поведение и данные эмулятора
+        options: Параметры сценариев
+        on_result: Обратный вызов с результатом каждого сценария
+
+    Returns:
+        Результаты в порядке сценариев
+    """
+    names = list(scenarios or SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Неизвестные сценарии: {', '.join(unknown)}")
+    options = options or BenchmarkOptions()
+    context = multiprocessing.get_context("spawn")
+    results: List[BenchmarkResult] = []
+    with BitrixEmulator(config) as emulator:
+        settings = emulator.settings()
+        with context.Pool(processes=1, maxtasksperchild=1) as pool:
+            for name in names:
+                payload = pool.apply(_run_in_child, (name, settings.model_dump(), options.model_dump()))
+                result = BenchmarkResult.model_validate(payload)
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+    return results
+
+
+def _run_in_child(name: str, settings: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
+    result = run_scenario(name, BitrixSettings.model_validate(settings), BenchmarkOptions.model_validate(options))
+    return result.model_dump()
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, round(q * (len(values) - 1))))
+    return values[index]
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux отдаёт килобайты, macOS — байты
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+_COLUMNS = (
+    ("scenario", "scenario", 20, ""), ("rows", "rows", 8, ""), ("requests", "reqs", 7, ""),
+    ("seconds", "seconds", 8, ".2f"), ("requests_per_sec", "req/s", 9, ".1f"), ("rows_per_sec", "rows/s", 10, ".1f"),
+    ("p50_ms", "p50 ms", 8, ".2f"), ("p99_ms", "p99 ms", 8, ".2f"), ("cpu_per_row_us", "cpu us/row", 10, ".2f"),
+    ("peak_rss_mb", "rss MB", 7, ".1f"),
+)
+
+
+def format_table(results: Sequence[BenchmarkResult]) -> str:
+    """Результаты в виде текстовой таблицы."""
+    def cell(value: Any, width: int, spec: str, first: bool) -> str:
+        text = "-" if value is None else format(value, spec)
+        return text.ljust(width) if first else text.rjust(width)
+
+    lines = [" ".join(cell(title, width, "", index == 0) for index, (_, title, width, _) in enumerate(_COLUMNS))]
+    for result in results:
+        values = result.model_dump()
+        lines.append(" ".join(cell(values[name], width, spec, index == 0)
+                              for index, (name, _, width, spec) in enumerate(_COLUMNS)))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m bitrix24_sdk.emulator.benchmark",
+                                     description="Замеры производительности SDK на локальном эмуляторе Bitrix24")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Сценарий (можно несколько)")
+    parser.add_argument("--items", type=int, default=10000, help="Элементов CRM")
+    parser.add_argument("--latency", type=float, default=0.0, help="Задержка ответа эмулятора, секунды")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Случайная добавка к задержке, секунды")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Лимит эмулятора, запросов в секунду")
+    parser.add_argument("--depth", type=int, default=3, help="Глубина дерева папок")
+    parser.add_argument("--folders", type=int, default=4, help="Подпапок в папке")
+    parser.add_argument("--files", type=int, default=20, help="Файлов в папке")
+    parser.add_argument("--file-size", type=int, default=1024 * 1024, help="Размер файла для download, байты")
+    parser.add_argument("--workers", type=int, default=4, help="Потоков в параллельных сценариях")
+    parser.add_argument("--json", action="store_true", help="Вывести результаты в JSON")
+    args = parser.parse_args(argv)
+
+    config = EmulatorConfig(
+        latency=args.latency, latency_jitter=args.jitter, rate_limit=args.rate_limit,
+        dataset=DatasetConfig(crm_items=args.items, folder_depth=args.depth, folders_per_folder=args.folders,
+                              files_per_folder=args.files, file_size=args.file_size),
+    )
+    options = BenchmarkOptions(workers=args.workers)
+    results = run_benchmarks(args.scenario, config, options,
+                             on_result=None if args.json else lambda result: print(result.scenario, "done",
+                                                                                   file=sys.stderr))
+    if args.json:
+        print(json.dumps([result.model_dump() for result in results], indent=2))
+    else:
+        print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
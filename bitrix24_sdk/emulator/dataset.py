@@ -0,0 +1,221 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+_EPOCH = datetime(2024, 1, 1, 9, 0, tzinfo=timezone(timedelta(hours=3)))
+_STAGES = ("NEW", "PREPARATION", "CLIENT", "SUCCESS", "FAIL")
+
+
+class DatasetConfig(BaseModel):
+    """Размеры набора данных эмулятора."""
+    crm_types: int = Field(1, ge=0, description="Количество смарт-процессов (entityTypeId 1040, 1041, ...)")
+    crm_items: int = Field(1000, ge=0, description="Количество элементов в каждом смарт-процессе")
+    storages: int = Field(1, ge=1, description="Количество хранилищ Disk")
+    folder_depth: int = Field(2, ge=0, description="Глубина дерева папок в каждом хранилище")
+    folders_per_folder: int = Field(3, ge=0, description="Подпапок в каждой папке (кроме последнего уровня)")
+    files_per_folder: int = Field(10, ge=0, description="Файлов в каждой папке")
+    file_size: int = Field(4096, ge=0, description="Размер сгенерированного файла в байтах")
+
+
+def file_bytes(file_id: int, size: int, start: int = 0, end: Optional[int] = None) -> bytes:
+    """
+    Содержимое сгенерированного файла (или его диапазона [start, end]).
+
+    Байты зависят только от ID и позиции, поэтому скачанный файл можно
+    сверить без хранения содержимого.
+    """
+    end = size - 1 if end is None else min(end, size - 1)
+    if start > end:
+        return b""
+    # Период 251 байт: шаблон размножается целиком, а не побайтно
+    pattern = bytes((file_id * 31 + offset) % 251 for offset in range(251))
+    shift = start % 251
+    length = end - start + 1
+    repeated = pattern[shift:] + pattern * (length // 251 + 1)
+    return repeated[:length]
+
+
+class EmulatorDataset:
+    """
+    Данные эмулятора: смарт-процессы, элементы CRM и дерево Disk.
+
+    Элементы CRM не хранятся, а строятся по ID при запросе, поэтому набор
+    из сотен тысяч элементов не занимает память. Объекты Disk хранятся в
+    словаре и меняются методами записи (создание папок, загрузка, удаление).
+
+    Example:
+        >>> dataset = EmulatorDataset(DatasetConfig(crm_items=100000))
+        >>> dataset.item(1040, 1)["title"]
+        'Элемент 1'
+    """
+
+    def __init__(self, config: Optional[DatasetConfig] = None) -> None:
+        self.config = config or DatasetConfig()
+        self.lock = threading.RLock()
+        self.objects: Dict[int, Dict[str, Any]] = {}
+        self.contents: Dict[int, bytes] = {}
+        self.storages: List[Dict[str, Any]] = []
+        self._children: Dict[Optional[int], Dict[int, None]] = {}
+        self._next_id = 1
+        self._build_disk()
+
+    # CRM
+
+    @property
+    def entity_type_ids(self) -> List[int]:
+        return [1040 + index for index in range(self.config.crm_types)]
+
+    def crm_type(self, entity_type_id: int) -> Dict[str, Any]:
+        index = entity_type_id - 1040
+        flags = dict.fromkeys((
+            "isCategoriesEnabled", "isStagesEnabled", "isBeginCloseDatesEnabled", "isClientEnabled",
+            "isUseInUserfieldEnabled", "isLinkWithProductsEnabled", "isMycompanyEnabled", "isDocumentsEnabled",
+            "isSourceEnabled", "isObserversEnabled", "isRecyclebinEnabled", "isAutomationEnabled",
+            "isBizProcEnabled", "isSetOpenPermissions", "isPaymentsEnabled", "isCountersEnabled",
+        ), "N")
+        return {
+            "id": index + 1, "title": f"Смарт-процесс {index + 1}", "code": f"sp{index + 1}", "createdBy": 1,
+            "entityTypeId": entity_type_id, "customSectionId": None, **flags,
+            "createdTime": _EPOCH.isoformat(), "updatedTime": _EPOCH.isoformat(), "updatedBy": 1,
+        }
+
+    def item_fields(self, entity_type_id: int) -> Dict[str, Dict[str, Any]]:
+        uf = f"ufCrm{entity_type_id - 1040 + 1}"
+        fields = {
+            "id": ("integer", "ID", False), "title": ("string", "Название", False),
+            "createdTime": ("datetime", "Создан", False), "updatedTime": ("datetime", "Изменён", False),
+            "createdBy": ("user", "Кем создан", False), "assignedById": ("user", "Ответственный", False),
+            "stageId": ("crm_status", "Стадия", False), "opportunity": ("double", "Сумма", False),
+            "currencyId": ("crm_currency", "Валюта", False), "isManualOpportunity": ("boolean", "Сумма вручную", False),
+            f"{uf}Amount": ("money", "Бюджет", False), f"{uf}Deadline": ("date", "Срок", False),
+            f"{uf}Tags": ("string", "Метки", True),
+        }
+        return {
+            name: {"type": kind, "title": title, "isRequired": name == "title", "isReadOnly": name == "id",
+                   "isImmutable": False, "isMultiple": multiple, "isDynamic": name.startswith("ufCrm")}
+            for name, (kind, title, multiple) in fields.items()
+        }
+
+    def item(self, entity_type_id: int, item_id: int) -> Dict[str, Any]:
+        """Элемент CRM по ID (1..crm_items)."""
+        uf = f"ufCrm{entity_type_id - 1040 + 1}"
+        created = _EPOCH + timedelta(minutes=item_id)
+        return {
+            "id": item_id, "title": f"Элемент {item_id}", "createdTime": created.isoformat(),
+            "updatedTime": (created + timedelta(hours=item_id % 48)).isoformat(), "createdBy": 1,
+            "assignedById": 1 + item_id % 20, "stageId": f"DT{entity_type_id}_1:{_STAGES[item_id % len(_STAGES)]}",
+            "opportunity": round(item_id * 10.5, 2), "currencyId": "RUB",
+            "isManualOpportunity": "Y" if item_id % 2 else "N",
+            f"{uf}Amount": f"{item_id * 100}|RUB",
+            f"{uf}Deadline": "" if item_id % 3 == 0 else (created + timedelta(days=30)).date().isoformat() + "T00:00:00+03:00",
+            f"{uf}Tags": [f"tag{item_id % 7}", f"tag{item_id % 11}"] if item_id % 4 else False,
+            "entityTypeId": entity_type_id,
+        }
+
+    def item_ids(self, entity_type_id: int) -> range:
+        if entity_type_id not in self.entity_type_ids:
+            return range(0)
+        return range(1, self.config.crm_items + 1)
+
+    # Disk
+
+    def new_id(self) -> int:
+        with self.lock:
+            object_id = self._next_id
+            self._next_id += 1
+            return object_id
+
+    def add_folder(self, storage_id: int, parent_id: Optional[int], name: str) -> Dict[str, Any]:
+        folder_id = self.new_id()
+        folder = _disk_object(folder_id, storage_id, parent_id, name, "folder")
+        with self.lock:
+            self._insert(folder_id, parent_id, folder)
+        return folder
+
+    def add_file(self, storage_id: int, parent_id: int, name: str, size: int,
+                 content: Optional[bytes] = None) -> Dict[str, Any]:
+        file_id = self.new_id()
+        file = _disk_object(file_id, storage_id, parent_id, name, "file")
+        file.update({"SIZE": str(size), "CREATED_BY": "1", "UPDATED_BY": "1", "DELETED_BY": None,
+                     "DOWNLOAD_URL": f"/download/{file_id}"})
+        with self.lock:
+            self._insert(file_id, parent_id, file)
+            if content is not None:
+                self.contents[file_id] = content
+        return file
+
+    def content(self, file_id: int, start: int = 0, end: Optional[int] = None) -> bytes:
+        file = self.objects[file_id]
+        stored = self.contents.get(file_id)
+        if stored is not None:
+            return stored[start:None if end is None else end + 1]
+        return file_bytes(file_id, int(file["SIZE"]), start, end)
+
+    def children(self, folder_id: int) -> List[Dict[str, Any]]:
+        with self.lock:
+            return [self.objects[child_id] for child_id in self._children.get(folder_id, ())]
+
+    def delete_tree(self, folder_id: int) -> None:
+        with self.lock:
+            pending = [folder_id]
+            parent_id = _parent(self.objects[folder_id])
+            self._children.get(parent_id, {}).pop(folder_id, None)
+            while pending:
+                current = pending.pop()
+                pending.extend(self._children.pop(current, {}))
+                self.objects.pop(current, None)
+                self.contents.pop(current, None)
+            self._touch(parent_id)
+
+    def iter_files(self) -> Iterator[Dict[str, Any]]:
+        with self.lock:
+            files = [obj for obj in self.objects.values() if obj["TYPE"] == "file"]
+        yield from files
+
+    def _insert(self, object_id: int, parent_id: Optional[int], obj: Dict[str, Any]) -> None:
+        self.objects[object_id] = obj
+        self._children.setdefault(parent_id, {})[object_id] = None
+        self._touch(parent_id)
+
+    def _touch(self, folder_id: Optional[int]) -> None:
+        """Обновить UPDATE_TIME папки, как это делает Bitrix24 при изменении содержимого."""
+        if folder_id is not None and folder_id in self.objects:
+            self.objects[folder_id]["UPDATE_TIME"] = datetime.now(_EPOCH.tzinfo).isoformat(timespec="seconds")
+
+    def _build_disk(self) -> None:
+        config = self.config
+        for index in range(config.storages):
+            storage_id = index + 1
+            root = self.add_folder(storage_id, None, f"Хранилище {storage_id}")
+            self.storages.append({
+                "ID": str(storage_id), "NAME": root["NAME"], "CODE": None, "MODULE_ID": "disk",
+                "ENTITY_TYPE": "user", "ENTITY_ID": str(storage_id), "ROOT_OBJECT_ID": root["ID"],
+            })
+            level: List[Tuple[int, int]] = [(int(root["ID"]), 0)]
+            while level:
+                folder_id, depth = level.pop()
+                for number in range(config.files_per_folder):
+                    self.add_file(storage_id, folder_id, f"file{number}.bin", config.file_size)
+                if depth < config.folder_depth:
+                    for number in range(config.folders_per_folder):
+                        child = self.add_folder(storage_id, folder_id, f"folder{number}")
+                        level.append((int(child["ID"]), depth + 1))
+        # Сгенерированное дерево не считается изменённым
+        for obj in self.objects.values():
+            obj["UPDATE_TIME"] = obj["CREATE_TIME"]
+
+
+def _parent(obj: Dict[str, Any]) -> Optional[int]:
+    return int(obj["PARENT_ID"]) if obj["PARENT_ID"] is not None else None
+
+
+def _disk_object(object_id: int, storage_id: int, parent_id: Optional[int], name: str, kind: str) -> Dict[str, Any]:
+    created = (_EPOCH + timedelta(seconds=object_id)).isoformat()
+    return {
+        "ID": str(object_id), "NAME": name, "CODE": None, "STORAGE_ID": str(storage_id), "TYPE": kind,
+        "PARENT_ID": str(parent_id) if parent_id is not None else None, "DELETED_TYPE": "0",
+        "CREATE_TIME": created, "UPDATE_TIME": created, "DELETE_TIME": None,
+        "DETAIL_URL": f"/docs/path/{name}",
+    }
@@ -0,0 +1,125 @@
+"""
+Замеры времени импорта и создания клиента.
+
+Каждая проверка выполняется в новом интерпретаторе несколько раз; в отчёт
+попадает медиана и список модулей, которые не должны были загрузиться
+(например, модели Disk API при обращении только к client.crm). Ненулевой код
+выхода означает регрессию: загружен лишний модуль или превышен бюджет.
+
+    python -m bitrix24_sdk.emulator.importtime
+    python -m bitrix24_sdk.emulator.importtime --budget package=20 --budget client=400 --json
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field
+
+
+class ImportCheck(NamedTuple):
+    """Проверка: код, выполняемый в чистом интерпретаторе, и модули, которых не должно быть после него."""
+    statement: str
+    forbidden: Tuple[str, ...]
+
+
+_SERVICES = ("bitrix24_sdk.base", "bitrix24_sdk.disk", "bitrix24_sdk.crm")
+_OPTIONAL = ("httpx", "asyncio", "sqlite3", "pyarrow", "prometheus_client", "opentelemetry")
+
+IMPORT_CHECKS: Dict[str, ImportCheck] = {
+    "package": ImportCheck("import bitrix24_sdk", ("pydantic", "requests", "bitrix24_sdk.bitrix_http") + _OPTIONAL),
+    "client": ImportCheck("from bitrix24_sdk import BitrixClient", _SERVICES + _OPTIONAL),
+    "construct": ImportCheck(
+        "from bitrix24_sdk import BitrixClient\nBitrixClient(token='x', user_id=1)", _SERVICES + _OPTIONAL,
+    ),
+    "crm": ImportCheck(
+        "from bitrix24_sdk import BitrixClient\nBitrixClient(token='x', user_id=1).crm",
+        ("bitrix24_sdk.base", "bitrix24_sdk.disk") + _OPTIONAL,
+    ),
+    "async_client": ImportCheck("from bitrix24_sdk import AsyncBitrixClient", _SERVICES + ("requests",)),
+}
+
+_RUNNER = """
+import json, sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps([elapsed, sorted(sys.modules)]))
+"""
+
+
+class ImportResult(BaseModel):
+    """Результат одной проверки."""
+    check: str = Field(..., description="Имя проверки")
+    ms: float = Field(..., description="Медиана времени выполнения кода проверки, мс")
+    modules: int = Field(..., description="Модулей загружено после выполнения")
+    unexpected: List[str] = Field(default_factory=list, description="Запрещённые пакеты, которые оказались загружены")
+    budget_ms: Optional[float] = Field(None, description="Бюджет времени, мс")
+
+    @property
+    def ok(self) -> bool:
+        """Нет лишних модулей и бюджет времени не превышен."""
+        return not self.unexpected and (self.budget_ms is None or self.ms <= self.budget_ms)
+
+
+def measure_import(name: str, repeat: int = 5, budget_ms: Optional[float] = None,
+                   python: str = sys.executable) -> ImportResult:
+    """
+    Выполнить проверку в новых интерпретаторах.
+
+    Args:
+        name: Имя проверки из IMPORT_CHECKS
+        repeat: Количество запусков (берётся медиана)
+        budget_ms: Допустимое время, мс (None — не проверять)
+        python: Интерпретатор
+
+    Returns:
+        ImportResult: Время, количество модулей и лишние модули последнего запуска
+    """
+    check = IMPORT_CHECKS[name]
+    timings: List[float] = []
+    modules: List[str] = []
+    for _ in range(max(1, repeat)):
+        output = subprocess.run([python, "-c", _RUNNER.format(statement=check.statement)],
+                                check=True, capture_output=True, text=True).stdout
+        elapsed, modules = json.loads(output.strip().splitlines()[-1])
+        timings.append(elapsed)
+    unexpected = [prefix for prefix in check.forbidden
+                  if any(module == prefix or module.startswith(prefix + ".") for module in modules)]
+    return ImportResult(check=name, ms=round(statistics.median(timings) * 1000, 2), modules=len(modules),
+                        unexpected=unexpected, budget_ms=budget_ms)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m bitrix24_sdk.emulator.importtime",
+                                     description="Время импорта bitrix24_sdk и создания клиента")
+    parser.add_argument("--check", action="append", choices=sorted(IMPORT_CHECKS), help="Проверка (можно несколько)")
+    parser.add_argument("--repeat", type=int, default=5, help="Запусков на проверку")
+    parser.add_argument("--budget", action="append", default=[], metavar="CHECK=MS",
+                        help="Бюджет времени проверки, мс (можно несколько)")
+    parser.add_argument("--json", action="store_true", help="Вывести результаты в JSON")
+    args = parser.parse_args(argv)
+
+    budgets: Dict[str, float] = {}
+    for item in args.budget:
+        name, _, value = item.partition("=")
+        if name not in IMPORT_CHECKS or not value:
+            parser.error(f"Некорректный бюджет: {item}")
+        budgets[name] = float(value)
+
+    results = [measure_import(name, args.repeat, budgets.get(name)) for name in args.check or IMPORT_CHECKS]
+    if args.json:
+        print(json.dumps([dict(result.model_dump(), ok=result.ok) for result in results], indent=2))
+    else:
+        for result in results:
+            budget = f" / {result.budget_ms:g}" if result.budget_ms is not None else ""
+            print(f"{result.check:<14} {result.ms:>9.2f}{budget} ms {result.modules:>5} modules "
+                  f"{'ok' if result.ok else 'FAIL'} {' '.join(result.unexpected)}".rstrip())
+    if not all(result.ok for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
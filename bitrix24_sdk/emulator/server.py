@@ -0,0 +1,755 @@
+import base64
+import gzip
+import json
+import random
+import re
+import secrets
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from pydantic import BaseModel, Field
+
+from ..bitrix_http import AsyncBitrixClient, BitrixClient
+from ..bitrix_http.batch import BATCH_MAX_COMMANDS
+from ..config.config import BitrixSettings
+from .dataset import DatasetConfig, EmulatorDataset
+
+_KEY_RE = re.compile(r"^([^\[]+)((?:\[[^\]]*\])*)$")
+_SEGMENT_RE = re.compile(r"\[([^\]]*)\]")
+_REF_RE = re.compile(r"\$result\[([^\]]+)\]((?:\[[^\]]*\])*)")
+_RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)$")
+_BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?')
+_DISPOSITION_RE = re.compile(r'\b(name|filename)="([^"]*)"')
+_OPERATORS = (">=", "<=", "!=", "!@", ">", "<", "!", "@", "=", "%")
+
+
+class EmulatorConfig(BaseModel):
+    """Поведение эмулятора: задержки, лимиты и размер страниц."""
+    latency: float = Field(0.0, ge=0, description="Задержка ответа на каждый HTTP запрос, секунды")
+    latency_jitter: float = Field(0.0, ge=0, description="Случайная добавка к задержке, секунды (0..jitter)")
+    rate_limit: Optional[float] = Field(None, gt=0, description="Запросов в секунду, после которых портал отвечает "
+                                                                 "QUERY_LIMIT_EXCEEDED (None — без ограничения)")
+    rate_limit_burst: int = Field(50, ge=1, description="Размер накопителя запросов")
+    page_size: int = Field(50, ge=1, description="Элементов на странице списочных методов")
+    gzip_min_size: Optional[int] = Field(1024, ge=0, description="Сжимать JSON ответы от этого размера, если клиент "
+                                                                 "принимает gzip (None — не сжимать)")
+    dataset: DatasetConfig = Field(default_factory=DatasetConfig, description="Размеры набора данных")
+    seed: Optional[int] = Field(None, description="Начальное значение генератора задержек")
+
+
+class EmulatorError(Exception):
+    """Ошибка метода, которую эмулятор возвращает телом {"error": ..., "error_description": ...}."""
+
+    def __init__(self, code: str, description: str, status: int = 400) -> None:
+        super().__init__(description)
+        self.code = code
+        self.description = description
+        self.status = status
+
+    def body(self) -> Dict[str, Any]:
+        return {"error": self.code, "error_description": self.description}
+
+
+class _LeakyBucket:
+    """Накопитель запросов портала: растёт на 1 за запрос и убывает со скоростью rate."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._level = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._level = max(0.0, self._level - (now - self._updated) * self.rate)
+            self._updated = now
+            if self._level + 1 > self.burst:
+                return False
+            self._level += 1
+            return True
+
+
+class BitrixEmulator:
+    """
+    Локальный HTTP сервер, имитирующий REST API Bitrix24.
+
+    Реализует crm.type.list, crm.item.list, crm.item.fields, методы disk.*,
+    которые использует DiskService, batch, двухэтапную загрузку через
+    disk.folder.uploadfile и скачивание по DOWNLOAD_URL с Range. Ответы
+    повторяют форму ответов портала (total, next, time, ошибки с HTTP 4xx/5xx),
+    поэтому через эмулятор работают повторы, ограничитель и пакетные запросы SDK.
+
+    Сервер работает в фоновом потоке и обрабатывает запросы параллельно.
+
+    Example:
+        >>> with BitrixEmulator(EmulatorConfig(latency=0.01, rate_limit=2)) as emulator:
+        ...     client = emulator.client()
+        ...     items = list(client.crm.iter_items(1040, keyset=True))
+        ...     print(emulator.stats()["calls"]["crm.item.list"])
+    """
+
+    def __init__(self, config: Optional[EmulatorConfig] = None, dataset: Optional[EmulatorDataset] = None,
+                 host: str = "127.0.0.1", port: int = 0) -> None:
+        """
+        Инициализация.
+
+        Args:
+            config: Поведение эмулятора
+            dataset: Готовый набор данных (по умолчанию строится по config.dataset)
+            host: Адрес сервера
+            port: Порт (0 — свободный порт)
+        """
+        self.config = config or EmulatorConfig()
+        self.dataset = dataset or EmulatorDataset(self.config.dataset)
+        self._random = random.Random(self.config.seed)
+        self._bucket = _LeakyBucket(self.config.rate_limit, self.config.rate_limit_burst) \
+            if self.config.rate_limit is not None else None
+        self._uploads: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+        self._calls: Counter = Counter()
+        self._counters: Counter = Counter()
+        self._methods: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "methods": self._methods_list,
+            "scope": lambda params: {"result": ["crm", "disk"]},
+            "crm.type.list": self._type_list,
+            "crm.item.list": self._item_list,
+            "crm.item.fields": self._item_fields,
+            "disk.storage.getlist": self._storage_list,
+            "disk.storage.get": self._storage_get,
+            "disk.storage.addfolder": self._storage_add_folder,
+            "disk.folder.get": self._folder_get,
+            "disk.folder.getchildren": self._folder_children,
+            "disk.folder.addsubfolder": self._folder_add_subfolder,
+            "disk.folder.deletetree": self._folder_delete_tree,
+            "disk.folder.uploadfile": self._folder_upload_file,
+            "disk.file.get": self._file_get,
+        }
+        self._server = ThreadingHTTPServer((host, port), _handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Адрес сервера (http://host:port)."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self) -> str:
+        """Значение BASE_URL для настроек клиента."""
+        return f"{self.url}/rest"
+
+    def settings(self, **overrides: Any) -> BitrixSettings:
+        """
+        Настройки клиента для эмулятора.
+
+        Ограничитель SDK по умолчанию выключен, чтобы измерять пропускную
+        способность самого SDK; передайте RATE_LIMIT, чтобы его включить.
+        """
+        values: Dict[str, Any] = {"BASE_URL": self.base_url, "RATE_LIMIT": None}
+        values.update(overrides)
+        return BitrixSettings(**values)
+
+    def client(self, **overrides: Any) -> BitrixClient:
+        """BitrixClient, настроенный на эмулятор (overrides — поля BitrixSettings)."""
+        return BitrixClient(token="emulator", user_id=1, settings=self.settings(**overrides))
+
+    def async_client(self, **overrides: Any) -> AsyncBitrixClient:
+        """AsyncBitrixClient, настроенный на эмулятор (overrides — поля BitrixSettings)."""
+        return AsyncBitrixClient(token="emulator", user_id=1, settings=self.settings(**overrides))
+
+    def start(self) -> "BitrixEmulator":
+        """Запустить сервер в фоновом потоке."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="bitrix-emulator", daemon=True)
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Обслуживать запросы в текущем потоке (для запуска из командной строки)."""
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """Остановить сервер."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Счётчики запросов.
+
+        Returns:
+            requests (HTTP запросы), calls (вызовы по методам, включая команды batch),
+            rate_limited, errors, bytes_in, bytes_out (переданные байты тел), bytes_in_raw,
+            bytes_out_raw (без сжатия), json_bodies, gzip_bodies
+        """
+        with self._stats_lock:
+            return {"calls": dict(self._calls), **{name: self._counters[name] for name in
+                    ("requests", "rate_limited", "errors", "bytes_in", "bytes_out", "bytes_in_raw",
+                     "bytes_out_raw", "json_bodies", "gzip_bodies")}}
+
+    def reset_stats(self) -> None:
+        """Обнулить счётчики запросов."""
+        with self._stats_lock:
+            self._calls.clear()
+            self._counters.clear()
+
+    def __enter__(self) -> "BitrixEmulator":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    # Обработка запросов
+
+    def rest(self, method: str, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """Выполнить вызов REST метода: (HTTP статус, тело ответа)."""
+        started = time.time()
+        if self._bucket is not None and not self._bucket.take():
+            self._count("rate_limited")
+            return 503, {"error": "QUERY_LIMIT_EXCEEDED", "error_description": "Too many requests"}
+        self._delay()
+        try:
+            if method == "batch":
+                body = self._batch(params)
+            else:
+                body = self._call(method, params)
+        except EmulatorError as e:
+            self._count("errors")
+            return e.status, e.body()
+        body["time"] = _time_block(started)
+        return 200, body
+
+    def upload(self, token: str, content_type: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Второй этап загрузки: multipart тело по uploadUrl."""
+        self._delay()
+        folder_id = self._uploads.pop(token, None)
+        if folder_id is None:
+            return 404, {"error": "NOT_FOUND", "error_description": "Upload url is not valid"}
+        for _, name, content in parse_multipart(content_type, body):
+            if name is None:
+                continue
+            try:
+                return 200, {"result": self._create_file(folder_id, name, content)}
+            except EmulatorError as e:
+                return e.status, e.body()
+        return 400, {"error": "ERROR_ARGUMENT", "error_description": "File is not found in request"}
+
+    def download(self, file_id: int, range_header: Optional[str]) -> Tuple[int, Dict[str, str], bytes]:
+        """Скачивание файла: (HTTP статус, заголовки, тело)."""
+        self._delay()
+        file = self.dataset.objects.get(file_id)
+        if file is None or file["TYPE"] != "file":
+            return 404, {}, b""
+        size = int(file["SIZE"])
+        match = _RANGE_RE.match(range_header or "")
+        if match is None:
+            return 200, {"Accept-Ranges": "bytes"}, self.dataset.content(file_id)
+        first, last = match.groups()
+        start = int(first) if first else max(0, size - int(last or 0))
+        end = int(last) if first and last else size - 1
+        if start >= size:
+            return 416, {"Content-Range": f"bytes */{size}"}, b""
+        end = min(end, size - 1)
+        headers = {"Accept-Ranges": "bytes", "Content-Range": f"bytes {start}-{end}/{size}"}
+        return 206, headers, self.dataset.content(file_id, start, end)
+
+    def _call(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        handler = self._methods.get(method)
+        self._count_call(method)
+        if handler is None:
+            raise EmulatorError("ERROR_METHOD_NOT_FOUND", "Method not found!", 404)
+        return handler(params)
+
+    def _batch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        commands = params.get("cmd") or {}
+        if not isinstance(commands, dict):
+            raise EmulatorError("ERROR_ARGUMENT", "cmd must be an array")
+        if len(commands) > BATCH_MAX_COMMANDS:
+            raise EmulatorError("ERROR_BATCH_LENGTH_EXCEEDED", f"Max batch length exceeded {BATCH_MAX_COMMANDS}")
+        halt = str(params.get("halt", "0")) not in ("0", "", "false")
+        results: Dict[str, Any] = {}
+        errors: Dict[str, Any] = {}
+        totals: Dict[str, Any] = {}
+        nexts: Dict[str, Any] = {}
+        times: Dict[str, Any] = {}
+        for name, command in commands.items():
+            method, _, query = str(command).partition("?")
+            started = time.time()
+            try:
+                pairs = [(key, _substitute(value, results)) for key, value in parse_qsl(query, keep_blank_values=True)]
+                body = self._call(method, parse_params(pairs))
+            except EmulatorError as e:
+                errors[name] = e.body()
+                if halt:
+                    break
+                continue
+            results[name] = body.get("result")
+            if "total" in body:
+                totals[name] = body["total"]
+            if "next" in body:
+                nexts[name] = body["next"]
+            times[name] = _time_block(started)
+        # Пустые ассоциативные массивы PHP приходят как []
+        return {"result": {"result": results or [], "result_error": errors or [], "result_total": totals or [],
+                           "result_next": nexts or [], "result_time": times or []}}
+
+    def _delay(self) -> None:
+        config = self.config
+        if config.latency or config.latency_jitter:
+            with self._stats_lock:
+                jitter = self._random.uniform(0, config.latency_jitter) if config.latency_jitter else 0.0
+            time.sleep(config.latency + jitter)
+
+    def _count(self, name: str, value: int = 1) -> None:
+        with self._stats_lock:
+            self._counters[name] += value
+
+    def _count_call(self, method: str) -> None:
+        with self._stats_lock:
+            self._calls[method] += 1
+
+    # Методы
+
+    def _methods_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"result": sorted([*self._methods, "batch"])}
+
+    def _page(self, rows: List[Any], params: Dict[str, Any]) -> Dict[str, Any]:
+        start = _start(params)
+        size = self.config.page_size
+        if start < 0:
+            return {"result": rows[:size]}
+        body: Dict[str, Any] = {"result": rows[start:start + size], "total": len(rows)}
+        if start + size < len(rows):
+            body["next"] = start + size
+        return body
+
+    def _type_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        types = [self.dataset.crm_type(entity_type_id) for entity_type_id in self.dataset.entity_type_ids]
+        types = [row for row in types if _matches(row, params.get("filter"))]
+        body = self._page(types, params)
+        body["result"] = {"types": body["result"]}
+        return body
+
+    def _item_fields(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        entity_type_id = self._entity_type(params)
+        return {"result": {"fields": self.dataset.item_fields(entity_type_id)}}
+
+    def _item_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        entity_type_id = self._entity_type(params)
+        filter = params.get("filter") or {}
+        if not isinstance(filter, dict):
+            filter = {}
+        ids, rest = _id_range(self.dataset.item_ids(entity_type_id), filter)
+        order = params.get("order") or {}
+        if isinstance(order, dict) and str(order.get("id", "ASC")).upper() == "DESC":
+            ids = ids[::-1]
+        start = _start(params)
+        size = self.config.page_size
+        offset = max(start, 0)
+
+        if rest:
+            # Фильтр не только по id: строки перебираются целиком
+            matched = [item_id for item_id in ids if _matches(self.dataset.item(entity_type_id, item_id), rest)]
+            ids = matched
+        page = [self.dataset.item(entity_type_id, item_id) for item_id in ids[offset:offset + size]]
+
+        select = params.get("select")
+        if isinstance(select, str):
+            select = [select]
+        if select and "*" not in select:
+            keys = {"id", *select}
+            page = [{key: value for key, value in row.items() if key in keys} for row in page]
+
+        body: Dict[str, Any] = {"result": {"items": page}}
+        if start >= 0:
+            body["total"] = len(ids)
+            if offset + size < len(ids):
+                body["next"] = offset + size
+        return body
+
+    def _entity_type(self, params: Dict[str, Any]) -> int:
+        entity_type_id = _int(params.get("entityTypeId"), 0)
+        if entity_type_id not in self.dataset.entity_type_ids:
+            raise EmulatorError("NOT_FOUND", "Смарт-процесс не найден")
+        return entity_type_id
+
+    def _storage_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        storages = [row for row in self.dataset.storages if _matches(row, params.get("filter"))]
+        return self._page(storages, params)
+
+    def _storage(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        storage_id = str(params.get("id"))
+        for storage in self.dataset.storages:
+            if storage["ID"] == storage_id:
+                return storage
+        raise EmulatorError("ERROR_NOT_FOUND", "Could not find entity with id 'X'", 404)
+
+    def _storage_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"result": self._storage(params)}
+
+    def _storage_add_folder(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        storage = self._storage(params)
+        return {"result": self._create_folder(int(storage["ROOT_OBJECT_ID"]), params)}
+
+    def _object(self, params: Dict[str, Any], kind: str) -> Dict[str, Any]:
+        obj = self.dataset.objects.get(_int(params.get("id"), 0))
+        if obj is None or obj["TYPE"] != kind:
+            raise EmulatorError("ERROR_NOT_FOUND", "Could not find entity with id 'X'", 404)
+        return obj
+
+    def _folder_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"result": self._object(params, "folder")}
+
+    def _folder_children(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        folder = self._object(params, "folder")
+        children = [row for row in self.dataset.children(int(folder["ID"])) if _matches(row, params.get("filter"))]
+        return self._page(children, params)
+
+    def _folder_add_subfolder(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        folder = self._object(params, "folder")
+        return {"result": self._create_folder(int(folder["ID"]), params)}
+
+    def _folder_delete_tree(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        folder = self._object(params, "folder")
+        self.dataset.delete_tree(int(folder["ID"]))
+        return {"result": True}
+
+    def _folder_upload_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        folder = self._object(params, "folder")
+        folder_id = int(folder["ID"])
+        content = params.get("fileContent")
+        if content:
+            name, encoded = (content[0], content[1]) if isinstance(content, list) else (None, content)
+            data = params.get("data") or {}
+            name = data.get("NAME") or name
+            if not name:
+                raise EmulatorError("ERROR_ARGUMENT", "Field NAME is required")
+            unique = str(params.get("generateUniqueName", "")) in ("1", "Y", "true")
+            return {"result": self._create_file(folder_id, name, base64.b64decode(encoded), unique)}
+        token = secrets.token_hex(16)
+        self._uploads[token] = folder_id
+        return {"result": {"field": "file", "uploadUrl": f"{self.url}/upload/{token}"}}
+
+    def _file_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"result": self._object(params, "file")}
+
+    def _create_folder(self, parent_id: int, params: Dict[str, Any]) -> Dict[str, Any]:
+        data = params.get("data") or {}
+        name = data.get("NAME") if isinstance(data, dict) else None
+        if not name:
+            raise EmulatorError("ERROR_ARGUMENT", "Field NAME is required")
+        with self.dataset.lock:
+            self._check_unique(parent_id, name)
+            storage_id = int(self.dataset.objects[parent_id]["STORAGE_ID"])
+            return self.dataset.add_folder(storage_id, parent_id, name)
+
+    def _create_file(self, folder_id: int, name: str, content: bytes, unique: bool = False) -> Dict[str, Any]:
+        with self.dataset.lock:
+            if unique:
+                name = self._unique_name(folder_id, name)
+            self._check_unique(folder_id, name)
+            storage_id = int(self.dataset.objects[folder_id]["STORAGE_ID"])
+            return self.dataset.add_file(storage_id, folder_id, name, len(content), content)
+
+    def _check_unique(self, folder_id: int, name: str) -> None:
+        if any(child["NAME"] == name for child in self.dataset.children(folder_id)):
+            raise EmulatorError("DISK_OBJ_22000", f"Объект с именем {name} уже существует")
+
+    def _unique_name(self, folder_id: int, name: str) -> str:
+        taken = {child["NAME"] for child in self.dataset.children(folder_id)}
+        stem, dot, suffix = name.rpartition(".")
+        if not dot:
+            stem, suffix = name, ""
+        candidate, number = name, 1
+        while candidate in taken:
+            candidate = f"{stem} ({number}){dot}{suffix}"
+            number += 1
+        return candidate
+
+
+def parse_params(pairs: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+    """
+    Собрать параметры из пар формы в стиле PHP.
+
+    Ключи вида filter[>id] и select[0] разворачиваются во вложенные словари,
+    словари с ключами 0..n-1 становятся списками, повторяющийся ключ без
+    скобок (select=id&select=title) — списком.
+    """
+    params: Dict[str, Any] = {}
+    for key, value in pairs:
+        match = _KEY_RE.match(key)
+        if match is None:
+            continue
+        name, brackets = match.groups()
+        path = _SEGMENT_RE.findall(brackets)
+        if not path:
+            if name in params:
+                current = params[name]
+                params[name] = (current if isinstance(current, list) else [current]) + [value]
+            else:
+                params[name] = value
+            continue
+        node = params.setdefault(name, {})
+        if not isinstance(node, dict):
+            node = params[name] = {}
+        for segment in path[:-1]:
+            segment = segment or str(len(node))
+            child = node.setdefault(segment, {})
+            if not isinstance(child, dict):
+                child = node[segment] = {}
+            node = child
+        node[path[-1] or str(len(node))] = value
+    return {key: _listify(value) for key, value in params.items()}
+
+
+def parse_multipart(content_type: str, body: bytes) -> List[Tuple[Optional[str], Optional[str], bytes]]:
+    """
+    Разобрать тело multipart/form-data.
+
+    Returns:
+        Части (имя поля, имя файла или None, содержимое)
+    """
+    match = _BOUNDARY_RE.search(content_type)
+    if match is None:
+        return []
+    delimiter = b"--" + match.group(1).encode("latin-1")
+    parts: List[Tuple[Optional[str], Optional[str], bytes]] = []
+    for chunk in body.split(delimiter)[1:]:
+        if chunk.startswith(b"--"):
+            break
+        head, _, payload = chunk.partition(b"\r\n\r\n")
+        if payload.endswith(b"\r\n"):
+            payload = payload[:-2]
+        disposition: Dict[str, str] = {}
+        for line in head.decode("utf-8", "replace").split("\r\n"):
+            if line.lower().startswith("content-disposition:"):
+                disposition = dict(_DISPOSITION_RE.findall(line))
+        parts.append((disposition.get("name"), disposition.get("filename"), payload))
+    return parts
+
+
+def _listify(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    value = {key: _listify(item) for key, item in value.items()}
+    if value and all(key.isdigit() for key in value) and sorted(map(int, value)) == list(range(len(value))):
+        return [value[str(index)] for index in range(len(value))]
+    return value
+
+
+def _substitute(value: str, results: Dict[str, Any]) -> str:
+    """Подставить значения ссылок $result[cmd][KEY] на команды пакета."""
+    def replace(match: "re.Match[str]") -> str:
+        current: Any = results.get(match.group(1))
+        for key in _SEGMENT_RE.findall(match.group(2)):
+            if isinstance(current, list):
+                current = current[int(key)]
+            elif isinstance(current, dict):
+                current = current.get(key)
+            else:
+                current = None
+        return "" if current is None else str(current)
+
+    return _REF_RE.sub(replace, value) if "$result[" in value else value
+
+
+def _split_condition(key: str) -> Tuple[str, str]:
+    for operator in _OPERATORS:
+        if key.startswith(operator):
+            return operator, key[len(operator):]
+    return "=", key
+
+
+def _matches(row: Dict[str, Any], filter: Any) -> bool:
+    if not isinstance(filter, dict):
+        return True
+    for key, expected in filter.items():
+        operator, field = _split_condition(key)
+        if field not in row:
+            continue
+        if not _compare(row[field], operator, expected):
+            return False
+    return True
+
+
+def _compare(actual: Any, operator: str, expected: Any) -> bool:
+    if operator in ("@", "!@"):
+        values = expected if isinstance(expected, list) else [expected]
+        found = any(_equal(actual, value) for value in values)
+        return found if operator == "@" else not found
+    if operator == "%":
+        return str(expected).lower() in str(actual).lower()
+    if operator in ("=", "!", "!="):
+        equal = _equal(actual, expected)
+        return equal if operator == "=" else not equal
+    left, right = _ordered(actual, expected)
+    return {">": left > right, ">=": left >= right, "<": left < right, "<=": left <= right}[operator]
+
+
+def _equal(actual: Any, expected: Any) -> bool:
+    left, right = _ordered(actual, expected)
+    return left == right
+
+
+def _ordered(actual: Any, expected: Any) -> Tuple[Any, Any]:
+    """Значения для сравнения: числа как числа, остальное как строки."""
+    try:
+        return float(actual), float(expected)
+    except (TypeError, ValueError):
+        return str(actual), str(expected)
+
+
+def _id_range(ids: range, filter: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+    """Сузить диапазон ID по условиям на id; остальные условия вернуть отдельно."""
+    rest: Dict[str, Any] = {}
+    low, high = ids.start, ids.stop
+    listed: Optional[List[int]] = None
+    for key, value in filter.items():
+        operator, field = _split_condition(key)
+        if field != "id" or operator not in (">", ">=", "<", "<=", "=", "@"):
+            rest[key] = value
+            continue
+        if operator == "@":
+            values = value if isinstance(value, list) else [value]
+            listed = sorted({_int(item, 0) for item in values})
+            continue
+        number = _int(value, 0)
+        if operator == ">":
+            low = max(low, number + 1)
+        elif operator == ">=":
+            low = max(low, number)
+        elif operator == "<":
+            high = min(high, number)
+        elif operator == "<=":
+            high = min(high, number + 1)
+        else:
+            low, high = max(low, number), min(high, number + 1)
+    selected = range(low, max(low, high))
+    if listed is not None:
+        return [item_id for item_id in listed if item_id in selected], rest
+    return selected, rest
+
+
+def _int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _start(params: Dict[str, Any]) -> int:
+    """Параметр start: методы disk передают его как START."""
+    return _int(params.get("start", params.get("START")), 0)
+
+
+def _time_block(started: float) -> Dict[str, Any]:
+    finished = time.time()
+    return {
+        "start": started, "finish": finished, "duration": finished - started, "processing": finished - started,
+        "date_start": datetime.fromtimestamp(started, timezone.utc).isoformat(),
+        "date_finish": datetime.fromtimestamp(finished, timezone.utc).isoformat(),
+        "operating": 0, "operating_reset_at": started + 600,
+    }
+
+
+def _handler(emulator: BitrixEmulator) -> type:
+    """Класс обработчика HTTP запросов, привязанный к эмулятору."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Заголовки и тело пишутся отдельно: без TCP_NODELAY каждый ответ ждал бы отложенный ACK
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            self._dispatch()
+
+        def do_POST(self) -> None:
+            self._dispatch()
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _dispatch(self) -> None:
+            body = self._read_body()
+            emulator._count("requests")
+            emulator._count("bytes_in", len(body))
+            if self.headers.get("Content-Encoding", "").lower() == "gzip":
+                emulator._count("gzip_bodies")
+                body = gzip.decompress(body)
+            emulator._count("bytes_in_raw", len(body))
+            parts = urlsplit(self.path)
+            segments = [segment for segment in parts.path.split("/") if segment]
+            if segments[:1] == ["download"] and len(segments) == 2:
+                status, headers, content = emulator.download(_int(segments[1], 0), self.headers.get("Range"))
+                emulator._count("bytes_out_raw", len(content))
+                self._send(status, content, "application/octet-stream", headers)
+                return
+            if segments[:1] == ["upload"] and len(segments) == 2:
+                status, payload = emulator.upload(segments[1], self.headers.get("Content-Type", ""), body)
+            elif segments[:1] == ["rest"] and segments[-1:] and segments[-1].endswith(".json"):
+                method = segments[-1][:-len(".json")]
+                status, payload = emulator.rest(method, self._params(parts.query, body))
+            else:
+                status, payload = 404, {"error": "NOT_FOUND", "error_description": "Not found"}
+            content = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            emulator._count("bytes_out_raw", len(content))
+            headers = None
+            min_size = emulator.config.gzip_min_size
+            if min_size is not None and len(content) >= min_size and \
+                    "gzip" in self.headers.get("Accept-Encoding", "").lower():
+                content, headers = gzip.compress(content, compresslevel=5), {"Content-Encoding": "gzip"}
+            self._send(status, content, "application/json", headers)
+
+        def _params(self, query: str, body: bytes) -> Dict[str, Any]:
+            content_type = self.headers.get("Content-Type", "")
+            pairs = parse_qsl(query, keep_blank_values=True)
+            if content_type.startswith("application/json"):
+                emulator._count("json_bodies")
+                params = parse_params(pairs)
+                params.update(json.loads(body or b"{}"))
+                return params
+            if content_type.startswith("multipart/form-data"):
+                for name, file_name, payload in parse_multipart(content_type, body):
+                    if file_name is not None:
+                        payload = base64.b64encode(payload)
+                    pairs.append((name or "", payload.decode("utf-8", "replace")))
+                return parse_params(pairs)
+            return parse_params(pairs + parse_qsl(body.decode("utf-8"), keep_blank_values=True))
+
+        def _read_body(self) -> bytes:
+            if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                chunks = []
+                while True:
+                    size = int(self.rfile.readline().split(b";")[0].strip() or b"0", 16)
+                    if size == 0:
+                        while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                            pass
+                        return b"".join(chunks)
+                    chunks.append(self.rfile.read(size))
+                    self.rfile.readline()
+            length = int(self.headers.get("Content-Length") or 0)
+            return self.rfile.read(length) if length else b""
+
+        def _send(self, status: int, content: bytes, content_type: str,
+                  headers: Optional[Dict[str, str]] = None) -> None:
+            emulator._count("bytes_out", len(content))
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(content)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(content)
+
+    return Handler
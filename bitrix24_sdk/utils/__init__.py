@@ -1,4 +1,27 @@
-from .models import BitrixParams
+from typing import TYPE_CHECKING
 
-__all__ = ["BitrixParams"]
+from .lazy import lazy_exports
 
+if TYPE_CHECKING:
+    from .models import BitrixParams
+    from .query import build_query, flatten_params
+    from .encoder import PageQuery, encode_form, encode_params
+    from .response import LazyRecord, ResponseMode, build_response
+    from .columnar import (
+        Column, ColumnarWriter, ColumnBuffer, CsvWriter, RecordBatchWriter, ArrowWriter, ParquetWriter,
+        columns_from_model, open_table_writer
+    )
+
+_EXPORTS = {
+    "BitrixParams": ".models", "build_query": ".query", "flatten_params": ".query",
+    "PageQuery": ".encoder", "encode_form": ".encoder", "encode_params": ".encoder",
+    "LazyRecord": ".response", "ResponseMode": ".response", "build_response": ".response",
+    **dict.fromkeys([
+        "Column", "ColumnarWriter", "ColumnBuffer", "CsvWriter", "RecordBatchWriter", "ArrowWriter", "ParquetWriter",
+        "columns_from_model", "open_table_writer",
+    ], ".columnar"),
+    "lazy_exports": ".lazy",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,372 @@
+import csv
+import json
+import os
+import typing
+from datetime import datetime
+from typing import Any, Callable, Dict, IO, Iterable, List, Literal, NamedTuple, Optional, Sequence, Type, Union
+
+from pydantic import BaseModel
+
+ColumnType = Literal["int", "float", "bool", "str", "datetime", "json"]
+"""Тип колонки: значения приводятся к нему при записи, json — списки и словари в виде JSON строки."""
+
+DEFAULT_BATCH_ROWS = 10000
+"""Сколько строк накапливается в колонках перед записью пакета (группы строк Parquet)."""
+
+_PYTHON_TYPES: Dict[Any, str] = {int: "int", float: "float", bool: "bool", str: "str", datetime: "datetime"}
+
+
+class Column(NamedTuple):
+    """Колонка таблицы выгрузки."""
+    name: str
+    type: ColumnType = "str"
+    key: Optional[str] = None
+    """Ключ значения в строке-словаре (режим raw); по умолчанию name."""
+
+
+def column_type(annotation: Any) -> ColumnType:
+    """Тип колонки для аннотации поля: Optional снимается, неизвестные типы и списки — json."""
+    if typing.get_origin(annotation) is Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    return _PYTHON_TYPES.get(annotation, "json")  # type: ignore[return-value]
+
+
+def columns_from_model(model: Type[BaseModel], include: Optional[Iterable[str]] = None) -> List[Column]:
+    """
+    Колонки по полям Pydantic модели.
+
+    Args:
+        model: Модель строки (например, FileInfo)
+        include: Оставить только эти поля (имена атрибутов)
+
+    Returns:
+        Колонки в порядке полей модели; key — алиас поля (ключ JSON)
+    """
+    wanted = set(include) if include is not None else None
+    return [
+        Column(name, column_type(info.annotation), info.alias or name)
+        for name, info in model.model_fields.items()
+        if wanted is None or name in wanted
+    ]
+
+
+class ColumnarWriter:
+    """
+    Потоковая запись строк списочных методов в колонки.
+
+    Строки (модели, LazyRecord, элементы ItemSchema или словари режима raw)
+    раскладываются по колонкам сразу при поступлении страницы, значения
+    приводятся к типу колонки, и каждые batch_rows строк колонки передаются
+    наследнику для записи и очищаются. Поэтому память ограничена размером
+    пакета, а не всей выгрузки. Экземпляр можно передать как sink в
+    CrmService.export_items.
+
+    Example:
+        >>> with ParquetWriter("items.parquet", schema.columns()) as writer:
+        ...     client.crm.export_items(1040, writer, mode="raw")
+    """
+
+    def __init__(self, columns: Sequence[Column], batch_rows: int = DEFAULT_BATCH_ROWS) -> None:
+        """
+        Инициализация.
+
+        Args:
+            columns: Колонки таблицы
+            batch_rows: Сколько строк накапливать перед записью пакета
+        """
+        if not columns:
+            raise ValueError("Нужна хотя бы одна колонка")
+        if batch_rows < 1:
+            raise ValueError("batch_rows должен быть не меньше 1")
+        self.columns = list(columns)
+        self.batch_rows = batch_rows
+        self.rows_written = 0
+        self._converters = [_CONVERTERS[column.type] for column in self.columns]
+        self._buffers: List[List[Any]] = [[] for _ in self.columns]
+        self._buffered = 0
+        self._closed = False
+
+    def write(self, rows: Iterable[Any], extra: Optional[Dict[str, Sequence[Any]]] = None) -> None:
+        """
+        Добавить строки.
+
+        Args:
+            rows: Строки страницы
+            extra: Значения дополнительных колонок по их именам, параллельные rows
+                (например, путь объекта Disk)
+        """
+        if self._closed:
+            raise RuntimeError("Запись уже завершена")
+        rows = rows if isinstance(rows, list) else list(rows)
+        for index, (column, convert) in enumerate(zip(self.columns, self._converters)):
+            buffer = self._buffers[index]
+            if extra is not None and column.name in extra:
+                buffer.extend(convert(value) for value in extra[column.name])
+                continue
+            name, key = column.name, column.key or column.name
+            buffer.extend(convert(_value(row, name, key)) for row in rows)
+        self._buffered += len(rows)
+        if self._buffered >= self.batch_rows:
+            self.flush()
+
+    def __call__(self, rows: List[Any], partition: Any = None) -> None:
+        """Приёмник страниц для CrmService.export_items."""
+        self.write(rows)
+
+    def flush(self) -> None:
+        """Записать накопленные строки."""
+        if not self._buffered:
+            return
+        self._write_batch({column.name: buffer for column, buffer in zip(self.columns, self._buffers)},
+                          self._buffered)
+        self.rows_written += self._buffered
+        self._buffers = [[] for _ in self.columns]
+        self._buffered = 0
+
+    def close(self) -> None:
+        """Записать остаток и закрыть приёмник."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._close()
+
+    def _write_batch(self, columns: Dict[str, List[Any]], rows: int) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        pass
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class ColumnBuffer(ColumnarWriter):
+    """
+    Накопление пакетов колонок в памяти или передача их в обратный вызов.
+
+    Без on_batch все пакеты сохраняются в batches (списки значений по колонкам).
+    """
+
+    def __init__(self, columns: Sequence[Column], batch_rows: int = DEFAULT_BATCH_ROWS,
+                 on_batch: Optional[Callable[[Dict[str, List[Any]]], None]] = None) -> None:
+        super().__init__(columns, batch_rows)
+        self.on_batch = on_batch
+        self.batches: List[Dict[str, List[Any]]] = []
+
+    def _write_batch(self, columns: Dict[str, List[Any]], rows: int) -> None:
+        if self.on_batch is not None:
+            self.on_batch(columns)
+        else:
+            self.batches.append(columns)
+
+
+class CsvWriter(ColumnarWriter):
+    """Запись в CSV: даты в ISO 8601, пустые значения — пустые ячейки."""
+
+    def __init__(self, target: Union[str, "os.PathLike[str]", IO[str]], columns: Sequence[Column],
+                 batch_rows: int = DEFAULT_BATCH_ROWS, delimiter: str = ",", header: bool = True) -> None:
+        """
+        Инициализация.
+
+        Args:
+            target: Путь к файлу или открытый текстовый файл
+            columns: Колонки таблицы
+            batch_rows: Сколько строк накапливать перед записью
+            delimiter: Разделитель полей
+            header: Записать строку заголовков
+        """
+        super().__init__(columns, batch_rows)
+        self._owns_file = not hasattr(target, "write")
+        self._file: IO[str] = open(target, "w", encoding="utf-8", newline="") if self._owns_file else target  # type: ignore[arg-type]
+        self._writer = csv.writer(self._file, delimiter=delimiter)
+        if header:
+            self._writer.writerow(column.name for column in self.columns)
+
+    def _write_batch(self, columns: Dict[str, List[Any]], rows: int) -> None:
+        cells = [[_csv_cell(value) for value in values] for values in columns.values()]
+        self._writer.writerows(zip(*cells))
+
+    def _close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class RecordBatchWriter(ColumnarWriter):
+    """
+    Преобразование пакетов колонок в pyarrow.RecordBatch.
+
+    Без on_batch пакеты сохраняются в batches; table() собирает из них pyarrow.Table.
+    Требует пакет pyarrow.
+    """
+
+    def __init__(self, columns: Sequence[Column], batch_rows: int = DEFAULT_BATCH_ROWS,
+                 on_batch: Optional[Callable[[Any], None]] = None) -> None:
+        super().__init__(columns, batch_rows)
+        self._pa = _import_pyarrow()
+        self.schema = arrow_schema(self.columns)
+        self.on_batch = on_batch
+        self.batches: List[Any] = []
+
+    def table(self) -> Any:
+        """Собрать pyarrow.Table из сохранённых пакетов (без обнуления буфера записи вызовите flush)."""
+        return self._pa.Table.from_batches(self.batches, schema=self.schema)
+
+    def _record_batch(self, columns: Dict[str, List[Any]]) -> Any:
+        pa = self._pa
+        arrays = [pa.array(values, type=field.type) for values, field in zip(columns.values(), self.schema)]
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def _write_batch(self, columns: Dict[str, List[Any]], rows: int) -> None:
+        batch = self._record_batch(columns)
+        if self.on_batch is not None:
+            self.on_batch(batch)
+        else:
+            self.batches.append(batch)
+
+
+class ArrowWriter(RecordBatchWriter):
+    """Запись в файл Arrow IPC (Feather v2). Требует пакет pyarrow."""
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], columns: Sequence[Column],
+                 batch_rows: int = DEFAULT_BATCH_ROWS) -> None:
+        super().__init__(columns, batch_rows)
+        self._sink = self._pa.ipc.new_file(os.fspath(path), self.schema)
+
+    def _write_batch(self, columns: Dict[str, List[Any]], rows: int) -> None:
+        self._sink.write_batch(self._record_batch(columns))
+
+    def _close(self) -> None:
+        self._sink.close()
+
+
+class ParquetWriter(RecordBatchWriter):
+    """Запись в Parquet: каждый пакет — отдельная группа строк. Требует пакет pyarrow."""
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], columns: Sequence[Column],
+                 batch_rows: int = DEFAULT_BATCH_ROWS, compression: str = "zstd") -> None:
+        super().__init__(columns, batch_rows)
+        import pyarrow.parquet as pq
+
+        self._sink = pq.ParquetWriter(os.fspath(path), self.schema, compression=compression)
+
+    def _write_batch(self, columns: Dict[str, List[Any]], rows: int) -> None:
+        self._sink.write_batch(self._record_batch(columns))
+
+    def _close(self) -> None:
+        self._sink.close()
+
+
+TABLE_FORMATS = {".csv": CsvWriter, ".parquet": ParquetWriter, ".arrow": ArrowWriter, ".feather": ArrowWriter}
+"""Форматы выгрузки по расширению файла."""
+
+
+def open_table_writer(path: Union[str, "os.PathLike[str]"], columns: Sequence[Column],
+                      format: Optional[str] = None, batch_rows: int = DEFAULT_BATCH_ROWS) -> ColumnarWriter:
+    """
+    Открыть приёмник таблицы по формату или расширению файла.
+
+    Args:
+        path: Путь к файлу
+        columns: Колонки таблицы
+        format: csv, parquet или arrow (по умолчанию по расширению path)
+        batch_rows: Сколько строк накапливать перед записью пакета
+
+    Returns:
+        ColumnarWriter: CsvWriter, ParquetWriter или ArrowWriter
+    """
+    suffix = f".{format}" if format else os.path.splitext(os.fspath(path))[1].lower()
+    writer_cls = TABLE_FORMATS.get(suffix)
+    if writer_cls is None:
+        raise ValueError(f"Неизвестный формат выгрузки: {format or path}")
+    return writer_cls(path, columns, batch_rows=batch_rows)
+
+
+def arrow_schema(columns: Sequence[Column]) -> Any:
+    """Схема pyarrow для колонок; даты хранятся как timestamp UTC."""
+    pa = _import_pyarrow()
+    types = {
+        "int": pa.int64(), "float": pa.float64(), "bool": pa.bool_(), "str": pa.string(),
+        "datetime": pa.timestamp("us", tz="UTC"), "json": pa.string(),
+    }
+    return pa.schema([pa.field(column.name, types[column.type]) for column in columns])
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Для выгрузки в Arrow и Parquet нужен пакет pyarrow: pip install bitrix24-sdk[arrow]") from e
+    return pyarrow
+
+
+def _value(row: Any, name: str, key: str) -> Any:
+    if isinstance(row, dict):
+        return row.get(key)
+    return getattr(row, name, None)
+
+
+def _empty(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and value == "")
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if _empty(value) or value is False:
+        return None
+    return int(value)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if _empty(value) or value is False:
+        return None
+    return float(value)
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    if _empty(value):
+        return None
+    if isinstance(value, str):
+        return value.strip().upper() in ("Y", "1", "TRUE", "YES")
+    return bool(value)
+
+
+def _to_str(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    if _empty(value) or value is False:
+        return None
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def _to_json(value: Any) -> Optional[str]:
+    # Пустые множественные и пользовательские поля Bitrix отдаёт как false
+    if _empty(value) or value is False:
+        return None
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "int": _to_int, "float": _to_float, "bool": _to_bool, "str": _to_str,
+    "datetime": _to_datetime, "json": _to_json,
+}
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
@@ -0,0 +1,240 @@
+import threading
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, TYPE_CHECKING
+from urllib.parse import quote_plus
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from .models import BitrixParams
+
+FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
+
+_FORM_KEYS_MAX = 4096
+_form_keys: Dict[str, str] = {}
+
+
+def encode_scalar(value: Any) -> str:
+    """Привести скалярное значение к строке так же, как это делает PHP."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return encode_scalar(value.value)
+    return str(value)
+
+
+def _encode_into(out: Dict[str, str], name: str, value: Any) -> None:
+    """Развернуть значение под ключом name в out."""
+    # Частые типы проверяются по точному типу: это заметно быстрее isinstance с абстрактными классами
+    kind = type(value)
+    if kind is str:
+        out[name] = value
+    elif kind is int or kind is float:
+        out[name] = str(value)
+    elif kind is dict:
+        for key, item in value.items():
+            if item is not None:
+                _encode_into(out, f"{name}[{key}]", item)
+    elif kind is list or kind is tuple:
+        for index, item in enumerate(value):
+            if item is not None:
+                _encode_into(out, f"{name}[{index}]", item)
+    elif isinstance(value, Mapping):
+        _encode_into(out, name, dict(value))
+    elif isinstance(value, (list, tuple)):
+        _encode_into(out, name, list(value))
+    elif isinstance(value, BaseModel):
+        _encode_into(out, name, value.model_dump(by_alias=True, exclude_none=True))
+    else:
+        out[name] = encode_scalar(value)
+
+
+def encode_params(params: Mapping[str, Any], prefix: Optional[str] = None,
+                  into: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    Развернуть вложенные параметры в плоский словарь в стиле PHP.
+
+    Словари и списки любой вложенности превращаются в ключи вида
+    filter[>id], select[0], order[id]; значения None пропускаются.
+
+    Args:
+        params: Параметры запроса
+        prefix: Префикс ключа для вложенных значений
+        into: Словарь, в который добавляются ключи (по умолчанию новый)
+
+    Returns:
+        Словарь вида {"filter[@id][0]": "1", "select[0]": "id"}
+
+    Example:
+        >>> encode_params({"filter": {"@id": [1, 2]}, "order": {"id": "DESC"}})
+        {'filter[@id][0]': '1', 'filter[@id][1]': '2', 'order[id]': 'DESC'}
+    """
+    out: Dict[str, str] = {} if into is None else into
+    for key, value in params.items():
+        if value is not None:
+            _encode_into(out, f"{prefix}[{key}]" if prefix is not None else str(key), value)
+    return out
+
+
+def encode_form(params: Mapping[str, Any]) -> bytes:
+    """
+    Закодировать параметры в тело application/x-www-form-urlencoded.
+
+    Вложенные значения разворачиваются encode_params. Закодированные ключи
+    (select[0], filter[>id] и т.п.) запоминаются, поэтому повторные запросы
+    кодируют заново только значения.
+
+    Args:
+        params: Параметры запроса
+
+    Returns:
+        Тело запроса
+    """
+    parts = []
+    for key, value in encode_params(params).items():
+        quoted = _form_keys.get(key)
+        if quoted is None:
+            quoted = quote_plus(key)
+            if len(_form_keys) < _FORM_KEYS_MAX:
+                _form_keys[key] = quoted
+        parts.append(f"{quoted}={quote_plus(value)}")
+    return "&".join(parts).encode("ascii")
+
+
+def nest_params(params: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Собрать плоские параметры обратно во вложенные (обратное encode_params).
+
+    Ключи вида filter[@id][0] становятся вложенными словарями, словари с
+    ключами 0..n-1 — списками. Используется для тела запроса в JSON.
+
+    Example:
+        >>> nest_params({"filter[@id][0]": "1", "filter[@id][1]": "2", "start": "50"})
+        {'filter': {'@id': ['1', '2']}, 'start': '50'}
+    """
+    root: Dict[str, Any] = {}
+    for key, value in params.items():
+        bracket = key.find("[")
+        if bracket <= 0 or not key.endswith("]"):
+            root[key] = value
+            continue
+        path = [key[:bracket], *key[bracket + 1:-1].split("][")]
+        node = root
+        for segment in path[:-1]:
+            child = node.get(segment)
+            if not isinstance(child, dict):
+                child = node[segment] = {}
+            node = child
+        node[path[-1]] = value
+    return {key: _listify(value) for key, value in root.items()}
+
+
+def _listify(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    value = {key: _listify(item) for key, item in value.items()}
+    if all(key == str(index) for index, key in enumerate(value)):
+        return list(value.values())
+    return value
+
+
+class EncodingPlan:
+    """
+    План кодирования модели параметров.
+
+    Строится один раз для класса модели: для каждого поля заранее известно
+    имя, под которым оно отправляется (serialization_alias, alias или имя поля),
+    поэтому кодирование не вызывает model_dump.
+    """
+
+    __slots__ = ("fields", "wire_names")
+
+    def __init__(self, model: Type[BaseModel]) -> None:
+        self.fields: List[Tuple[str, str]] = [
+            (name, info.serialization_alias or info.alias or name) for name, info in model.model_fields.items()
+        ]
+        self.wire_names: Dict[str, str] = dict(self.fields)
+
+    def wire(self, name: str) -> str:
+        """Имя поля в запросе."""
+        return self.wire_names.get(name, name)
+
+    def encode(self, params: BaseModel) -> Dict[str, str]:
+        """Закодировать параметры."""
+        out: Dict[str, str] = {}
+        values = params.__dict__
+        for name, wire in self.fields:
+            value = values.get(name)
+            if value is not None:
+                _encode_into(out, wire, value)
+        return out
+
+
+_plans: Dict[type, EncodingPlan] = {}
+_plans_lock = threading.Lock()
+
+
+def plan_for(model: Type[BaseModel]) -> EncodingPlan:
+    """План кодирования класса параметров (строится при первом обращении)."""
+    plan = _plans.get(model)
+    if plan is None:
+        with _plans_lock:
+            plan = _plans.get(model)
+            if plan is None:
+                plan = _plans[model] = EncodingPlan(model)
+    return plan
+
+
+class PageQuery:
+    """
+    Закодированные параметры списочного запроса, у которых от страницы к странице меняется только курсор.
+
+    Параметры кодируются один раз; at() копирует готовый словарь и
+    подставляет start (и при необходимости дополнительные ключи).
+
+    Example:
+        >>> query = ItemListParams(entity_type_id=1040, select=["id"], filter={"stageId": "NEW"}).page_query()
+        >>> query.at(50)
+        {'entityTypeId': '1040', 'select[0]': 'id', 'filter[stageId]': 'NEW', 'start': '50'}
+    """
+
+    __slots__ = ("prefix", "cursor")
+
+    def __init__(self, prefix: Dict[str, str], cursor: str = "start") -> None:
+        """
+        Инициализация.
+
+        Args:
+            prefix: Закодированные параметры запроса
+            cursor: Имя параметра курсора в запросе (start или START)
+        """
+        self.prefix = prefix
+        self.cursor = cursor
+
+    @classmethod
+    def from_params(cls, params: "BitrixParams", cursor: str = "start") -> "PageQuery":
+        """Закодировать параметры; cursor — имя поля курсора в модели."""
+        return cls(params.to_bx_params(), plan_for(type(params)).wire(cursor))
+
+    def at(self, cursor: Any = None, extra: Optional[Mapping[str, Any]] = None) -> Dict[str, str]:
+        """
+        Параметры страницы.
+
+        Args:
+            cursor: Значение курсора (None — оставить значение из параметров)
+            extra: Дополнительные параметры страницы, например {"filter": {">id": 100}}
+
+        Returns:
+            Закодированные параметры
+        """
+        params = dict(self.prefix)
+        if cursor is not None:
+            params[self.cursor] = encode_scalar(cursor)
+        if extra:
+            encode_params(extra, into=params)
+        return params
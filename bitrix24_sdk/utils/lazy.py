@@ -0,0 +1,35 @@
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Ленивый импорт имён пакета (PEP 562).
+
+    Модуль с именем импортируется при первом обращении к атрибуту пакета,
+    после чего значение сохраняется в пакете и следующие обращения идут
+    напрямую. Так import bitrix24_sdk не тянет модели и сервисы, которые
+    не используются.
+
+    Args:
+        package: Имя пакета (__name__)
+        exports: Имя -> относительный модуль, например {"DiskService": ".service"}
+
+    Returns:
+        Функции __getattr__ и __dir__ для пакета
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(__name__, {"DiskService": ".service"})
+    """
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(importlib.import_module(package))) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,18 +1,33 @@
-from typing import Dict, Any
+from typing import Dict
 from pydantic import BaseModel
 
+from .encoder import PageQuery, plan_for
+
 
 class BitrixParams(BaseModel):
     """Базовый класс для параметров Bitrix24 API с автоматическим преобразованием."""
-    
-    def to_bx_params(self) -> Dict[str, Any]:
-        params = self.model_dump(exclude_none=True, by_alias=True)
-        dict_fields = ['data', 'filter']
-        for field_name in dict_fields:
-            if field_name in params and isinstance(params[field_name], dict):
-                field_dict = params.pop(field_name)
-                for key, value in field_dict.items():
-                    params[f'{field_name}[{key}]'] = value
-
-        return params
 
+    # Параметры создаются по именам полей, а отправляются по псевдонимам (START, fileContent)
+    model_config = {"populate_by_name": True}
+
+    def to_bx_params(self) -> Dict[str, str]:
+        """
+        Преобразовать параметры в формат Bitrix API.
+
+        Вложенные словари и списки разворачиваются в ключи вида filter[>id],
+        select[0], order[id] (см. encode_params); план кодирования строится один
+        раз для класса параметров.
+        """
+        return plan_for(type(self)).encode(self)
+
+    def page_query(self, cursor: str = "start") -> PageQuery:
+        """
+        Закодировать параметры один раз для постраничного перебора.
+
+        Args:
+            cursor: Поле курсора навигации
+
+        Returns:
+            PageQuery: Параметры, в которых для каждой страницы подставляется только курсор
+        """
+        return PageQuery.from_params(self, cursor)
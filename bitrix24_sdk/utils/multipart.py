@@ -0,0 +1,186 @@
+import mimetypes
+import os
+import stat
+import uuid
+from typing import AsyncIterator, BinaryIO, Callable, Iterable, Iterator, Optional, Union
+
+FileSource = Union[bytes, bytearray, memoryview, str, "os.PathLike[str]", BinaryIO, Iterable[bytes]]
+"""Источник содержимого файла: байты, путь, файловый объект или итератор байтов."""
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+"""Обратный вызов прогресса: (отправлено байт, всего байт или None)."""
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+def guess_content_type(file_name: str) -> str:
+    """
+    Определить MIME тип по имени файла.
+
+    Args:
+        file_name: Имя файла
+
+    Returns:
+        MIME тип или application/octet-stream, если тип неизвестен
+    """
+    content_type, _ = mimetypes.guess_type(file_name)
+    return content_type or "application/octet-stream"
+
+
+def source_name(source: FileSource) -> Optional[str]:
+    """Имя файла, если источник — путь или файловый объект с атрибутом name."""
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.basename(os.fspath(source))
+    name = getattr(source, "name", None)
+    return os.path.basename(name) if isinstance(name, str) else None
+
+
+def _quote(value: str) -> str:
+    # Кодирование имён в заголовках multipart по HTML5, как в urllib3
+    return value.replace("\r", "%0D").replace("\n", "%0A").replace('"', "%22")
+
+
+class MultipartStream:
+    """
+    Тело запроса multipart/form-data с одним файлом, отправляемое частями.
+
+    Файл читается с диска по частям chunk_size, поэтому потребление памяти не
+    зависит от размера файла. Если размер источника известен, передаётся
+    Content-Length, иначе используется chunked transfer encoding.
+    Поток можно перебирать повторно (например, при повторе запроса), если
+    источник — байты, путь или файловый объект с поддержкой seek.
+
+    Example:
+        >>> stream = MultipartStream("file", "scan.tiff", "/data/scan.tiff")
+        >>> requests.post(url, data=stream, headers={"Content-Type": stream.content_type})
+    """
+
+    def __init__(self, field: str, file_name: str, source: FileSource, content_type: Optional[str] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, on_progress: Optional[ProgressCallback] = None) -> None:
+        """
+        Инициализация тела запроса.
+
+        Args:
+            field: Имя поля формы для файла
+            file_name: Имя файла
+            source: Содержимое файла
+            content_type: MIME тип (по умолчанию определяется по имени файла)
+            chunk_size: Размер читаемой части в байтах
+            on_progress: Обратный вызов прогресса отправки
+        """
+        self.boundary = uuid.uuid4().hex
+        self.file_name = file_name
+        self.file_content_type = content_type or guess_content_type(file_name)
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
+        self._source = source
+        self._start_offset = 0
+        if hasattr(source, "read") and hasattr(source, "seekable") and source.seekable():
+            self._start_offset = source.tell()
+
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(field)}"; filename="{_quote(file_name)}"\r\n'
+            f"Content-Type: {self.file_content_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+        self.file_size = self._source_size()
+
+    @property
+    def content_type(self) -> str:
+        """Значение заголовка Content-Type для запроса."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def length(self) -> Optional[int]:
+        """Полная длина тела в байтах или None, если размер источника неизвестен."""
+        if self.file_size is None:
+            return None
+        return len(self._head) + self.file_size + len(self._tail)
+
+    def __len__(self) -> int:
+        # requests использует len() для Content-Length; 0 означает chunked
+        return self.length or 0
+
+    def __bool__(self) -> bool:
+        # requests подменяет пустое (по len) тело на {}, поэтому тело всегда истинно
+        return True
+
+    def _source_size(self) -> Optional[int]:
+        source = self._source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return memoryview(source).nbytes
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.getsize(source)
+        if hasattr(source, "read"):
+            try:
+                info = os.fstat(source.fileno())
+                if stat.S_ISREG(info.st_mode):
+                    return info.st_size - self._start_offset
+            except (AttributeError, OSError, ValueError):
+                pass
+            if hasattr(source, "seekable") and source.seekable():
+                end = source.seek(0, os.SEEK_END)
+                source.seek(self._start_offset)
+                return end - self._start_offset
+        return None
+
+    def _iter_file(self) -> Iterator[bytes]:
+        source = self._source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source)
+            for offset in range(0, view.nbytes, self.chunk_size):
+                yield view[offset:offset + self.chunk_size]
+        elif isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                yield from iter(lambda: f.read(self.chunk_size), b"")
+        elif hasattr(source, "read"):
+            if hasattr(source, "seekable") and source.seekable():
+                source.seek(self._start_offset)
+            yield from iter(lambda: source.read(self.chunk_size), b"")
+        else:
+            yield from source
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        sent = 0
+        for chunk in self._iter_file():
+            if not chunk:
+                continue
+            yield bytes(chunk)
+            sent += len(chunk)
+            if self.on_progress is not None:
+                self.on_progress(sent, self.file_size)
+        yield self._tail
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """
+        Асинхронный перебор частей тела (для httpx.AsyncClient).
+
+        Байты из памяти отдаются сразу, а чтение файла или итератора источника
+        выполняется в потоке, чтобы загрузка большого файла не блокировала event loop.
+        """
+        if isinstance(self._source, (bytes, bytearray, memoryview)):
+            for chunk in self:
+                yield chunk
+            return
+
+        import asyncio
+        chunks = iter(self)
+        try:
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            # Закрыть файл источника, если перебор прерван
+            await asyncio.to_thread(chunks.close)
+
+    def headers(self) -> dict:
+        """Заголовки запроса: Content-Type и, если размер известен, Content-Length."""
+        headers: dict = {"Content-Type": self.content_type}
+        if self.length is not None:
+            headers["Content-Length"] = str(self.length)
+        return headers
+
@@ -0,0 +1,148 @@
+import contextvars
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Iterator, Optional, Tuple, TypeVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import asyncio
+
+P = TypeVar("P")
+
+PAGE_SIZE = 50
+"""Размер страницы списочных методов Bitrix24."""
+
+
+def offset_step(start: Optional[int]) -> int:
+    """Следующее значение start при постраничной навигации по смещению."""
+    return (start or 0) + PAGE_SIZE
+
+
+def iter_pages(fetch: Callable[[Any], P], next_cursor: Callable[[P, Any], Any], first: Any = None,
+               prefetch: int = 0, speculate: Optional[Callable[[Any], Any]] = None) -> Iterator[P]:
+    """
+    Перебрать страницы списочного метода, загружая следующие страницы заранее.
+
+    Пока вызывающий код обрабатывает страницу N, в фоновых потоках уже
+    загружаются следующие страницы. В памяти держится не более prefetch + 1 страниц.
+
+    Args:
+        fetch: Загрузка страницы по курсору
+        next_cursor: Курсор следующей страницы по загруженной странице (None — страниц больше нет)
+        first: Курсор первой страницы
+        prefetch: Сколько страниц загружать заранее (0 — последовательно)
+        speculate: Предсказание курсора без загрузки страницы (для навигации по смещению);
+            без него заранее загружается не больше одной страницы. Если страница сообщает
+            total, смещения не меньше него не запрашиваются
+
+    Yields:
+        Загруженные страницы по порядку
+    """
+    if prefetch <= 0:
+        cursor = first
+        while True:
+            page = fetch(cursor)
+            yield page
+            cursor = next_cursor(page, cursor)
+            if cursor is None:
+                return
+
+    executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="bitrix-prefetch")
+    pending: Deque[Tuple[Any, "Future[P]"]] = deque([(first, executor.submit(contextvars.copy_context().run, fetch, first))])
+    total: Optional[int] = None
+    try:
+        while pending:
+            cursor, future = pending.popleft()
+            page = future.result()
+            total = _page_total(page, total)
+
+            following = next_cursor(page, cursor)
+            if following is None:
+                for _, stale in pending:
+                    stale.cancel()
+                pending.clear()
+            else:
+                if pending and pending[0][0] != following:
+                    # Предсказанный курсор не совпал с фактическим — заранее загруженное не годится
+                    for _, stale in pending:
+                        stale.cancel()
+                    pending.clear()
+                if not pending:
+                    pending.append((following, executor.submit(contextvars.copy_context().run, fetch, following)))
+                while speculate is not None and len(pending) < prefetch:
+                    guess = speculate(pending[-1][0])
+                    if _past_end(guess, total):
+                        break
+                    pending.append((guess, executor.submit(contextvars.copy_context().run, fetch, guess)))
+
+            yield page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(fetch: Callable[[Any], Awaitable[P]], next_cursor: Callable[[P, Any], Any],
+                      first: Any = None, prefetch: int = 0,
+                      speculate: Optional[Callable[[Any], Any]] = None) -> AsyncIterator[P]:
+    """
+    Асинхронный вариант iter_pages: следующие страницы загружаются задачами asyncio.
+
+    Args:
+        fetch: Корутина загрузки страницы по курсору
+        next_cursor: Курсор следующей страницы по загруженной странице (None — страниц больше нет)
+        first: Курсор первой страницы
+        prefetch: Сколько страниц загружать заранее (0 — последовательно)
+        speculate: Предсказание курсора без загрузки страницы
+
+    Yields:
+        Загруженные страницы по порядку
+    """
+    if prefetch <= 0:
+        cursor = first
+        while True:
+            page = await fetch(cursor)
+            yield page
+            cursor = next_cursor(page, cursor)
+            if cursor is None:
+                return
+
+    import asyncio
+    pending: Deque[Tuple[Any, "asyncio.Task[P]"]] = deque([(first, asyncio.ensure_future(fetch(first)))])
+    total: Optional[int] = None
+    try:
+        while pending:
+            cursor, task = pending.popleft()
+            page = await task
+            total = _page_total(page, total)
+
+            following = next_cursor(page, cursor)
+            if following is None:
+                for _, stale in pending:
+                    stale.cancel()
+                pending.clear()
+            else:
+                if pending and pending[0][0] != following:
+                    for _, stale in pending:
+                        stale.cancel()
+                    pending.clear()
+                if not pending:
+                    pending.append((following, asyncio.ensure_future(fetch(following))))
+                while speculate is not None and len(pending) < prefetch:
+                    guess = speculate(pending[-1][0])
+                    if _past_end(guess, total):
+                        break
+                    pending.append((guess, asyncio.ensure_future(fetch(guess))))
+
+            yield page
+    finally:
+        for _, task in pending:
+            task.cancel()
+
+
+def _page_total(page: Any, known: Optional[int]) -> Optional[int]:
+    """Общее количество записей из ответа (поле total), если метод его возвращает."""
+    total = getattr(page, "total", None)
+    return total if isinstance(total, int) else known
+
+
+def _past_end(guess: Any, total: Optional[int]) -> bool:
+    """Предсказанное смещение за последней записью: такую страницу запрашивать незачем."""
+    return total is not None and isinstance(guess, int) and guess >= total
@@ -0,0 +1,35 @@
+from typing import Any, List, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+from .encoder import encode_params
+
+
+def flatten_params(params: Mapping[str, Any], prefix: Optional[str] = None) -> List[Tuple[str, str]]:
+    """
+    Развернуть вложенные параметры в плоский список пар в стиле PHP.
+
+    Args:
+        params: Параметры запроса (словари и списки любой вложенности)
+        prefix: Префикс ключа для вложенных значений
+
+    Returns:
+        Список пар вида ("filter[>id]", "10"), ("select[0]", "id")
+
+    Example:
+        >>> flatten_params({"filter": {"@id": [1, 2]}})
+        [('filter[@id][0]', '1'), ('filter[@id][1]', '2')]
+    """
+    return list(encode_params(params, prefix).items())
+
+
+def build_query(params: Optional[Mapping[str, Any]]) -> str:
+    """
+    Собрать строку запроса в формате PHP http_build_query.
+
+    Args:
+        params: Параметры запроса
+
+    Returns:
+        Закодированная строка запроса
+    """
+    return urlencode(flatten_params(params or {}))
@@ -0,0 +1,269 @@
+import typing
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Literal, NamedTuple, Optional, Tuple, Type
+
+from pydantic import BaseModel, TypeAdapter
+
+ResponseMode = Literal["model", "raw", "lazy"]
+"""
+Режим разбора строк списочных ответов:
+
+- model — строки валидируются в Pydantic модели (по умолчанию);
+- raw — строки остаются словарями из JSON без валидации;
+- lazy — строки оборачиваются в LazyRecord, поле валидируется при первом обращении.
+"""
+
+RESPONSE_MODES = ("model", "raw", "lazy")
+
+
+class _Field(NamedTuple):
+    name: str
+    key: str
+    adapter: TypeAdapter
+
+
+class _Envelope(NamedTuple):
+    rows: Dict[str, Tuple[str, Tuple[Type[BaseModel], ...]]]
+    containers: Dict[str, Tuple[str, Type[BaseModel]]]
+    values: Dict[str, _Field]
+
+
+class LazyRecord:
+    """
+    Строка ответа, поля которой валидируются при первом обращении.
+
+    Обращение к атрибуту валидирует только это поле по аннотации модели и
+    запоминает результат; остальные поля остаются необработанными. Для моделей
+    с extra="allow" (например, Item) неописанные поля возвращаются как есть.
+
+    Example:
+        >>> page = client.crm.item_list(1, select=["id", "title", "stageId"], mode="lazy")
+        >>> for item in page.result.items:
+        ...     print(item.id, item.stageId)
+    """
+
+    __slots__ = ("_model", "_raw", "_values")
+
+    def __init__(self, model: Type[BaseModel], raw: Dict[str, Any]) -> None:
+        self._model = model
+        self._raw = raw
+        self._values: Dict[str, Any] = {}
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """Исходный словарь строки."""
+        return self._raw
+
+    @property
+    def model(self) -> Type[BaseModel]:
+        """Модель, по которой валидируются поля."""
+        return self._model
+
+    def to_model(self) -> BaseModel:
+        """Провалидировать строку целиком."""
+        return self._model.model_validate(self._raw)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        values = self._values
+        if name in values:
+            return values[name]
+        field = _fields(self._model).get(name)
+        if field is None:
+            if self._model.model_config.get("extra") == "allow" and name in self._raw:
+                return self._raw[name]
+            raise AttributeError(f"{self._model.__name__} has no attribute {name!r}")
+        model_field = self._model.model_fields[field.name]
+        if field.key in self._raw:
+            value = field.adapter.validate_python(self._raw[field.key])
+        elif not model_field.is_required():
+            value = model_field.get_default(call_default_factory=True)
+        else:
+            raise AttributeError(f"В строке {self._model.__name__} нет поля {field.key}")
+        values[field.name] = value
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        return self._raw[key]
+
+    def __repr__(self) -> str:
+        return f"LazyRecord({self._model.__name__}, {self._raw!r})"
+
+
+def build_response(model: Type[BaseModel], data: Any, mode: ResponseMode = "model",
+                   fields: Optional[Iterable[str]] = None) -> BaseModel:
+    """
+    Разобрать ответ метода в модель с учётом режима разбора строк.
+
+    В режиме model без fields это обычный model_validate. В остальных
+    случаях служебные поля ответа (total, next, time) валидируются как
+    обычно, а строки списков (например, ItemList.result.items или
+    GetChildren.result) разбираются по режиму, поэтому форма ответа не меняется.
+
+    Args:
+        model: Модель ответа
+        data: Ответ метода
+        mode: Режим разбора строк
+        fields: Поля строк, которые нужно оставить (имена атрибутов или ключи JSON);
+            в режиме model строится модель только с этими атрибутами
+
+    Returns:
+        Модель ответа
+    """
+    if mode not in RESPONSE_MODES:
+        raise ValueError(f"Неизвестный режим ответа: {mode}")
+    if mode == "model" and fields is None:
+        return model.model_validate(data)
+    return _construct(model, data, mode, tuple(fields) if fields is not None else None)
+
+
+def _construct(model: Type[BaseModel], data: Any, mode: ResponseMode, fields: Optional[Tuple[str, ...]]) -> BaseModel:
+    plan = _envelope(model)
+    if not plan.rows and not plan.containers:
+        return model.model_validate(data)
+
+    values: Dict[str, Any] = {}
+    for name, (key, members) in plan.rows.items():
+        if key in data:
+            rows = data[key]
+            values[name] = None if rows is None else [_row(members, row, mode, fields) for row in rows]
+    for name, (key, container) in plan.containers.items():
+        if key in data:
+            value = data[key]
+            values[name] = None if value is None else _construct(container, value, mode, fields)
+    for name, field in plan.values.items():
+        if field.key in data:
+            values[name] = field.adapter.validate_python(data[field.key])
+    return model.model_construct(_fields_set=set(values), **values)
+
+
+def _row(members: Tuple[Type[BaseModel], ...], row: Any, mode: ResponseMode,
+         fields: Optional[Tuple[str, ...]]) -> Any:
+    if not isinstance(row, dict):
+        return row
+    model = _pick(members, row)
+    if fields is not None:
+        row = _project(model, row, fields)
+    if mode == "raw":
+        return row
+    if mode == "lazy":
+        return LazyRecord(model, row)
+    return _partial(model, row)
+
+
+def _pick(members: Tuple[Type[BaseModel], ...], row: Dict[str, Any]) -> Type[BaseModel]:
+    """Выбрать модель строки из объединения: ту, чьи обязательные поля все есть, и с наибольшим их числом."""
+    if len(members) == 1:
+        return members[0]
+    best, best_count = members[0], -1
+    for member in members:
+        required = _required_keys(member)
+        if all(key in row for key in required) and len(required) > best_count:
+            best, best_count = member, len(required)
+    return best
+
+
+def _project(model: Type[BaseModel], row: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    lookup = _fields(model)
+    keys = [lookup[name].key if name in lookup else name for name in fields]
+    return {key: row[key] for key in keys if key in row}
+
+
+def _partial(model: Type[BaseModel], row: Dict[str, Any]) -> BaseModel:
+    """Построить модель только из присутствующих в строке полей, не заполняя остальные значениями по умолчанию."""
+    lookup = _fields(model)
+    values: Dict[str, Any] = {}
+    extra: Optional[Dict[str, Any]] = {} if model.model_config.get("extra") == "allow" else None
+    for key, value in row.items():
+        field = lookup.get(key)
+        if field is not None:
+            values[field.name] = field.adapter.validate_python(value)
+        elif extra is not None:
+            extra[key] = value
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", extra)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+@lru_cache(maxsize=None)
+def _fields(model: Type[BaseModel]) -> Dict[str, _Field]:
+    """Поля модели по имени атрибута и по ключу JSON."""
+    lookup: Dict[str, _Field] = {}
+    for name, info in model.model_fields.items():
+        field = _Field(name, info.alias or name, TypeAdapter(info.annotation))
+        lookup[name] = field
+        lookup[field.key] = field
+    return lookup
+
+
+@lru_cache(maxsize=None)
+def _required_keys(model: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(info.alias or name for name, info in model.model_fields.items() if info.is_required())
+
+
+@lru_cache(maxsize=None)
+def _envelope(model: Type[BaseModel]) -> _Envelope:
+    """Разметить поля ответа: списки строк, вложенные контейнеры со списками и обычные значения."""
+    rows: Dict[str, Tuple[str, Tuple[Type[BaseModel], ...]]] = {}
+    containers: Dict[str, Tuple[str, Type[BaseModel]]] = {}
+    values: Dict[str, _Field] = {}
+    for name, info in model.model_fields.items():
+        key = info.alias or name
+        annotation = _unwrap_optional(info.annotation)
+        members = _row_models(annotation)
+        if members:
+            rows[name] = (key, members)
+        elif _is_model(annotation) and _has_rows(annotation):
+            containers[name] = (key, annotation)
+        else:
+            values[name] = _Field(name, key, TypeAdapter(info.annotation))
+    return _Envelope(rows, containers, values)
+
+
+def _has_rows(model: Type[BaseModel]) -> bool:
+    plan = _envelope(model)
+    return bool(plan.rows or plan.containers)
+
+
+def _row_models(annotation: Any) -> Tuple[Type[BaseModel], ...]:
+    """Модели строк для аннотации List[Model] или List[Union[...]]; пустой кортеж для остальных."""
+    if typing.get_origin(annotation) not in (list, List):
+        return ()
+    args = typing.get_args(annotation)
+    if not args:
+        return ()
+    item = args[0]
+    members = typing.get_args(item) if typing.get_origin(item) is typing.Union else (item,)
+    if members and all(_is_model(member) for member in members):
+        return tuple(members)
+    return ()
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def row_get(row: Any, name: str) -> Any:
+    """
+    Значение поля строки списка в любом режиме ответа.
+
+    Args:
+        row: Строка: модель, LazyRecord или словарь (режим raw, name — ключ JSON)
+        name: Имя поля
+
+    Returns:
+        Значение поля
+    """
+    return row[name] if isinstance(row, dict) else getattr(row, name)
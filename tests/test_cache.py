@@ -0,0 +1,26 @@
+import pytest
+
+from bitrix24_sdk.emulator import BitrixEmulator, DatasetConfig, EmulatorConfig
+
+
+@pytest.fixture(params=[None, "cache.sqlite"])
+def client(request, tmp_path):
+    cache_file = str(tmp_path / request.param) if request.param else None
+    with BitrixEmulator(EmulatorConfig(dataset=DatasetConfig(crm_items=1, crm_types=2))) as emulator:
+        yield emulator.client(CACHE_ENABLED=True, CACHE_TTLS={"crm.type.list": 60}, CACHE_FILE=cache_file)
+
+
+def test_cached_raw_rows_are_not_shared(client):
+    """Изменение строк ответа в режиме raw не портит следующие ответы из кэша."""
+    first = client.crm.type_list(mode="raw")
+    original = [dict(row) for row in first.result.types]
+    for row in first.result.types:
+        row["title"] = "changed"
+    first.result.types.clear()
+
+    for _ in range(2):
+        cached = client.crm.type_list(mode="raw")
+        assert cached.result.types == original
+        cached.result.types[0]["title"] = "changed again"
+
+    assert client.http.cache.stats().hits == 2
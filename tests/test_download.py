@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from bitrix24_sdk.disk import FileInfo
+from bitrix24_sdk.disk.download import FileDownloader
+from bitrix24_sdk.emulator import BitrixEmulator, DatasetConfig, EmulatorConfig, file_bytes
+
+FILE_SIZE = 10000
+
+
+@pytest.fixture(scope="module")
+def client():
+    config = EmulatorConfig(dataset=DatasetConfig(crm_items=1, crm_types=1, folder_depth=0,
+                                                  files_per_folder=1, file_size=FILE_SIZE))
+    with BitrixEmulator(config) as emulator:
+        yield emulator.client()
+
+
+@pytest.fixture
+def file(client) -> FileInfo:
+    root = int(client.disk.get_list().result[0].root_object_id)
+    return next(item for _, item in client.disk.walk(root) if isinstance(item, FileInfo))
+
+
+def interrupt_after(monkeypatch, calls: int) -> None:
+    """Прервать параллельное скачивание после calls успешных диапазонов."""
+    fetch = FileDownloader._fetch
+    count = [0]
+
+    def failing(self, *args, **kwargs):
+        count[0] += 1
+        if count[0] > calls:
+            raise RuntimeError("обрыв")
+        return fetch(self, *args, **kwargs)
+
+    monkeypatch.setattr(FileDownloader, "_fetch", failing)
+
+
+@pytest.mark.parametrize("completed", [0, 3])
+@pytest.mark.parametrize("resume", [True, False])
+def test_stream_after_interrupted_ranges(client, file, tmp_path, monkeypatch, completed, resume):
+    dest = str(tmp_path / "file.bin")
+    with monkeypatch.context() as patch:
+        interrupt_after(patch, completed)
+        with pytest.raises(RuntimeError):
+            FileDownloader(client.disk, workers=2, part_size=1000).download(file, dest)
+    assert os.path.getsize(dest + ".part") == FILE_SIZE
+    assert os.path.exists(dest + ".part.json")
+
+    path = client.disk.download(file, dest, resume=resume)
+
+    with open(path, "rb") as f:
+        assert f.read() == file_bytes(file.id, FILE_SIZE)
+    assert not os.path.exists(dest + ".part")
+    assert not os.path.exists(dest + ".part.json")
+
+
+def test_zero_byte_file(tmp_path):
+    config = EmulatorConfig(dataset=DatasetConfig(crm_items=1, crm_types=1, folder_depth=0,
+                                                  files_per_folder=1, file_size=0))
+    with BitrixEmulator(config) as emulator:
+        client = emulator.client()
+        root = int(client.disk.get_list().result[0].root_object_id)
+        file = next(item for _, item in client.disk.walk(root) if isinstance(item, FileInfo))
+        path = client.disk.download(file, str(tmp_path / "empty.bin"))
+    assert os.path.getsize(path) == 0
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from bitrix24_sdk.emulator import BitrixEmulator, DatasetConfig, EmulatorConfig
+
+ITEMS = 237
+
+
+@pytest.fixture
+def emulator():
+    config = EmulatorConfig(latency=0.01, dataset=DatasetConfig(crm_items=ITEMS, crm_types=1))
+    with BitrixEmulator(config) as emulator:
+        yield emulator
+
+
+def entity_type_id(emulator) -> int:
+    return emulator.client().crm.type_list().result.types[0].entity_type_id
+
+
+@pytest.mark.parametrize("prefetch", [1, 3, 8])
+def test_prefetch_stops_at_total(emulator, prefetch):
+    """Заранее запрашиваются только страницы до total, а не за последней страницей."""
+    type_id = entity_type_id(emulator)
+    client = emulator.client()
+
+    items = list(client.crm.iter_items(type_id, prefetch=prefetch))
+
+    assert len(items) == ITEMS
+    assert emulator.stats()["calls"]["crm.item.list"] == -(-ITEMS // 50)
+
+
+def test_async_prefetch_stops_at_total(emulator):
+    pytest.importorskip("httpx")
+    type_id = entity_type_id(emulator)
+
+    async def collect():
+        async with emulator.async_client() as client:
+            return [item async for item in client.crm.iter_items(type_id, prefetch=3)]
+
+    assert len(asyncio.run(collect())) == ITEMS
+    assert emulator.stats()["calls"]["crm.item.list"] == -(-ITEMS // 50)
@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import pytest
+
+from bitrix24_sdk.disk import FolderInfo
+from bitrix24_sdk.disk.snapshot import DiskSnapshot
+from bitrix24_sdk.emulator import BitrixEmulator, DatasetConfig, EmulatorConfig
+from bitrix24_sdk.emulator import dataset
+
+
+@pytest.fixture
+def client():
+    config = EmulatorConfig(dataset=DatasetConfig(crm_items=1, crm_types=1, folder_depth=3,
+                                                  folders_per_folder=2, files_per_folder=2, file_size=16))
+    with BitrixEmulator(config) as emulator:
+        yield emulator.client()
+
+
+@pytest.fixture
+def root_id(client) -> int:
+    return int(client.disk.get_list().result[0].root_object_id)
+
+
+def folder_at(client, root_id: int, depth: int) -> FolderInfo:
+    return next(item for path, item in client.disk.walk(root_id)
+                if isinstance(item, FolderInfo) and path.count("/") == depth - 1)
+
+
+def test_change_below_unchanged_folders(client, root_id, tmp_path):
+    """UPDATE_TIME меняется только у родителя: изменение на второй уровень не видно по корню."""
+    with DiskSnapshot(client.disk, str(tmp_path / "snap.sqlite"), root_id) as snapshot:
+        snapshot.sync()
+        parent = folder_at(client, root_id, 2)
+        created = client.disk.add_subfolder(parent.id, {"NAME": "deep"}).result
+
+        events = snapshot.sync()
+
+        assert [(event.kind, event.id) for event in events if event.kind == "added"] == [("added", created.id)]
+        assert snapshot.get(created.id)["path"].endswith("/deep")
+        assert snapshot.sync() == []
+
+
+@pytest.mark.parametrize("detect_deletes", [True, False])
+def test_change_in_same_second(client, root_id, tmp_path, monkeypatch, detect_deletes):
+    """Изменение в ту же секунду, что и прошлая синхронизация, не теряется."""
+    frozen = datetime.now(dataset._EPOCH.tzinfo).replace(microsecond=0)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return frozen
+
+    monkeypatch.setattr(dataset, "datetime", FrozenDatetime)
+    folder = folder_at(client, root_id, 1)
+    with DiskSnapshot(client.disk, str(tmp_path / "snap.sqlite"), root_id) as snapshot:
+        snapshot.sync()
+        first = client.disk.add_subfolder(folder.id, {"NAME": "first"}).result
+        assert {event.id for event in snapshot.sync(detect_deletes=detect_deletes) if event.kind == "added"} \
+            == {first.id}
+
+        second = client.disk.add_subfolder(folder.id, {"NAME": "second"}).result
+        events = snapshot.sync(detect_deletes=detect_deletes)
+
+        assert [(event.kind, event.id) for event in events] == [("added", second.id)]
+
+
+def test_deleted_deep_folder(client, root_id, tmp_path):
+    with DiskSnapshot(client.disk, str(tmp_path / "snap.sqlite"), root_id) as snapshot:
+        snapshot.sync()
+        folder = folder_at(client, root_id, 3)
+        client.disk.delete_tree(folder.id)
+
+        events = snapshot.sync()
+
+        assert folder.id in {event.id for event in events if event.kind == "deleted"}
+        assert snapshot.get(folder.id) is None